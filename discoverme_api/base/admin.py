@@ -1,8 +1,16 @@
 from django.contrib import admin
 from .models import Goal, Insight, JournalEntry, Mood, MoodLog, Suggestion
 
+
+@admin.register(MoodLog)
+class MoodLogAdmin(admin.ModelAdmin):
+    """
+    Loads the user and mood shown by ``MoodLog.__str__`` with the change list query.
+    """
+    list_select_related = ('user', 'mood')
+
+
 admin.site.register(JournalEntry)
-admin.site.register(MoodLog)
 admin.site.register(Mood)
 admin.site.register(Insight)
 admin.site.register(Goal)
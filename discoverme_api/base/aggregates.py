@@ -0,0 +1,165 @@
+import calendar
+from datetime import timedelta
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from .catalog import get_mood_catalog
+from .models import MoodLog, MoodDailyCount
+
+TIME_FRAME_DAYS = {
+    'days': 1,
+    'weeks': 7,
+}
+
+# Months and years are calendar units, so "last month" on 31 March starts on 1 March
+TIME_FRAME_MONTHS = {
+    'months': 1,
+    'years': 12,
+}
+
+
+def mood_log_day(date_logged):
+    """
+    Returns the local day a mood log counts towards.
+    """
+    return timezone.localdate(date_logged)
+
+
+def adjust_mood_count(user_id, mood_id, day, delta):
+    """
+    Atomically adds ``delta`` to the counter for a user, mood and day,
+    creating the counter row the first time it is needed.
+    """
+    counters = MoodDailyCount.objects.filter(user_id=user_id, mood_id=mood_id, day=day)
+    if counters.update(count=F('count') + delta) or delta <= 0:
+        return
+    try:
+        with transaction.atomic():
+            MoodDailyCount.objects.create(user_id=user_id, mood_id=mood_id, day=day, count=delta)
+    except IntegrityError:
+        # Another request created the row first, so increment it instead.
+        counters.update(count=F('count') + delta)
+
+
+def count_keys(mood_logs):
+    """
+    Returns the (user_id, mood_id, day) counter each mood log counts towards.
+    """
+    return [(log.user_id, log.mood_id, mood_log_day(log.date_logged)) for log in mood_logs]
+
+
+def apply_count_changes(before=(), after=()):
+    """
+    Moves the counters from the ``before`` keys to the ``after`` keys with one
+    update per (user, mood, day) whose total actually changed.
+    """
+    totals = {}
+    for key in before:
+        totals[key] = totals.get(key, 0) - 1
+    for key in after:
+        totals[key] = totals.get(key, 0) + 1
+    for (user_id, mood_id, day), total in totals.items():
+        if total:
+            adjust_mood_count(user_id, mood_id, day, total)
+
+
+def record_mood_logs(mood_logs):
+    """
+    Counts a batch of new mood logs, e.g. after a ``bulk_create`` that
+    bypassed the model signals.
+    """
+    apply_count_changes(after=count_keys(mood_logs))
+
+
+def rebuild_mood_counts(user=None):
+    """
+    Recomputes the counters from the MoodLog table, for one user or everyone.
+    """
+    logs = MoodLog.objects.all()
+    counters = MoodDailyCount.objects.all()
+    if user is not None:
+        logs = logs.filter(user=user)
+        counters = counters.filter(user=user)
+
+    rows = (
+        logs.annotate(day=TruncDate('date_logged'))
+        .values('user_id', 'mood_id', 'day')
+        .annotate(total=Count('id'))
+        .order_by()
+    )
+    with transaction.atomic():
+        counters.delete()
+        MoodDailyCount.objects.bulk_create(
+            [
+                MoodDailyCount(user_id=row['user_id'], mood_id=row['mood_id'], day=row['day'], count=row['total'])
+                for row in rows.iterator()
+            ],
+            batch_size=1000,
+        )
+
+
+def subtract_months(day, months):
+    """
+    Returns the same day ``months`` calendar months earlier, clamped to the
+    end of shorter months (e.g. 31 March minus one month is 28/29 February).
+    """
+    year, month = divmod(day.year * 12 + day.month - 1 - months, 12)
+    month += 1
+    return day.replace(year=year, month=month, day=min(day.day, calendar.monthrange(year, month)[1]))
+
+
+def window_start(time_quantity, time_frame):
+    """
+    Returns the first day included in a "last N days/weeks/months/years" window.
+    The window ends today, inclusive.
+    """
+    today = timezone.localdate()
+    if time_frame in TIME_FRAME_MONTHS:
+        return subtract_months(today, TIME_FRAME_MONTHS[time_frame] * time_quantity) + timedelta(days=1)
+    days = TIME_FRAME_DAYS[time_frame] * time_quantity
+    return today - timedelta(days=days - 1)
+
+
+def mood_counts(user, time_quantity, time_frame, moods=None):
+    """
+    Returns ``{mood_id: count}`` for the moods a user logged over the last
+    ``time_quantity`` ``time_frame``, read from the daily counters.
+    """
+    counters = MoodDailyCount.objects.filter(
+        user=user,
+        day__gte=window_start(time_quantity, time_frame),
+    )
+    if moods is not None:
+        counters = counters.filter(mood__in=moods)
+    rows = counters.values('mood_id').annotate(total=Sum('count')).order_by()
+    return {row['mood_id']: row['total'] for row in rows}
+
+
+def trigger_word_moods(trigger_word):
+    """
+    Returns the ids of the moods whose ``mood_type`` matches ``trigger_word``
+    case-insensitively.
+    """
+    trigger_word = trigger_word.lower()
+    return [mood.pk for mood in get_mood_catalog() if mood.mood_type.lower() == trigger_word]
+
+
+def trigger_word_count(user, trigger_word, time_quantity, time_frame, window_counts=None):
+    """
+    Returns how many times a user logged the mood named by ``trigger_word``
+    over the given window, or ``None`` if it names no mood.
+
+    :param window_counts: Optional dict memoizing ``mood_counts`` per window,
+        so a list of insights reads the counters once per distinct window.
+    :type window_counts: dict
+    """
+    moods = trigger_word_moods(trigger_word)
+    if not moods:
+        return None
+    if window_counts is None:
+        window_counts = {}
+    window = (time_quantity, time_frame)
+    if window not in window_counts:
+        window_counts[window] = mood_counts(user, time_quantity, time_frame)
+    return sum(window_counts[window].get(pk, 0) for pk in moods)
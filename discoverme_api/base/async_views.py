@@ -0,0 +1,94 @@
+from django.http import HttpResponse, JsonResponse
+from django.views.decorators.http import require_GET
+from rest_framework.renderers import JSONRenderer
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from .authentication import CachedJWTAuthentication
+from .models import MoodLog, JournalEntry, Goal
+from .serializers import MoodLogSerializer, ExpandedMoodLogSerializer, JournalEntrySerializer, GoalSerializer, get_expand
+
+# Async read-only counterparts of the hot list endpoints, for ASGI servers.
+#
+# The DRF viewsets are synchronous, so under ASGI each request is handed to a
+# worker thread for its whole duration. These views authenticate with JWT and
+# query with the async ORM, so the event loop only waits on I/O. They return
+# the same JSON as an unpaginated GET on the matching viewset; pagination,
+# response caching and writes stay on the viewsets.
+
+
+async def authenticate(request):
+    """
+    Returns the JWT-authenticated user, or ``None``.
+
+    :raises AuthenticationFailed: If the token is invalid or the user inactive.
+    """
+    result = await CachedJWTAuthentication().aauthenticate(request)
+    return result[0] if result else None
+
+
+async def list_response(request, get_queryset, serializer_class):
+    """
+    Authenticates the request and renders the user's rows.
+
+    :param get_queryset: Callable returning the user's queryset.
+    :param serializer_class: Serializer rendering each row.
+    """
+    try:
+        user = await authenticate(request)
+    except AuthenticationFailed as e:
+        return JsonResponse({'detail': e.detail}, status=e.status_code)
+    if user is None:
+        return JsonResponse({'detail': 'Authentication credentials were not provided.'}, status=401)
+
+    rows = [row async for row in get_queryset(user)]
+    data = serializer_class(rows, many=True).data
+    return HttpResponse(JSONRenderer().render(data), content_type='application/json')
+
+
+@require_GET
+async def moodlogs(request):
+    """
+    API endpoint listing the authenticated user's mood logs, newest first.
+
+    Method: GET
+    Query Parameters:
+    - expand (str): ``mood`` embeds each log's mood instead of its ID.
+    """
+    if 'mood' in get_expand(request.GET):
+        return await list_response(
+            request,
+            lambda user: MoodLog.objects.filter(user=user).select_related('mood').order_by('-date_logged'),
+            ExpandedMoodLogSerializer,
+        )
+    return await list_response(
+        request,
+        lambda user: MoodLog.objects.filter(user=user).order_by('-date_logged'),
+        MoodLogSerializer,
+    )
+
+
+@require_GET
+async def journal_entries(request):
+    """
+    API endpoint listing the authenticated user's journal entries.
+
+    Method: GET
+    """
+    return await list_response(
+        request,
+        lambda user: JournalEntry.objects.filter(user=user),
+        JournalEntrySerializer,
+    )
+
+
+@require_GET
+async def goals(request):
+    """
+    API endpoint listing the authenticated user's goals with their tasks.
+
+    Method: GET
+    """
+    return await list_response(
+        request,
+        lambda user: Goal.objects.filter(user=user).prefetch_related('tasks'),
+        GoalSerializer,
+    )
@@ -0,0 +1,105 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.utils.translation import gettext_lazy as _
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+from .cache import AUTH_CACHE_SCOPE, get_cache, get_version
+
+
+def user_cache_key(user_id, version):
+    return f'api:auth-user:{user_id}:{version}'
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that loads the user together with their profile and
+    caches both for ``API_AUTH_CACHE_TIMEOUT`` seconds.
+
+    Entries are keyed on the user id and the user's ``auth`` cache version,
+    which the receivers in base/signals.py bump after every ``User`` or
+    ``UserProfile`` save and delete commits. A repeat request from the same
+    user therefore authenticates without any database query, and
+    ``user.profile`` is available without a second one.
+
+    The cache is only used while ``API_CACHE_ENABLED`` is on, which in
+    production requires a shared backend, so a deactivation or password
+    change is seen by every worker on its next request. Writes that bypass
+    signals (e.g. ``User.objects.update``) can keep a revoked user
+    authenticated for up to ``API_AUTH_CACHE_TIMEOUT`` seconds. Unsafe
+    requests always load a fresh user, so a view that saves ``request.user``
+    never writes back a stale cached copy.
+    """
+
+    def authenticate(self, request):
+        validated_token = self.get_request_token(request)
+        if validated_token is None:
+            return None
+        return self.get_user(validated_token, cached=request.method in SAFE_METHODS), validated_token
+
+    async def aauthenticate(self, request):
+        """
+        Authenticates a plain Django request from an async view.
+
+        Validating the token is pure computation. The user lookup is usually
+        a cache hit and runs in a single thread hop.
+
+        :return: A ``(user, validated_token)`` tuple, or ``None`` without credentials.
+        """
+        validated_token = self.get_request_token(request)
+        if validated_token is None:
+            return None
+        user = await sync_to_async(self.get_user)(validated_token, cached=request.method in SAFE_METHODS)
+        return user, validated_token
+
+    def get_request_token(self, request):
+        """
+        Returns the validated token from the request's header, or ``None`` without credentials.
+        """
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        return self.get_validated_token(raw_token)
+
+    def get_user(self, validated_token, cached=True):
+        """
+        Returns the token's user, from the cache when ``cached`` and caching is enabled.
+        """
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        cached = cached and settings.API_CACHE_ENABLED and settings.API_AUTH_CACHE_TIMEOUT > 0
+        if cached:
+            cache = get_cache()
+            key = user_cache_key(user_id, get_version(user_id, AUTH_CACHE_SCOPE))
+            user = cache.get(key)
+        else:
+            user = None
+        if user is None:
+            try:
+                user = get_user_model().objects.select_related('profile').get(
+                    **{api_settings.USER_ID_FIELD: user_id}
+                )
+            except get_user_model().DoesNotExist:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found")
+            if cached:
+                cache.set(key, user, settings.API_AUTH_CACHE_TIMEOUT)
+
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."), code="password_changed"
+                )
+
+        return user
@@ -0,0 +1,75 @@
+import math
+import time
+import tracemalloc
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def percentile(values, pct):
+    """
+    Returns the nearest-rank percentile of a list of numbers.
+    """
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def measure(send, iterations=50, warmup=5, expected_status=None):
+    """
+    Calls ``send`` repeatedly and reports its latency, query count and
+    memory allocations.
+
+    Latency and queries are measured together; allocations are measured in a
+    separate, shorter pass because tracemalloc slows every allocation down.
+
+    :param send: A callable ``send(i)`` issuing one request and returning the response.
+    :param iterations: Number of measured requests.
+    :param warmup: Number of unmeasured requests sent first.
+    :param expected_status: If given, every response must have this status code.
+    :return: A dict of summary statistics, times in milliseconds.
+    :rtype: dict
+    """
+    def call(i):
+        response = send(i)
+        if expected_status is not None and response.status_code != expected_status:
+            raise AssertionError(f'Expected status {expected_status}, got {response.status_code}: {response.content[:200]!r}')
+        return response
+
+    for i in range(warmup):
+        call(i)
+
+    timings = []
+    queries = []
+    for i in range(warmup, warmup + iterations):
+        with CaptureQueriesContext(connection) as ctx:
+            start = time.perf_counter()
+            call(i)
+            timings.append((time.perf_counter() - start) * 1000)
+        queries.append(len(ctx.captured_queries))
+
+    alloc_iterations = max(1, iterations // 10)
+    allocated = []
+    peaks = []
+    tracemalloc.start()
+    try:
+        for i in range(warmup + iterations, warmup + iterations + alloc_iterations):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            call(i)
+            after, peak = tracemalloc.get_traced_memory()
+            allocated.append(max(0, after - before))
+            peaks.append(peak - before)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'requests': iterations,
+        'p50_ms': round(percentile(timings, 50), 3),
+        'p99_ms': round(percentile(timings, 99), 3),
+        'mean_ms': round(sum(timings) / len(timings), 3),
+        'max_ms': round(max(timings), 3),
+        'queries_per_request': percentile(queries, 50),
+        'max_queries': max(queries),
+        'retained_kib_per_request': round(sum(allocated) / len(allocated) / 1024, 2),
+        'peak_kib_per_request': round(percentile(peaks, 50) / 1024, 2),
+    }
@@ -0,0 +1,71 @@
+from django.conf import settings
+from django.db import transaction
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from .cache import MODEL_CACHE_SCOPES, bump_versions
+from .serializers import is_object_id
+
+
+class BulkWriteMixin:
+    """
+    Adds a ``bulk/`` endpoint to a per-user viewset.
+
+    ``POST`` creates a list of objects and ``PATCH`` partially updates a list
+    of objects identified by ``id``. Items are validated with the viewset's
+    serializer in ``many=True`` mode and written with ``bulk_create`` or
+    ``bulk_update`` in a single transaction. If any item is invalid nothing
+    is written and ``errors`` lists the problems of each item, in order.
+    """
+    bulk_create_serializer_class = None
+
+    def get_bulk_save_kwargs(self):
+        """
+        Extra attributes set on every object, e.g. the owner.
+        """
+        return {'user': self.request.user}
+
+    def perform_bulk_create(self, serializer):
+        return serializer.save(**self.get_bulk_save_kwargs())
+
+    def perform_bulk_update(self, serializer):
+        return serializer.save(**self.get_bulk_save_kwargs())
+
+    @action(detail=False, methods=['post', 'patch'], url_path='bulk')
+    def bulk(self, request):
+        """
+        Create or update many objects in one request.
+
+        Methods: POST (create), PATCH (partial update, each item needs an ``id``)
+        Body: a JSON list of objects, at most ``API_BULK_MAX_ITEMS`` long.
+        """
+        items = request.data
+        if not isinstance(items, list) or not items:
+            return Response({'error': 'Expected a non-empty list of items.'}, status=status.HTTP_400_BAD_REQUEST)
+        if len(items) > settings.API_BULK_MAX_ITEMS:
+            return Response(
+                {'error': f'At most {settings.API_BULK_MAX_ITEMS} items can be sent at once.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        creating = request.method == 'POST'
+        if creating:
+            serializer_class = self.bulk_create_serializer_class or self.get_serializer_class()
+            serializer = serializer_class(data=items, many=True, context=self.get_serializer_context())
+        else:
+            ids = [item.get('id') for item in items if isinstance(item, dict)]
+            instances = self.get_queryset().in_bulk([pk for pk in ids if is_object_id(pk)])
+            serializer = self.get_serializer(instances, data=items, many=True, partial=True)
+
+        if not serializer.is_valid():
+            return Response({'errors': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        with transaction.atomic():
+            if creating:
+                self.perform_bulk_create(serializer)
+            else:
+                self.perform_bulk_update(serializer)
+
+        # Bulk writes bypass the post_save receivers that invalidate the cache
+        bump_versions(request.user.pk, *MODEL_CACHE_SCOPES[self.cache_scope])
+        return Response(serializer.data, status=status.HTTP_201_CREATED if creating else status.HTTP_200_OK)
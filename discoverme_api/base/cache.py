@@ -0,0 +1,154 @@
+import hashlib
+import time
+from functools import partial
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+# Per-user response caching for the list/detail endpoints.
+#
+# Every (user, scope) pair has a version number stored in the cache. Cached
+# responses are keyed on the current version, so invalidating a user's
+# responses is a single increment and stale entries simply expire. Versions
+# are bumped after commit by the post_save/post_delete receivers in
+# base/signals.py; code that writes with bulk_create/update() must call
+# bump_versions itself. The versions must be visible to every worker, so
+# this needs a shared cache backend (API_CACHE_URL) whenever more than one
+# process serves requests; production turns it off without one.
+# The same version doubles as a cheap ETag validator: an unchanged scope
+# answers If-None-Match with 304 without touching the database or serializers.
+# A per-worker version would answer 304 for data the client already changed
+# through another worker, so ETags are only issued while the cache is enabled.
+
+CACHE_SCOPES = ('moodlog', 'journalentry', 'suggestion', 'goal', 'task', 'insight')
+
+# Scope of the cached user lookup done by base.authentication, invalidated by
+# any change to the user or their profile.
+AUTH_CACHE_SCOPE = 'auth'
+
+# Scopes invalidated by a change to each model. Goals embed their tasks, and
+# insights (and their mood-counts endpoint) embed counts of the mood logs.
+MODEL_CACHE_SCOPES = {
+    'moodlog': ('moodlog', 'insight'),
+    'journalentry': ('journalentry',),
+    'suggestion': ('suggestion',),
+    'insight': ('insight',),
+    'goal': ('goal', 'task'),
+    'task': ('task', 'goal'),
+}
+
+
+def get_cache():
+    """
+    Returns the cache backend configured by ``API_CACHE_ALIAS``.
+    """
+    return caches[settings.API_CACHE_ALIAS]
+
+
+def version_key(user_id, scope):
+    return f'api:version:{scope}:{user_id}'
+
+
+def initial_version():
+    """
+    Returns a fresh version number. Time based, so a version key that was
+    evicted never restarts at a number older responses were cached under.
+    """
+    return time.time_ns() // 1000
+
+
+def get_version(user_id, scope):
+    """
+    Returns the current cache version for a user's scope.
+    """
+    cache = get_cache()
+    key = version_key(user_id, scope)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, initial_version(), None)
+        version = cache.get(key)
+    return version
+
+
+def incr_versions(user_id, scopes):
+    cache = get_cache()
+    for scope in scopes:
+        key = version_key(user_id, scope)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, initial_version(), None)
+
+
+def bump_versions(user_id, *scopes):
+    """
+    Invalidates every cached response of a user in the given scopes once the
+    current transaction commits, or immediately outside a transaction.
+
+    Bumping before the commit would let a concurrent request cache the old
+    rows under the new version, where they would stay until they expire.
+    """
+    transaction.on_commit(partial(incr_versions, user_id, scopes))
+
+
+class UserCacheMixin:
+    """
+    Caches the list and retrieve responses of a per-user viewset and answers
+    conditional GETs with ``304 Not Modified``.
+
+    Set ``cache_scope`` to the scope whose version invalidates the responses.
+    """
+    cache_scope = None
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(super().retrieve, request, *args, **kwargs)
+
+    def get_cache_key(self, request, version):
+        """
+        Builds the cache key from the user, the scope version, the negotiated
+        format and the full URL.
+        """
+        url = f'{request.accepted_renderer.format}:{request.build_absolute_uri()}'
+        digest = hashlib.md5(url.encode()).hexdigest()
+        return f'api:response:{self.cache_scope}:{request.user.pk}:{version}:{digest}'
+
+    def cached_response(self, view, request, *args, **kwargs):
+        """
+        Returns 304 if the client's ETag is current, otherwise the cached
+        response data, otherwise calls ``view`` and caches its result.
+
+        The ETag is derived from the shared scope version, so with the cache
+        disabled (e.g. production without a shared backend) responses carry
+        no ETag and are never answered with 304.
+        """
+        if not settings.API_CACHE_ENABLED:
+            return view(request, *args, **kwargs)
+
+        version = get_version(request.user.pk, self.cache_scope)
+        key = self.get_cache_key(request, version)
+        etag = quote_etag(hashlib.md5(key.encode()).hexdigest())
+
+        if etag in parse_etags(request.headers.get('If-None-Match', '')):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            cache = get_cache()
+            data = cache.get(key)
+            if data is not None:
+                response = Response(data)
+            else:
+                response = view(request, *args, **kwargs)
+                if response.status_code == status.HTTP_200_OK:
+                    cache.set(key, response.data, settings.API_CACHE_TIMEOUT)
+
+        if response.status_code in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+            response['ETag'] = etag
+            patch_cache_control(response, private=True, no_cache=True)
+            patch_vary_headers(response, ['Authorization', 'Cookie'])
+        return response
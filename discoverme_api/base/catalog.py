@@ -0,0 +1,138 @@
+import threading
+from functools import partial
+from django.conf import settings
+from django.db import transaction
+from .cache import get_cache, initial_version
+from .models import Mood
+
+# Process-local cache of the Mood catalog.
+#
+# Moods are a handful of rows that almost never change, yet validating a mood
+# log, listing moods and rendering embedded moods each queried them. Every
+# process keeps the catalog in memory, tagged with a version number stored in
+# the shared cache. The post_save/post_delete receivers in base/signals.py
+# bump that version after commit, and each process reloads its copy the next
+# time it reads a different version. Code that changes moods without signals
+# (bulk_create/update()) must call invalidate_mood_catalog() itself.
+#
+# The version is only shared between processes through a shared cache
+# backend, so the catalog follows API_CACHE_ENABLED (which production only
+# enables with API_CACHE_URL): while it is off, every read loads the moods
+# from the database.
+#
+# The cached Mood instances are shared between requests and must be treated
+# as read-only.
+
+VERSION_KEY = 'api:version:mood-catalog'
+
+
+class MoodCatalog:
+    """
+    Snapshot of every ``Mood``, keyed by id and by lowercase ``mood_type``.
+
+    :param moods: The moods, in id order.
+    :type moods: list
+    :param version: The catalog version the snapshot was loaded at, or
+        ``None`` for an uncached snapshot.
+    :type version: int
+    """
+
+    def __init__(self, moods, version):
+        self.moods = moods
+        self.version = version
+        self.by_id = {mood.pk: mood for mood in moods}
+        self.by_name = {}
+        for mood in moods:
+            self.by_name.setdefault(mood.mood_type.lower(), mood)
+
+    def get(self, pk):
+        """
+        Returns the mood with the given id, or ``None``.
+        """
+        return self.by_id.get(pk)
+
+    def get_by_name(self, name):
+        """
+        Returns the first mood whose ``mood_type`` matches ``name`` case-insensitively, or ``None``.
+        """
+        return self.by_name.get(name.lower())
+
+    def __iter__(self):
+        return iter(self.moods)
+
+    def __len__(self):
+        return len(self.moods)
+
+
+_catalog = None
+_lock = threading.Lock()
+
+
+def get_catalog_version():
+    """
+    Returns the catalog version shared by every process.
+    """
+    cache = get_cache()
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, initial_version(), None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def get_mood_catalog():
+    """
+    Returns the current catalog, reloading it if another process or request
+    changed a mood since it was loaded. Without the API cache, returns a
+    fresh snapshot from the database.
+
+    :rtype: MoodCatalog
+    """
+    global _catalog
+    if not settings.API_CACHE_ENABLED:
+        return MoodCatalog(list(Mood.objects.order_by('id')), None)
+
+    version = get_catalog_version()
+    catalog = _catalog
+    if catalog is not None and catalog.version == version:
+        return catalog
+
+    with _lock:
+        if _catalog is None or _catalog.version != version:
+            _catalog = MoodCatalog(list(Mood.objects.order_by('id')), version)
+        return _catalog
+
+
+def incr_catalog_version():
+    cache = get_cache()
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, initial_version(), None)
+
+
+def invalidate_mood_catalog():
+    """
+    Makes every process reload the catalog on its next read, once the
+    current transaction commits.
+    """
+    transaction.on_commit(incr_catalog_version)
+
+
+def invalidate_stale_catalog(catalog):
+    """
+    Invalidates a catalog found to be missing a mood that is in the database.
+
+    Every request validating that mood misses until the new version is
+    visible, so only the first one per catalog version bumps it.
+
+    :param catalog: The catalog that missed.
+    :type catalog: MoodCatalog
+    """
+    if catalog.version is not None:
+        transaction.on_commit(partial(incr_stale_catalog_version, catalog.version))
+
+
+def incr_stale_catalog_version(version):
+    if get_cache().add(f'{VERSION_KEY}:stale:{version}', True, settings.API_CACHE_TIMEOUT):
+        incr_catalog_version()
@@ -0,0 +1,45 @@
+import logging
+from django.utils.timezone import now
+from emails.messages import send_congrats_email
+
+logger = logging.getLogger(__name__)
+
+# Completion side effects shared by the Task/Goal pre_save receivers in
+# base/signals.py and the bulk task serializer, whose bulk_update bypasses
+# the signals.
+
+
+def apply_task_completion(task):
+    """
+    Sets ``completed_on`` when a Task becomes completed and queues a
+    congratulatory email.
+
+    :param task: The task about to be saved.
+    :type task: Task
+    """
+    if task.completed and not task.completed_on:
+        task.completed_on = now()
+        # Queue congratulatory email
+        try:
+            send_congrats_email(task.goal.user, f"{task.text}")
+            logger.info('Congrats email queued for task: %s', task.text)
+        except Exception:
+            logger.exception('Failed to queue congrats email for task: %s', task.text)
+
+
+def apply_goal_completion(goal):
+    """
+    Sets ``completed_on`` when a Goal becomes completed and queues a
+    congratulatory email.
+
+    :param goal: The goal about to be saved.
+    :type goal: Goal
+    """
+    if goal.completed and not goal.completed_on:
+        goal.completed_on = now()
+        # Queue congratulatory email
+        try:
+            send_congrats_email(goal.user, f"{goal.title}")
+            logger.info('Congrats email queued for goal: %s', goal.title)
+        except Exception:
+            logger.exception('Failed to queue congrats email for goal: %s', goal.title)
@@ -0,0 +1,118 @@
+import csv
+import io
+import json
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from .models import MoodLog, JournalEntry, Goal, Task
+
+# Streaming export of a user's data.
+#
+# Rows are read with values() and QuerySet.iterator(chunk_size=...), so only
+# one chunk of plain dictionaries is held in memory at a time (on PostgreSQL
+# the chunks come from a server-side cursor). The generators below yield
+# encoded lines and are consumed by a StreamingHttpResponse or written to a
+# file, so memory stays flat however much history the user has.
+
+EXPORT_FORMATS = ('ndjson', 'csv')
+
+# Exported fields of each collection, as ``output name: values() lookup``
+EXPORT_COLLECTIONS = {
+    'moodlogs': {
+        'queryset': lambda user: MoodLog.objects.filter(user=user).order_by('date_logged', 'id'),
+        'fields': {
+            'id': 'id', 'mood': 'mood__mood_type', 'date_logged': 'date_logged', 'notes': 'notes',
+        },
+    },
+    'journalentries': {
+        'queryset': lambda user: JournalEntry.objects.filter(user=user).order_by('created_at', 'id'),
+        'fields': {
+            'id': 'id', 'title': 'title', 'content': 'content', 'created_at': 'created_at',
+        },
+    },
+    'goals': {
+        'queryset': lambda user: Goal.objects.filter(user=user).order_by('start_date', 'id'),
+        'fields': {
+            'id': 'id', 'category': 'category', 'title': 'title', 'description': 'description',
+            'completed': 'completed', 'completed_on': 'completed_on', 'start_date': 'start_date',
+            'times_per_day': 'times_per_day', 'days_per_week': 'days_per_week',
+            'duration': 'duration', 'duration_unit': 'duration_unit',
+        },
+    },
+    'tasks': {
+        'queryset': lambda user: Task.objects.filter(goal__user=user).order_by('goal_id', 'id'),
+        'fields': {
+            'id': 'id', 'goal': 'goal_id', 'text': 'text', 'completed': 'completed', 'completed_on': 'completed_on',
+        },
+    },
+}
+
+
+def iter_rows(user, collection, chunk_size=None):
+    """
+    Yields the user's rows of one collection as dictionaries keyed by output name.
+
+    :param user: The user whose data is exported.
+    :param collection: A key of ``EXPORT_COLLECTIONS``.
+    :param chunk_size: Rows fetched per database round trip, defaults to ``EXPORT_CHUNK_SIZE``.
+    """
+    spec = EXPORT_COLLECTIONS[collection]
+    names = list(spec['fields'])
+    lookups = list(spec['fields'].values())
+    rows = spec['queryset'](user).values_list(*lookups).iterator(
+        chunk_size=chunk_size or settings.EXPORT_CHUNK_SIZE
+    )
+    for row in rows:
+        yield dict(zip(names, row))
+
+
+def iter_ndjson(user, collections=None, chunk_size=None):
+    """
+    Yields one JSON line per row, tagged with its collection in ``type``.
+
+    :param collections: Collections to export, defaults to all of them.
+    """
+    for collection in collections or EXPORT_COLLECTIONS:
+        for row in iter_rows(user, collection, chunk_size):
+            yield json.dumps({'type': collection, **row}, cls=DjangoJSONEncoder) + '\n'
+
+
+def iter_csv(user, collection, chunk_size=None):
+    """
+    Yields the CSV header and then one line per row of a single collection.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush():
+        line = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return line
+
+    writer.writerow(EXPORT_COLLECTIONS[collection]['fields'])
+    yield flush()
+    for row in iter_rows(user, collection, chunk_size):
+        writer.writerow([
+            value.isoformat() if hasattr(value, 'isoformat') else value
+            for value in row.values()
+        ])
+        yield flush()
+
+
+def export_lines(user, export_format, collection=None, chunk_size=None):
+    """
+    Returns a generator of encoded export lines.
+
+    :param export_format: ``ndjson`` (all collections unless ``collection`` is
+        given) or ``csv`` (``collection`` required).
+    :raises ValueError: For an unknown format or collection.
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown format '{export_format}'; use one of: {', '.join(EXPORT_FORMATS)}.")
+    if collection is not None and collection not in EXPORT_COLLECTIONS:
+        raise ValueError(f"Unknown collection '{collection}'; use one of: {', '.join(EXPORT_COLLECTIONS)}.")
+    if export_format == 'csv':
+        if collection is None:
+            raise ValueError('A collection is required for CSV exports.')
+        return iter_csv(user, collection, chunk_size)
+    return iter_ndjson(user, [collection] if collection else None, chunk_size)
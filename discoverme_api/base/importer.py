@@ -0,0 +1,262 @@
+import csv
+import io
+import json
+from datetime import datetime
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from .aggregates import apply_count_changes, count_keys
+from .cache import bump_versions
+from .catalog import get_mood_catalog
+from .models import MoodLog, JournalEntry
+
+# Streaming import of mood logs and journal entries, e.g. from another app or
+# from our own export (the column names match base/export.py).
+#
+# Files are parsed one row at a time and written in chunks of
+# IMPORT_BATCH_SIZE rows, each chunk in its own transaction, so memory stays
+# bounded by the chunk size and progress can be reported as chunks commit.
+# Invalid rows are skipped and reported with their line number; a failure
+# part-way through keeps the chunks already committed.
+
+IMPORT_FORMATS = ('ndjson', 'csv')
+IMPORT_COLLECTIONS = ('moodlogs', 'journalentries')
+
+# Collections found in a full NDJSON export that are not imported
+SKIPPED_COLLECTIONS = ('goals', 'tasks')
+
+
+class RowError(ValueError):
+    pass
+
+
+# Row yielded by read_ndjson for a line that is not valid JSON, so that a
+# JSON ``null`` line can still be told apart and reported as a non-object.
+INVALID_JSON = object()
+
+
+def parse_timestamp(value, field):
+    """
+    Parses an ISO 8601 date or datetime; naive values use the current time zone.
+
+    :return: An aware datetime, or ``None`` for an empty value.
+    :raises RowError: If the value is not a valid date.
+    """
+    if value in (None, ''):
+        return None
+    try:
+        parsed = parse_datetime(value)
+        if parsed is None:
+            day = parse_date(value)
+            if day is not None:
+                parsed = datetime(day.year, day.month, day.day)
+    except (TypeError, ValueError):
+        parsed = None
+    if parsed is None:
+        raise RowError(f"Invalid {field} '{value}'.")
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+class Importer:
+    """
+    Builds and writes the imported rows of one user in chunks.
+
+    Mood names are resolved against the in-memory mood catalog.
+
+    :param user: The user the rows are imported for.
+    :type user: User
+    :param batch_size: Rows written per ``bulk_create``, defaults to ``IMPORT_BATCH_SIZE``.
+    :type batch_size: int
+    :param progress: Optional callable receiving the summary after each chunk.
+    :type progress: callable
+    """
+
+    def __init__(self, user, batch_size=None, progress=None):
+        self.user = user
+        self.batch_size = batch_size or settings.IMPORT_BATCH_SIZE
+        self.progress = progress
+        self.moods = {}
+        for mood in get_mood_catalog():
+            self.moods.setdefault(mood.mood_type.lower(), mood.pk)
+            self.moods[str(mood.pk)] = mood.pk
+        self.pending = {name: [] for name in IMPORT_COLLECTIONS}
+        self.summary = {
+            'imported': {name: 0 for name in IMPORT_COLLECTIONS},
+            'skipped': 0,
+            'error_count': 0,
+            'errors': [],
+        }
+
+    def build_moodlogs(self, row):
+        mood = str(row.get('mood') or '').strip()
+        if not mood:
+            raise RowError('Missing mood.')
+        mood_id = self.moods.get(mood.lower())
+        if mood_id is None:
+            raise RowError(f"Unknown mood '{mood}'.")
+        return MoodLog(
+            user=self.user,
+            mood_id=mood_id,
+            notes=str(row['notes']) if row.get('notes') else None,
+            date_logged=parse_timestamp(row.get('date_logged'), 'date_logged') or timezone.now(),
+        )
+
+    def build_journalentries(self, row):
+        title = str(row.get('title') or '').strip()
+        content = str(row.get('content') or '')
+        if not title:
+            raise RowError('Missing title.')
+        if len(title) > JournalEntry._meta.get_field('title').max_length:
+            raise RowError('Title is too long.')
+        if not content:
+            raise RowError('Missing content.')
+        return JournalEntry(
+            user=self.user,
+            title=title,
+            content=content,
+            created_at=parse_timestamp(row.get('created_at'), 'created_at') or timezone.now(),
+        )
+
+    def add(self, line, collection, row):
+        """
+        Validates one parsed row and queues it, flushing full chunks.
+        """
+        try:
+            if collection in SKIPPED_COLLECTIONS:
+                self.summary['skipped'] += 1
+                return
+            if collection not in IMPORT_COLLECTIONS:
+                raise RowError(f"Unknown type '{collection}'.")
+            if not isinstance(row, dict):
+                raise RowError('Expected an object.')
+            obj = getattr(self, f'build_{collection}')(row)
+        except RowError as e:
+            self.error(line, str(e))
+            return
+
+        self.pending[collection].append(obj)
+        if len(self.pending[collection]) >= self.batch_size:
+            self.flush(collection)
+
+    def error(self, line, message):
+        self.summary['error_count'] += 1
+        if len(self.summary['errors']) < settings.IMPORT_MAX_ERRORS:
+            self.summary['errors'].append({'line': line, 'error': message})
+
+    def flush(self, collection):
+        """
+        Writes the queued rows of a collection in one transaction.
+
+        ``bulk_create`` stamps ``auto_now_add`` fields with the current time,
+        so the historical timestamps are written back with one ``bulk_update``.
+        """
+        objs = self.pending[collection]
+        if not objs:
+            return
+        self.pending[collection] = []
+        model, field = (MoodLog, 'date_logged') if collection == 'moodlogs' else (JournalEntry, 'created_at')
+        timestamps = [getattr(obj, field) for obj in objs]
+
+        with transaction.atomic():
+            created = model.objects.bulk_create(objs)
+            for obj, timestamp in zip(created, timestamps):
+                setattr(obj, field, timestamp)
+            model.objects.bulk_update(created, [field])
+            if model is MoodLog:
+                apply_count_changes(after=count_keys(created))
+
+        self.summary['imported'][collection] += len(created)
+        if self.progress:
+            self.progress(self.summary)
+
+    def finish(self):
+        """
+        Writes the remaining rows and invalidates the user's cached responses.
+
+        :return: The import summary.
+        :rtype: dict
+        """
+        try:
+            for collection in IMPORT_COLLECTIONS:
+                self.flush(collection)
+        finally:
+            self.invalidate()
+        return self.summary
+
+    def invalidate(self):
+        """
+        Invalidates the user's cached responses for the imported collections.
+        """
+        bump_versions(self.user.pk, 'moodlog', 'insight', 'journalentry')
+
+
+def read_ndjson(stream):
+    """
+    Yields ``(line, collection, row)`` for each non-empty line of an NDJSON stream.
+    The collection is taken from each object's ``type``; the row is
+    ``INVALID_JSON`` for a line that does not parse.
+    """
+    for line, text in enumerate(stream, start=1):
+        if not text.strip():
+            continue
+        try:
+            row = json.loads(text)
+        except ValueError:
+            yield line, None, INVALID_JSON
+            continue
+        yield line, row.get('type') if isinstance(row, dict) else None, row
+
+
+def read_csv(stream, collection):
+    """
+    Yields ``(line, collection, row)`` for each data row of a CSV stream.
+    """
+    reader = csv.DictReader(stream)
+    for row in reader:
+        yield reader.line_num, collection, row
+
+
+def import_file(user, stream, import_format, collection=None, batch_size=None, progress=None):
+    """
+    Imports mood logs and journal entries from a binary file object.
+
+    :param stream: Binary file object, read incrementally.
+    :param import_format: ``ndjson`` or ``csv``.
+    :param collection: Collection of every row; required for CSV. For NDJSON
+        it overrides each row's ``type``.
+    :return: The summary: rows imported per collection, rows skipped, and
+        the errors with their line numbers.
+    :rtype: dict
+    :raises ValueError: For an unknown format or collection.
+    """
+    if import_format not in IMPORT_FORMATS:
+        raise ValueError(f"Unknown format '{import_format}'; use one of: {', '.join(IMPORT_FORMATS)}.")
+    if collection is not None and collection not in IMPORT_COLLECTIONS:
+        raise ValueError(f"Unknown collection '{collection}'; use one of: {', '.join(IMPORT_COLLECTIONS)}.")
+    if import_format == 'csv' and collection is None:
+        raise ValueError('A collection is required for CSV imports.')
+
+    text = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+    rows = read_csv(text, collection) if import_format == 'csv' else read_ndjson(text)
+    importer = Importer(user, batch_size=batch_size, progress=progress)
+    try:
+        for line, row_collection, row in rows:
+            if row is INVALID_JSON:
+                importer.error(line, 'Invalid JSON.')
+                continue
+            importer.add(line, collection or row_collection, row)
+    except UnicodeDecodeError:
+        importer.error(None, 'The file is not valid UTF-8.')
+    except csv.Error as e:
+        importer.error(None, f'Invalid CSV: {e}')
+    except BaseException:
+        # Chunks committed before the failure are kept, so they must not
+        # be hidden behind cached responses
+        importer.invalidate()
+        raise
+    finally:
+        text.detach()
+    return importer.finish()
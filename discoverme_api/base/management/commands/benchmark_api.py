@@ -0,0 +1,182 @@
+import io
+import json
+import platform
+import subprocess
+from datetime import datetime, timezone
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import setup_test_environment, teardown_test_environment
+from rest_framework.test import APIClient
+from base.benchmark import measure
+from base.models import Mood
+
+SCENARIOS = ['token_obtain', 'moodlog_list', 'moodlog_list_session', 'moodlog_create', 'goal_list', 'register']
+
+# One of the users created by populate_data
+BENCH_USERNAME = 'emilyw'
+BENCH_PASSWORD = 'securepassword1'
+
+class Command(BaseCommand):
+    """
+    Django management command that benchmarks the main API endpoints in-process.
+
+    A throwaway test database is created and seeded with ``populate_data``,
+    then each scenario is driven through the DRF test client. The response
+    cache is off unless ``--cache`` is given, so repeated GETs measure the
+    real query and serialization work. Latency percentiles, queries per
+    request and allocations are printed and written to a JSON file so runs
+    can be compared across commits.
+    """
+    help = 'Benchmark the main API endpoints against a seeded throwaway database.'
+
+    def add_arguments(self, parser):
+        """
+        Add command-line arguments for data volume, iterations and output.
+        """
+        parser.add_argument('--num-moodlogs', type=int, default=2000, help='Mood logs to seed per user')
+        parser.add_argument('--num-journalentries', type=int, default=500, help='Journal entries to seed per user')
+        parser.add_argument('--num-goals', type=int, default=50, help='Goals to seed per user')
+        parser.add_argument('--num-tasks-per-goal', type=int, default=5, help='Tasks to seed per goal')
+        parser.add_argument('--iterations', type=int, default=50, help='Measured requests per scenario')
+        parser.add_argument('--warmup', type=int, default=5, help='Unmeasured requests sent before each scenario')
+        parser.add_argument('--scenario', action='append', choices=SCENARIOS, help='Scenario to run (repeatable, default all)')
+        parser.add_argument('--cache', action='store_true', help='Enable the per-user response cache (off by default, so repeated GETs measure the real query and serialization work)')
+        parser.add_argument('--output', type=str, default='bench_results.json', help='Path of the JSON results file')
+
+    def handle(self, *args, **kwargs):
+        """
+        Execute the benchmark.
+        """
+        scenarios = kwargs['scenario'] or SCENARIOS
+
+        setup_test_environment()
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            with override_settings(API_CACHE_ENABLED=kwargs['cache']):
+                self.seed(kwargs)
+                results = {name: getattr(self, f'bench_{name}')(kwargs) for name in scenarios}
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        report = {
+            'commit': self.git_commit(),
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'database': connection.vendor,
+            'api_lean_mode': settings.API_LEAN_MODE,
+            'parameters': {
+                key: kwargs[key] for key in [
+                    'num_moodlogs', 'num_journalentries', 'num_goals',
+                    'num_tasks_per_goal', 'iterations', 'warmup', 'cache',
+                ]
+            },
+            'results': results,
+        }
+        with open(kwargs['output'], 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+        self.print_table(results)
+        self.stdout.write(self.style.SUCCESS(f"Results written to {kwargs['output']}."))
+
+    def seed(self, kwargs):
+        """
+        Seed the throwaway database with populate_data.
+        """
+        self.stdout.write('Seeding benchmark data...')
+        call_command(
+            'populate_data',
+            num_moodlogs=kwargs['num_moodlogs'],
+            num_journalentries=kwargs['num_journalentries'],
+            num_goals=kwargs['num_goals'],
+            num_tasks_per_goal=kwargs['num_tasks_per_goal'],
+            stdout=io.StringIO(),
+        )
+
+    def authenticated_client(self):
+        """
+        Return a client sending a JWT for the benchmark user.
+        """
+        client = APIClient()
+        response = client.post('/api/token/', {'username': BENCH_USERNAME, 'password': BENCH_PASSWORD})
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+        return client
+
+    def run(self, name, send, kwargs, expected_status=200):
+        """
+        Measure one scenario.
+        """
+        self.stdout.write(f'Running {name}...')
+        return measure(send, iterations=kwargs['iterations'], warmup=kwargs['warmup'], expected_status=expected_status)
+
+    def bench_token_obtain(self, kwargs):
+        client = APIClient()
+        data = {'username': BENCH_USERNAME, 'password': BENCH_PASSWORD}
+        return self.run('token_obtain', lambda i: client.post('/api/token/', data), kwargs)
+
+    def bench_moodlog_list(self, kwargs):
+        client = self.authenticated_client()
+        return self.run('moodlog_list', lambda i: client.get('/api/moodlogs/'), kwargs)
+
+    def bench_moodlog_list_session(self, kwargs):
+        # A browser client that also holds a session cookie, which the
+        # session authentication looks up on every request unless
+        # API_LEAN_MODE is on.
+        client = self.authenticated_client()
+        client.login(username=BENCH_USERNAME, password=BENCH_PASSWORD)
+        return self.run('moodlog_list_session', lambda i: client.get('/api/moodlogs/'), kwargs)
+
+    def bench_moodlog_create(self, kwargs):
+        client = self.authenticated_client()
+        mood_ids = list(Mood.objects.values_list('id', flat=True))
+        return self.run(
+            'moodlog_create',
+            lambda i: client.post('/api/moodlogs/', {'mood': mood_ids[i % len(mood_ids)], 'notes': f'Benchmark {i}'}),
+            kwargs,
+            expected_status=201,
+        )
+
+    def bench_goal_list(self, kwargs):
+        client = self.authenticated_client()
+        return self.run('goal_list', lambda i: client.get('/api/goals/'), kwargs)
+
+    def bench_register(self, kwargs):
+        client = APIClient()
+        return self.run(
+            'register',
+            lambda i: client.post('/api/register/', {
+                'username': f'bench_{i}',
+                'email': f'bench_{i}@example.com',
+                'password': 'benchpassword1',
+            }),
+            kwargs,
+            expected_status=201,
+        )
+
+    def git_commit(self):
+        """
+        Return the current git commit, if the code runs from a checkout.
+        """
+        try:
+            return subprocess.run(
+                ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    def print_table(self, results):
+        """
+        Print a summary of the results.
+        """
+        header = f"{'scenario':<22}{'p50 ms':>10}{'p99 ms':>10}{'queries':>9}{'KiB/req':>10}"
+        self.stdout.write(header)
+        self.stdout.write('-' * len(header))
+        for name, stats in results.items():
+            self.stdout.write(
+                f"{name:<22}{stats['p50_ms']:>10}{stats['p99_ms']:>10}"
+                f"{stats['queries_per_request']:>9}{stats['peak_kib_per_request']:>10}"
+            )
@@ -0,0 +1,148 @@
+import asyncio
+import io
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import connection, connections
+from django.test import AsyncClient, Client, override_settings
+from django.test.utils import setup_test_environment, teardown_test_environment
+from rest_framework.test import APIClient
+from base.benchmark import percentile
+from .benchmark_api import BENCH_PASSWORD, BENCH_USERNAME
+
+# Sync viewset path and async counterpart of each benchmarked endpoint
+ENDPOINTS = {
+    'moodlogs': ('/api/moodlogs/', '/api/async/moodlogs/'),
+    'journalentries': ('/api/journalentries/', '/api/async/journalentries/'),
+    'goals': ('/api/goals/', '/api/async/goals/'),
+}
+
+class Command(BaseCommand):
+    """
+    Django management command that compares concurrent-request throughput of
+    the WSGI path with the ASGI paths.
+
+    For each endpoint, ``--requests`` GETs are sent with ``--concurrency`` in
+    flight in three ways: the sync viewset through the WSGI handler (one
+    thread per in-flight request, as under a threaded WSGI server), the same
+    viewset through the ASGI handler, and the async view through the ASGI
+    handler. Everything runs in-process against a seeded throwaway database:
+    the ASGI modes are driven through Django's ``AsyncClient``, not a real
+    ASGI server such as uvicorn or daphne, so there are no sockets, HTTP
+    parsing or server worker processes. The numbers compare the handlers'
+    request-handling cost relative to each other; server throughput has to
+    be measured by load testing a deployed server.
+    """
+    help = 'Compare concurrent throughput of the sync (WSGI) and async (ASGI) list endpoints.'
+
+    def add_arguments(self, parser):
+        """
+        Add command-line arguments for data volume, load and output.
+        """
+        parser.add_argument('--num-moodlogs', type=int, default=200, help='Mood logs to seed per user')
+        parser.add_argument('--requests', type=int, default=200, help='Requests per endpoint and mode')
+        parser.add_argument('--concurrency', type=int, default=10, help='Requests in flight at once')
+        parser.add_argument('--endpoint', action='append', choices=list(ENDPOINTS), help='Endpoint to run (repeatable, default all)')
+        parser.add_argument('--output', type=str, help='Optional path of a JSON results file')
+
+    def handle(self, *args, **kwargs):
+        """
+        Execute the benchmark.
+        """
+        setup_test_environment()
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        # The async views don't use the per-user response cache, so it is off
+        # for every mode to compare the database-bound path.
+        cache_off = override_settings(API_CACHE_ENABLED=False)
+        cache_off.enable()
+        try:
+            self.stdout.write('Seeding benchmark data...')
+            call_command(
+                'populate_data', num_moodlogs=kwargs['num_moodlogs'], num_journalentries=50,
+                num_goals=20, num_tasks_per_goal=3, stdout=io.StringIO(),
+            )
+            token = APIClient().post('/api/token/', {'username': BENCH_USERNAME, 'password': BENCH_PASSWORD}).data['access']
+            headers = {'Authorization': f'Bearer {token}'}
+
+            results = {}
+            for name in kwargs['endpoint'] or ENDPOINTS:
+                sync_path, async_path = ENDPOINTS[name]
+                self.stdout.write(f'Running {name}...')
+                results[name] = {
+                    'wsgi_sync_view': self.run_wsgi(sync_path, headers, kwargs),
+                    'asgi_sync_view': asyncio.run(self.run_asgi(sync_path, headers, kwargs)),
+                    'asgi_async_view': asyncio.run(self.run_asgi(async_path, headers, kwargs)),
+                }
+        finally:
+            cache_off.disable()
+            connections.close_all()
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        self.print_table(results)
+        if kwargs['output']:
+            with open(kwargs['output'], 'w', encoding='utf-8') as f:
+                json.dump({'database': connection.vendor, 'concurrency': kwargs['concurrency'], 'results': results}, f, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"Results written to {kwargs['output']}."))
+
+    def run_wsgi(self, path, headers, kwargs):
+        """
+        Send the requests through the WSGI handler from a thread pool.
+        """
+        client = Client(headers=headers)
+
+        def send(i):
+            start = time.perf_counter()
+            response = client.get(path)
+            assert response.status_code == 200, f'{path} returned {response.status_code}'
+            return (time.perf_counter() - start) * 1000
+
+        with ThreadPoolExecutor(max_workers=kwargs['concurrency']) as pool:
+            start = time.perf_counter()
+            timings = list(pool.map(send, range(kwargs['requests'])))
+            elapsed = time.perf_counter() - start
+            # Each worker thread opened its own database connection.
+            pool.map(lambda i: connections.close_all(), range(kwargs['concurrency']))
+        return self.summarize(timings, elapsed)
+
+    async def run_asgi(self, path, headers, kwargs):
+        """
+        Send the requests through the ASGI handler from one event loop.
+        """
+        client = AsyncClient()
+        semaphore = asyncio.Semaphore(kwargs['concurrency'])
+
+        async def send(i):
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.get(path, headers=headers)
+                assert response.status_code == 200, f'{path} returned {response.status_code}'
+                return (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        timings = await asyncio.gather(*(send(i) for i in range(kwargs['requests'])))
+        return self.summarize(timings, time.perf_counter() - start)
+
+    def summarize(self, timings, elapsed):
+        return {
+            'requests': len(timings),
+            'requests_per_second': round(len(timings) / elapsed, 1),
+            'p50_ms': round(percentile(timings, 50), 3),
+            'p99_ms': round(percentile(timings, 99), 3),
+        }
+
+    def print_table(self, results):
+        """
+        Print a summary of the results.
+        """
+        header = f"{'endpoint':<16}{'mode':<18}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}"
+        self.stdout.write(header)
+        self.stdout.write('-' * len(header))
+        for name, modes in results.items():
+            for mode, stats in modes.items():
+                self.stdout.write(
+                    f"{name:<16}{mode:<18}{stats['requests_per_second']:>10}{stats['p50_ms']:>10}{stats['p99_ms']:>10}"
+                )
@@ -0,0 +1,101 @@
+import json
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.core.signals import request_finished, request_started
+from django.db import connections
+from base.benchmark import percentile
+
+class Command(BaseCommand):
+    """
+    Django management command that measures the per-request cost of opening
+    database connections.
+
+    Each iteration simulates a request cycle (``request_started``, one query,
+    ``request_finished``), so Django applies ``CONN_MAX_AGE`` and
+    ``CONN_HEALTH_CHECKS`` exactly as it does for real requests. Run it
+    against a local PostgreSQL (see ``settings/dev.py``) to see the handshake
+    cost that persistent or pooled connections save in production.
+    """
+    help = 'Compare per-request latency with new, persistent and pooled database connections.'
+
+    def add_arguments(self, parser):
+        """
+        Add command-line arguments for iterations, database and output.
+        """
+        parser.add_argument('--iterations', type=int, default=200, help='Simulated requests per mode')
+        parser.add_argument('--database', type=str, default='default', help='Database alias to benchmark')
+        parser.add_argument('--pool', action='store_true', help="Also measure psycopg's connection pool (PostgreSQL only)")
+        parser.add_argument('--output', type=str, help='Optional path of a JSON results file')
+
+    def handle(self, *args, **kwargs):
+        """
+        Execute the benchmark.
+        """
+        connection = connections[kwargs['database']]
+        modes = {
+            'new_connection': {'CONN_MAX_AGE': 0, 'CONN_HEALTH_CHECKS': False},
+            'persistent': {'CONN_MAX_AGE': 600, 'CONN_HEALTH_CHECKS': False},
+            'persistent_health_checks': {'CONN_MAX_AGE': 600, 'CONN_HEALTH_CHECKS': True},
+        }
+        if kwargs['pool']:
+            if connection.vendor != 'postgresql':
+                raise CommandError('Connection pooling is only available on PostgreSQL.')
+            modes['pool'] = {'CONN_MAX_AGE': 0, 'CONN_HEALTH_CHECKS': False, 'pool': True}
+
+        original = {
+            'CONN_MAX_AGE': connection.settings_dict['CONN_MAX_AGE'],
+            'CONN_HEALTH_CHECKS': connection.settings_dict['CONN_HEALTH_CHECKS'],
+            'OPTIONS': dict(connection.settings_dict['OPTIONS']),
+        }
+        results = {}
+        try:
+            for name, mode in modes.items():
+                results[name] = self.measure(connection, mode, kwargs['iterations'])
+        finally:
+            connection.close()
+            if hasattr(connection, 'close_pool'):
+                connection.close_pool()
+            connection.settings_dict.update(original)
+
+        baseline = results['new_connection']['mean_ms']
+        self.stdout.write(f"{'mode':<28}{'p50 ms':>10}{'p99 ms':>10}{'saved ms':>10}")
+        for name, stats in results.items():
+            stats['saved_ms_per_request'] = round(baseline - stats['mean_ms'], 3)
+            self.stdout.write(
+                f"{name:<28}{stats['p50_ms']:>10}{stats['p99_ms']:>10}{stats['saved_ms_per_request']:>10}"
+            )
+
+        if kwargs['output']:
+            with open(kwargs['output'], 'w', encoding='utf-8') as f:
+                json.dump({'database': connection.vendor, 'results': results}, f, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"Results written to {kwargs['output']}."))
+
+    def measure(self, connection, mode, iterations):
+        """
+        Time simulated requests with the given connection settings.
+        """
+        connection.close()
+        connection.settings_dict['CONN_MAX_AGE'] = mode['CONN_MAX_AGE']
+        connection.settings_dict['CONN_HEALTH_CHECKS'] = mode['CONN_HEALTH_CHECKS']
+        options = dict(connection.settings_dict['OPTIONS'])
+        options.pop('pool', None)
+        if mode.get('pool'):
+            options['pool'] = True
+        connection.settings_dict['OPTIONS'] = options
+
+        timings = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            request_started.send(sender=self.__class__, environ={})
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+                cursor.fetchone()
+            request_finished.send(sender=self.__class__)
+            timings.append((time.perf_counter() - start) * 1000)
+
+        return {
+            'requests': iterations,
+            'p50_ms': round(percentile(timings, 50), 3),
+            'p99_ms': round(percentile(timings, 99), 3),
+            'mean_ms': round(sum(timings) / len(timings), 3),
+        }
@@ -0,0 +1,46 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from base.export import EXPORT_COLLECTIONS, EXPORT_FORMATS, export_lines
+
+class Command(BaseCommand):
+    """
+    Django management command that exports a user's mood logs, journal
+    entries, goals and tasks as NDJSON or CSV. Rows are streamed to the
+    output, so memory use does not grow with the size of the account.
+    """
+    help = "Export a user's data as NDJSON or CSV."
+
+    def add_arguments(self, parser):
+        """
+        Add command-line arguments for the user, format and output.
+        """
+        parser.add_argument('username', type=str, help='User whose data is exported')
+        parser.add_argument('--export-format', choices=EXPORT_FORMATS, default='ndjson', help='Output format')
+        parser.add_argument('--collection', choices=list(EXPORT_COLLECTIONS), help='Single collection to export (required for CSV)')
+        parser.add_argument('--chunk-size', type=int, help='Rows fetched per database round trip')
+        parser.add_argument('--output', type=str, help='Path of the output file (default stdout)')
+
+    def handle(self, *args, **kwargs):
+        """
+        Execute the export.
+        """
+        try:
+            user = User.objects.get(username=kwargs['username'])
+        except User.DoesNotExist:
+            raise CommandError(f"User '{kwargs['username']}' does not exist.")
+
+        try:
+            lines = export_lines(user, kwargs['export_format'], kwargs['collection'], kwargs['chunk_size'])
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        if kwargs['output']:
+            count = 0
+            with open(kwargs['output'], 'w', encoding='utf-8', newline='') as f:
+                for line in lines:
+                    f.write(line)
+                    count += 1
+            self.stderr.write(self.style.SUCCESS(f"Exported {count} line(s) to {kwargs['output']}."))
+        else:
+            for line in lines:
+                self.stdout.write(line, ending='')
@@ -0,0 +1,51 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from base.importer import IMPORT_COLLECTIONS, IMPORT_FORMATS, import_file
+
+class Command(BaseCommand):
+    """
+    Django management command that imports mood logs and journal entries for
+    a user from an NDJSON or CSV file. The file is read incrementally and
+    written in chunks, printing progress as each chunk commits.
+    """
+    help = 'Import mood logs and journal entries for a user from NDJSON or CSV.'
+
+    def add_arguments(self, parser):
+        """
+        Add command-line arguments for the user, file and format.
+        """
+        parser.add_argument('username', type=str, help='User the data is imported for')
+        parser.add_argument('path', type=str, help='Path of the NDJSON or CSV file')
+        parser.add_argument('--import-format', choices=IMPORT_FORMATS, help='File format (default from the file extension)')
+        parser.add_argument('--collection', choices=IMPORT_COLLECTIONS, help='Collection of every row (required for CSV)')
+        parser.add_argument('--batch-size', type=int, help='Rows written per bulk insert')
+
+    def handle(self, *args, **kwargs):
+        """
+        Execute the import.
+        """
+        try:
+            user = User.objects.get(username=kwargs['username'])
+        except User.DoesNotExist:
+            raise CommandError(f"User '{kwargs['username']}' does not exist.")
+
+        import_format = kwargs['import_format'] or ('csv' if kwargs['path'].lower().endswith('.csv') else 'ndjson')
+
+        def progress(summary):
+            imported = ', '.join(f'{count} {name}' for name, count in summary['imported'].items())
+            self.stdout.write(f"Imported {imported}; {summary['error_count']} error(s) so far.")
+
+        try:
+            with open(kwargs['path'], 'rb') as f:
+                summary = import_file(
+                    user, f, import_format, kwargs['collection'], kwargs['batch_size'], progress=progress
+                )
+        except (OSError, ValueError) as e:
+            raise CommandError(str(e))
+
+        for error in summary['errors']:
+            self.stderr.write(f"Line {error['line']}: {error['error']}")
+        imported = ', '.join(f'{count} {name}' for name, count in summary['imported'].items())
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {imported}; skipped {summary['skipped']}, {summary['error_count']} error(s)."
+        ))
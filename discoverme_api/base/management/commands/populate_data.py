@@ -1,14 +1,257 @@
+import multiprocessing
 import random
-from datetime import datetime, timedelta
+from contextlib import contextmanager
+from datetime import timedelta
 from django.core.management.base import BaseCommand
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
-from base.models import Mood, MoodLog, JournalEntry, Goal, Insight, Suggestion, Task
+from django.db import connection, connections, transaction
+from django.utils import timezone
+from base.aggregates import rebuild_mood_counts
+from base.models import Mood, MoodLog, JournalEntry, Goal, Insight, Suggestion, Task, UserProfile
+
+MOOD_NOTES = [
+    "Had a productive meeting at work.",
+    "Struggled with focus today.",
+    "Enjoyed a peaceful walk in the park.",
+    "Feeling positive after accomplishing a task.",
+]
+
+JOURNAL_CONTENT = [
+    "Today was a great day! I managed to complete my tasks and had time to relax.",
+    "Feeling overwhelmed but also learned something new at work.",
+    "Spent quality time with friends, which helped improve my mood.",
+]
+
+GOAL_TITLES = ['Improve fitness', 'Read more books', 'Learn a new skill']
+
+INSIGHT_TRIGGERS = ['stress', 'exercise', 'focus', 'happiness', 'relationships']
+
+SUGGESTION_TEXTS = [
+    "Create a goal: Go for a walk.",
+    "Journal how your day is going.",
+    "Watch a guided meditation video.",
+    "Take a 5-minute stretch break.",
+    "Write down 3 things you're grateful for.",
+    "Plan your meals for the week.",
+    "Spend 10 minutes reading a book.",
+    "Do a breathing exercise for 2 minutes.",
+    "Declutter your workspace.",
+    "Connect with a friend or loved one.",
+]
+
+# Relative frequency of each mood in generated logs
+MOOD_WEIGHTS = {'happy': 3, 'neutral': 3, 'excited': 2, 'sad': 2, 'anxious': 2, 'angry': 1}
+
+SEEDED_MODELS = [MoodLog, JournalEntry, Goal, Task, Insight, Suggestion]
+
+
+@contextmanager
+def preserve_timestamps(models):
+    """
+    Temporarily turns off ``auto_now``/``auto_now_add`` on the given models so
+    ``bulk_create`` keeps the generated, historical timestamps.
+    """
+    toggled = []
+    for model in models:
+        for field in model._meta.concrete_fields:
+            if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False):
+                toggled.append((field, field.auto_now, field.auto_now_add))
+                field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in toggled:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+class BatchWriter:
+    """
+    Buffers unsaved objects per model and writes them with ``bulk_create``
+    whenever a buffer reaches ``batch_size``.
+    """
+    def __init__(self, batch_size):
+        self.batch_size = batch_size
+        self.buffers = {}
+
+    def add(self, obj):
+        buffer = self.buffers.setdefault(type(obj), [])
+        buffer.append(obj)
+        if len(buffer) >= self.batch_size:
+            self.flush(type(obj))
+
+    def flush(self, model=None):
+        for buffered_model in ([model] if model else list(self.buffers)):
+            objs = self.buffers.pop(buffered_model, [])
+            if objs:
+                buffered_model.objects.bulk_create(objs, batch_size=self.batch_size)
+
+
+class UserSeeder:
+    """
+    Generates the history of one user from a deterministic random stream.
+    Activity is skewed towards recent days and clusters in the morning and
+    evening, like real journaling habits.
+    """
+    def __init__(self, user_id, seed, days, moods, now):
+        self.user_id = user_id
+        self.rng = random.Random(f'{seed}:{user_id}')
+        self.days = days
+        self.moods = moods
+        self.mood_weights = [MOOD_WEIGHTS.get(mood.mood_type, 1) for mood in moods]
+        self.midnight = timezone.localtime(now).replace(hour=0, minute=0, second=0, microsecond=0)
+        self.now = now
+
+    def moment(self):
+        """
+        Returns a realistic timestamp within the history window.
+        """
+        rng = self.rng
+        days_ago = int(rng.triangular(0, self.days, 0))
+        slot = rng.random()
+        if slot < 0.4:
+            hour = rng.gauss(8.5, 1.5)
+        elif slot < 0.85:
+            hour = rng.gauss(21, 1.5)
+        else:
+            hour = rng.uniform(7, 23)
+        hour = min(max(hour, 0), 23.99)
+        moment = self.midnight - timedelta(days=days_ago) + timedelta(hours=hour)
+        return moment if moment <= self.now else moment - timedelta(days=1)
+
+    def mood_logs(self, num):
+        for _ in range(num):
+            moment = self.moment()
+            yield MoodLog(
+                user_id=self.user_id,
+                mood=self.rng.choices(self.moods, weights=self.mood_weights)[0],
+                date_logged=moment,
+                updated_at=moment,
+                notes=self.rng.choice(MOOD_NOTES),
+            )
+
+    def journal_entries(self, num):
+        for _ in range(num):
+            moment = self.moment()
+            yield JournalEntry(
+                user_id=self.user_id,
+                title=f"Reflection on {timezone.localtime(moment).strftime('%A')}",
+                content=self.rng.choice(JOURNAL_CONTENT),
+                created_at=moment,
+                updated_at=moment,
+            )
+
+    def goals(self, num):
+        rng = self.rng
+        for i in range(num):
+            start = self.moment()
+            completed = rng.random() < 0.3
+            completed_on = min(start + timedelta(days=rng.randint(1, 60)), self.now) if completed else None
+            yield Goal(
+                user_id=self.user_id,
+                category=rng.choice(list(Goal.CATEGORY_CHOICES)),
+                title=f"Goal {i + 1}: {rng.choice(GOAL_TITLES)}",
+                description=f"Work on personal development by achieving {i + 1} milestones.",
+                start_date=start,
+                updated_at=completed_on or start,
+                completed=completed,
+                completed_on=completed_on,
+                times_per_day=rng.randint(1, 2),
+                days_per_week=rng.randint(1, 7),
+                duration=rng.randint(1, 12),
+                duration_unit=rng.choice([unit for unit, _ in Goal.DURATION_UNIT_CHOICES]),
+            )
+
+    def tasks(self, goal, num):
+        rng = self.rng
+        for j in range(num):
+            completed = goal.completed or rng.random() < 0.4
+            completed_on = None
+            if completed:
+                completed_on = goal.completed_on or min(goal.start_date + timedelta(days=rng.randint(0, 30)), self.now)
+            yield Task(
+                goal=goal,
+                text=f"Task {j + 1} for {goal.title}",
+                completed=completed,
+                completed_on=completed_on,
+                updated_at=completed_on or goal.start_date,
+            )
+
+    def insights(self, num):
+        for _ in range(num):
+            yield Insight(
+                user_id=self.user_id,
+                trigger_word=self.rng.choice(INSIGHT_TRIGGERS),
+                time_quantity=self.rng.randint(1, 4),
+                time_frame=self.rng.choice(['days', 'weeks']),
+                mood_count=self.rng.randint(1, 10),
+                created_at=self.moment(),
+            )
+
+    def suggestions(self, num):
+        for _ in range(num):
+            moment = self.moment()
+            yield Suggestion(
+                user_id=self.user_id,
+                text=self.rng.choice(SUGGESTION_TEXTS),
+                completed=self.rng.random() < 0.5,
+                created_at=moment,
+                updated_at=moment,
+            )
+
+
+def populate_users(user_ids, options):
+    """
+    Generates the history of a shard of users. Runs in the main process or
+    in a worker process, one transaction per user.
+    """
+    moods = list(Mood.objects.order_by('id'))
+    now = timezone.now()
+    writer = BatchWriter(options['batch_size'])
+
+    with preserve_timestamps(SEEDED_MODELS):
+        for user_id in user_ids:
+            seeder = UserSeeder(user_id, options['seed'], options['days'], moods, now)
+            with transaction.atomic():
+                for log in seeder.mood_logs(options['num_moodlogs']):
+                    writer.add(log)
+                for entry in seeder.journal_entries(options['num_journalentries']):
+                    writer.add(entry)
+
+                goals = Goal.objects.bulk_create(list(seeder.goals(options['num_goals'])), batch_size=options['batch_size'])
+                for goal in goals:
+                    for task in seeder.tasks(goal, options['num_tasks_per_goal']):
+                        writer.add(task)
+
+                for insight in seeder.insights(options['num_insights']):
+                    writer.add(insight)
+                for suggestion in seeder.suggestions(options['num_suggestions']):
+                    writer.add(suggestion)
+                writer.flush()
+
+    return len(user_ids)
+
+
+def populate_shard(args):
+    """
+    Worker process entry point.
+    """
+    user_ids, options = args
+    try:
+        return populate_users(user_ids, options)
+    finally:
+        connections.close_all()
+
 
 class Command(BaseCommand):
     """
     Django management command to populate the database with realistic dummy data
     for testing purposes. Includes users, moods, mood logs, journal entries,
     goals, tasks, insights, and suggestions.
+
+    Rows are written with batched ``bulk_create`` from a deterministic random
+    stream per user, so large load-test fixtures can be generated quickly and
+    reproduced exactly with the same ``--seed``.
     """
     help = 'Populate the database with realistic dummy data for testing.'
 
@@ -16,33 +259,52 @@ class Command(BaseCommand):
         """
         Add custom command-line arguments for controlling the number of records generated.
         """
-        parser.add_argument('--num-moodlogs', type=int, default=10, help='Number of mood logs to create')
-        parser.add_argument('--num-journalentries', type=int, default=5, help='Number of journal entries to create')
-        parser.add_argument('--num-goals', type=int, default=6, help='Number of goals to create')
+        parser.add_argument('--num-moodlogs', type=int, default=10, help='Number of mood logs to create per user')
+        parser.add_argument('--num-journalentries', type=int, default=5, help='Number of journal entries to create per user')
+        parser.add_argument('--num-goals', type=int, default=6, help='Number of goals to create per user')
         parser.add_argument('--num-tasks-per-goal', type=int, default=3, help='Number of tasks per goal to create')
-        parser.add_argument('--num-insights', type=int, default=5, help='Number of insights to create')
-        parser.add_argument('--num-suggestions', type=int, default=10, help='Number of suggestions to create')
+        parser.add_argument('--num-insights', type=int, default=5, help='Number of insights to create per user')
+        parser.add_argument('--num-suggestions', type=int, default=10, help='Number of suggestions to create per user')
+        parser.add_argument('--num-users', type=int, default=0, help='Number of generated load-test users to add to the demo users')
+        parser.add_argument('--days', type=int, default=30, help='Days of history to spread the generated data over')
+        parser.add_argument('--seed', type=int, default=0, help='Random seed, the same seed reproduces the same data')
+        parser.add_argument('--batch-size', type=int, default=5000, help='Rows per bulk insert')
+        parser.add_argument('--workers', type=int, default=1, help='Parallel worker processes, each seeding a shard of users (PostgreSQL only)')
         parser.add_argument('--only-moods', action='store_true', help='Populate only moods')
 
     def handle(self, *args, **kwargs):
         """
         Execute the command to populate the database with dummy data.
         """
-        num_moodlogs = kwargs['num_moodlogs']
-        num_journalentries = kwargs['num_journalentries']
-        num_goals = kwargs['num_goals']
-        num_tasks_per_goal = kwargs['num_tasks_per_goal']
-        num_insights = kwargs['num_insights']
-        num_suggestions = kwargs['num_suggestions']
+        self.create_moods()
+        if kwargs['only_moods']:
+            self.stdout.write(self.style.SUCCESS('Successfully populated the moods.'))
+            return
 
         self.create_users()
-        self.create_moods()
-        self.create_mood_logs(num_moodlogs)
-        self.create_journal_entries(num_journalentries)
-        self.create_goals_and_tasks(num_goals, num_tasks_per_goal)
-        self.create_insights(num_insights)
-        self.create_suggestions(num_suggestions)
-        self.stdout.write(self.style.SUCCESS('Successfully populated the database with realistic dummy data.'))
+        if kwargs['num_users']:
+            self.create_generated_users(kwargs['num_users'])
+
+        user_ids = list(User.objects.order_by('id').values_list('id', flat=True))
+        workers = max(1, kwargs['workers'])
+        if workers > 1 and connection.vendor == 'sqlite':
+            self.stdout.write(self.style.WARNING('SQLite allows a single writer, seeding without workers.'))
+            workers = 1
+
+        if workers == 1:
+            populate_users(user_ids, kwargs)
+        else:
+            shards = [(user_ids[i::workers], kwargs) for i in range(workers)]
+            # Forked workers must not share the parent's database connection
+            connections.close_all()
+            with multiprocessing.get_context('fork').Pool(workers) as pool:
+                pool.map(populate_shard, shards)
+
+        # Bulk inserts bypass the MoodLog signals that maintain the counters
+        rebuild_mood_counts()
+        self.stdout.write(self.style.SUCCESS(
+            f'Successfully populated the database with realistic dummy data for {len(user_ids)} users.'
+        ))
 
     def create_users(self):
         """
@@ -112,6 +374,29 @@ class Command(BaseCommand):
                 user.profile.save()
                 self.stdout.write(f'Created user: {user.first_name} {user.last_name} ({username}).')
 
+    def create_generated_users(self, num):
+        """
+        Bulk create load-test users ``loaduser000001``... with profiles.
+        They all share the password ``securepassword``.
+        """
+        usernames = [f'loaduser{i:06d}' for i in range(1, num + 1)]
+        existing = set(User.objects.filter(username__in=usernames).values_list('username', flat=True))
+        password = make_password('securepassword')  # Hash once, not once per user
+
+        with transaction.atomic():
+            users = User.objects.bulk_create(
+                [
+                    User(username=username, email=f'{username}@example.com', password=password)
+                    for username in usernames if username not in existing
+                ],
+                batch_size=1000,
+            )
+            UserProfile.objects.bulk_create(
+                [UserProfile(user=user, first_login=False) for user in users],
+                batch_size=1000,
+            )
+        self.stdout.write(f'Created {len(users)} load-test users.')
+
     def create_moods(self):
         """
         Create predefined moods.
@@ -127,111 +412,3 @@ class Command(BaseCommand):
 
         for mood in moods:
             Mood.objects.get_or_create(mood_type=mood['mood_type'], mood_description=mood['description'])
-
-    def create_mood_logs(self, num):
-        """
-        Create mood logs for all users.
-        """
-        users = User.objects.all()
-        moods = list(Mood.objects.all())
-        for user in users:
-            for _ in range(num):
-                MoodLog.objects.create(
-                    user=user,
-                    mood=random.choice(moods),
-                    date_logged=datetime.now() - timedelta(days=random.randint(0, 30)),
-                    notes=random.choice([
-                        "Had a productive meeting at work.",
-                        "Struggled with focus today.",
-                        "Enjoyed a peaceful walk in the park.",
-                        "Feeling positive after accomplishing a task."
-                    ])
-                )
-
-    def create_journal_entries(self, num):
-        """
-        Create journal entries for all users.
-        """
-        users = User.objects.all()
-        for user in users:
-            for _ in range(num):
-                JournalEntry.objects.create(
-                    user=user,
-                    title=f"Reflection on {datetime.now().strftime('%A')}",
-                    content=random.choice([
-                        "Today was a great day! I managed to complete my tasks and had time to relax.",
-                        "Feeling overwhelmed but also learned something new at work.",
-                        "Spent quality time with friends, which helped improve my mood."
-                    ]),
-                    created_at=datetime.now() - timedelta(days=random.randint(0, 30))
-                )
-
-    def create_goals_and_tasks(self, num_goals, num_tasks):
-        """
-        Create goals and their associated tasks.
-        """
-        users = User.objects.all()
-        categories = ['Health', 'Career', 'Personal Development', 'Relationships', 'Fitness']
-        for user in users:
-            for i in range(num_goals):
-                goal = Goal.objects.create(
-                    user=user,
-                    category=random.choice(categories),
-                    title=f"Goal {i + 1}: {random.choice(['Improve fitness', 'Read more books', 'Learn a new skill'])}",
-                    description=f"Work on personal development by achieving {i + 1} milestones.",
-                    start_date=datetime.now() - timedelta(days=random.randint(0, 30)),
-                    completed=random.choice([True, False]),
-                    times_per_day=random.randint(1, 2),
-                    days_per_week=random.randint(1, 7),
-                    duration=random.randint(1, 12),
-                    duration_unit=random.choice(['Days', 'Weeks', 'Months'])
-                )
-
-                for j in range(num_tasks):
-                    Task.objects.create(
-                        goal=goal,
-                        text=f"Task {j + 1} for {goal.title}",
-                        completed=random.choice([True, False])
-                    )
-
-    def create_insights(self, num):
-        """
-        Create insights for all users.
-        """
-        users = User.objects.all()
-        for user in users:
-            for _ in range(num):
-                Insight.objects.create(
-                    user=user,
-                    trigger_word=random.choice(['stress', 'exercise', 'focus', 'happiness', 'relationships']),
-                    time_quantity=random.randint(1, 4),
-                    time_frame=random.choice(['days', 'weeks']),
-                    mood_count=random.randint(1, 10),
-                    created_at=datetime.now() - timedelta(days=random.randint(0, 30))
-                )
-
-    def create_suggestions(self, num):
-        """
-        Create suggestions for all users.
-        """
-        users = User.objects.all()
-        suggestion_texts = [
-            "Create a goal: Go for a walk.",
-            "Journal how your day is going.",
-            "Watch a guided meditation video.",
-            "Take a 5-minute stretch break.",
-            "Write down 3 things you're grateful for.",
-            "Plan your meals for the week.",
-            "Spend 10 minutes reading a book.",
-            "Do a breathing exercise for 2 minutes.",
-            "Declutter your workspace.",
-            "Connect with a friend or loved one.",
-        ]
-
-        for user in users:
-            for _ in range(num):
-                Suggestion.objects.create(
-                    user=user,
-                    text=random.choice(suggestion_texts),
-                    completed=random.choice([True, False])
-                )
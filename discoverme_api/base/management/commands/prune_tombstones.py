@@ -0,0 +1,20 @@
+from datetime import timedelta
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from base.models import Tombstone
+
+class Command(BaseCommand):
+    """
+    Django management command that deletes sync tombstones older than the
+    retention period. Clients with older cursors receive a full reset.
+    """
+    help = 'Delete sync tombstones older than SYNC_TOMBSTONE_RETENTION_DAYS.'
+
+    def handle(self, *args, **kwargs):
+        """
+        Execute the command to prune old tombstones.
+        """
+        cutoff = timezone.now() - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+        deleted, _ = Tombstone.objects.filter(deleted_at__lt=cutoff).delete()
+        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} tombstone(s).'))
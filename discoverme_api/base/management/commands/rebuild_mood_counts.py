@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth.models import User
+from base.aggregates import rebuild_mood_counts
+
+class Command(BaseCommand):
+    """
+    Django management command that recomputes the per-user, per-mood, per-day
+    counters from the MoodLog table.
+    """
+    help = 'Rebuild the daily mood counters from the mood logs.'
+
+    def add_arguments(self, parser):
+        """
+        Add a command-line argument to limit the rebuild to one user.
+        """
+        parser.add_argument('--username', type=str, help='Only rebuild the counters of this user')
+
+    def handle(self, *args, **kwargs):
+        """
+        Execute the command to rebuild the counters.
+        """
+        user = None
+        if kwargs['username']:
+            try:
+                user = User.objects.get(username=kwargs['username'])
+            except User.DoesNotExist:
+                raise CommandError(f"User {kwargs['username']} does not exist.")
+
+        rebuild_mood_counts(user)
+        self.stdout.write(self.style.SUCCESS('Successfully rebuilt the daily mood counters.'))
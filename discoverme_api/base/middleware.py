@@ -0,0 +1,81 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+class WebOnlyMiddleware:
+    """
+    Runs the ``WEB_ONLY_MIDDLEWARE`` chain for everything except API requests.
+
+    Requests under ``API_PATH_PREFIX`` authenticate with JWT only, so they
+    skip the session, CSRF, authentication and messages middleware entirely.
+    The admin and other browser-facing pages still get the full chain,
+    including the ``process_view``/``process_exception`` hooks that the
+    wrapped middleware rely on (e.g. CSRF checks).
+
+    Like the wrapped middleware, it runs natively in both sync and async
+    mode, so async views under ASGI don't pay a thread hop for it.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        self.view_hooks = []
+        self.exception_hooks = []
+        self.template_response_hooks = []
+
+        handler = get_response
+        for path in reversed(settings.WEB_ONLY_MIDDLEWARE):
+            middleware = import_string(path)(handler)
+            if hasattr(middleware, 'process_view'):
+                self.view_hooks.insert(0, middleware.process_view)
+            if hasattr(middleware, 'process_exception'):
+                self.exception_hooks.append(middleware.process_exception)
+            if hasattr(middleware, 'process_template_response'):
+                self.template_response_hooks.append(middleware.process_template_response)
+            handler = middleware
+        self.web_handler = handler
+
+    @staticmethod
+    def is_api(request):
+        return request.path_info.startswith(settings.API_PATH_PREFIX)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if self.is_api(request):
+            return self.get_response(request)
+        return self.web_handler(request)
+
+    async def __acall__(self, request):
+        if self.is_api(request):
+            return await self.get_response(request)
+        return await self.web_handler(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if self.is_api(request):
+            return None
+        for hook in self.view_hooks:
+            response = hook(request, view_func, view_args, view_kwargs)
+            if response is not None:
+                return response
+        return None
+
+    def process_exception(self, request, exception):
+        if self.is_api(request):
+            return None
+        for hook in self.exception_hooks:
+            response = hook(request, exception)
+            if response is not None:
+                return response
+        return None
+
+    def process_template_response(self, request, response):
+        if self.is_api(request):
+            return response
+        for hook in self.template_response_hooks:
+            response = hook(request, response)
+        return response
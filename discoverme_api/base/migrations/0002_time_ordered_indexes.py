@@ -0,0 +1,31 @@
+# Generated by Django 5.1.2 on 2026-10-17 20:38
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='insight',
+            index=models.Index(fields=['user', 'created_at'], name='base_insigh_user_id_7ebc9a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='journalentry',
+            index=models.Index(fields=['user', 'created_at'], name='base_journa_user_id_281a16_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='moodlog',
+            index=models.Index(fields=['user', 'date_logged'], name='base_moodlo_user_id_5286b2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='suggestion',
+            index=models.Index(fields=['user', 'created_at'], name='base_sugges_user_id_56961c_idx'),
+        ),
+    ]
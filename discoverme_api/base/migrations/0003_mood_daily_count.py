@@ -0,0 +1,50 @@
+# Generated by Django 5.1.2 on 2026-10-17 20:39
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+
+
+def backfill_mood_counts(apps, schema_editor):
+    MoodLog = apps.get_model('base', 'MoodLog')
+    MoodDailyCount = apps.get_model('base', 'MoodDailyCount')
+    rows = (
+        MoodLog.objects.annotate(day=TruncDate('date_logged'))
+        .values('user_id', 'mood_id', 'day')
+        .annotate(total=Count('id'))
+        .order_by()
+    )
+    MoodDailyCount.objects.bulk_create(
+        [
+            MoodDailyCount(user_id=row['user_id'], mood_id=row['mood_id'], day=row['day'], count=row['total'])
+            for row in rows.iterator()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0002_time_ordered_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MoodDailyCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('mood', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='base.mood')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='mood_counts', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('user', 'day', 'mood'), name='unique_user_day_mood_count')],
+            },
+        ),
+        migrations.RunPython(backfill_mood_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,69 @@
+from django.db import migrations
+
+# The DDL is frozen here rather than imported from base.search, so later
+# changes to that module don't alter what this migration does.
+
+POSTGRES_CREATE = [
+    "CREATE INDEX IF NOT EXISTS base_journalentry_search_idx ON base_journalentry USING GIN (to_tsvector('english', coalesce(title, '') || ' ' || content))",
+    "CREATE INDEX IF NOT EXISTS base_moodlog_search_idx ON base_moodlog USING GIN (to_tsvector('english', coalesce(notes, '')))",
+]
+
+POSTGRES_DROP = [
+    "DROP INDEX IF EXISTS base_journalentry_search_idx",
+    "DROP INDEX IF EXISTS base_moodlog_search_idx",
+]
+
+SQLITE_CREATE = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS base_journalentry_fts USING fts5(title, content, content='base_journalentry', content_rowid='id', tokenize='porter unicode61')",
+    "DROP TRIGGER IF EXISTS base_journalentry_fts_ai",
+    "DROP TRIGGER IF EXISTS base_journalentry_fts_ad",
+    "DROP TRIGGER IF EXISTS base_journalentry_fts_au",
+    "CREATE TRIGGER base_journalentry_fts_ai AFTER INSERT ON base_journalentry BEGIN INSERT INTO base_journalentry_fts(rowid, title, content) VALUES (new.id, new.title, new.content); END",
+    "CREATE TRIGGER base_journalentry_fts_ad AFTER DELETE ON base_journalentry BEGIN INSERT INTO base_journalentry_fts(base_journalentry_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content); END",
+    "CREATE TRIGGER base_journalentry_fts_au AFTER UPDATE ON base_journalentry BEGIN INSERT INTO base_journalentry_fts(base_journalentry_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content); INSERT INTO base_journalentry_fts(rowid, title, content) VALUES (new.id, new.title, new.content); END",
+    "INSERT INTO base_journalentry_fts(base_journalentry_fts) VALUES ('rebuild')",
+    "CREATE VIRTUAL TABLE IF NOT EXISTS base_moodlog_fts USING fts5(notes, content='base_moodlog', content_rowid='id', tokenize='porter unicode61')",
+    "DROP TRIGGER IF EXISTS base_moodlog_fts_ai",
+    "DROP TRIGGER IF EXISTS base_moodlog_fts_ad",
+    "DROP TRIGGER IF EXISTS base_moodlog_fts_au",
+    "CREATE TRIGGER base_moodlog_fts_ai AFTER INSERT ON base_moodlog BEGIN INSERT INTO base_moodlog_fts(rowid, notes) VALUES (new.id, new.notes); END",
+    "CREATE TRIGGER base_moodlog_fts_ad AFTER DELETE ON base_moodlog BEGIN INSERT INTO base_moodlog_fts(base_moodlog_fts, rowid, notes) VALUES ('delete', old.id, old.notes); END",
+    "CREATE TRIGGER base_moodlog_fts_au AFTER UPDATE ON base_moodlog BEGIN INSERT INTO base_moodlog_fts(base_moodlog_fts, rowid, notes) VALUES ('delete', old.id, old.notes); INSERT INTO base_moodlog_fts(rowid, notes) VALUES (new.id, new.notes); END",
+    "INSERT INTO base_moodlog_fts(base_moodlog_fts) VALUES ('rebuild')",
+]
+
+SQLITE_DROP = [
+    "DROP TRIGGER IF EXISTS base_journalentry_fts_ai",
+    "DROP TRIGGER IF EXISTS base_journalentry_fts_ad",
+    "DROP TRIGGER IF EXISTS base_journalentry_fts_au",
+    "DROP TABLE IF EXISTS base_journalentry_fts",
+    "DROP TRIGGER IF EXISTS base_moodlog_fts_ai",
+    "DROP TRIGGER IF EXISTS base_moodlog_fts_ad",
+    "DROP TRIGGER IF EXISTS base_moodlog_fts_au",
+    "DROP TABLE IF EXISTS base_moodlog_fts",
+]
+
+
+def run_statements(schema_editor, postgres, sqlite):
+    statements = {'postgresql': postgres, 'sqlite': sqlite}.get(schema_editor.connection.vendor, [])
+    for sql in statements:
+        schema_editor.execute(sql)
+
+
+def create_search_index(apps, schema_editor):
+    run_statements(schema_editor, POSTGRES_CREATE, SQLITE_CREATE)
+
+
+def drop_search_index(apps, schema_editor):
+    run_statements(schema_editor, POSTGRES_DROP, SQLITE_DROP)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0003_mood_daily_count'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
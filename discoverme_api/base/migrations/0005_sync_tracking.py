@@ -0,0 +1,108 @@
+# Generated by Django 5.1.2 on 2026-10-17 20:48
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+# Adding columns rebuilds the tables on SQLite, which drops the full-text
+# search triggers created by 0004_full_text_search. The trigger DDL is frozen
+# here rather than imported from base.search. PostgreSQL keeps its indexes.
+SQLITE_TRIGGERS = [
+    "DROP TRIGGER IF EXISTS base_journalentry_fts_ai",
+    "DROP TRIGGER IF EXISTS base_journalentry_fts_ad",
+    "DROP TRIGGER IF EXISTS base_journalentry_fts_au",
+    "CREATE TRIGGER base_journalentry_fts_ai AFTER INSERT ON base_journalentry BEGIN INSERT INTO base_journalentry_fts(rowid, title, content) VALUES (new.id, new.title, new.content); END",
+    "CREATE TRIGGER base_journalentry_fts_ad AFTER DELETE ON base_journalentry BEGIN INSERT INTO base_journalentry_fts(base_journalentry_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content); END",
+    "CREATE TRIGGER base_journalentry_fts_au AFTER UPDATE ON base_journalentry BEGIN INSERT INTO base_journalentry_fts(base_journalentry_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content); INSERT INTO base_journalentry_fts(rowid, title, content) VALUES (new.id, new.title, new.content); END",
+    "INSERT INTO base_journalentry_fts(base_journalentry_fts) VALUES ('rebuild')",
+    "DROP TRIGGER IF EXISTS base_moodlog_fts_ai",
+    "DROP TRIGGER IF EXISTS base_moodlog_fts_ad",
+    "DROP TRIGGER IF EXISTS base_moodlog_fts_au",
+    "CREATE TRIGGER base_moodlog_fts_ai AFTER INSERT ON base_moodlog BEGIN INSERT INTO base_moodlog_fts(rowid, notes) VALUES (new.id, new.notes); END",
+    "CREATE TRIGGER base_moodlog_fts_ad AFTER DELETE ON base_moodlog BEGIN INSERT INTO base_moodlog_fts(base_moodlog_fts, rowid, notes) VALUES ('delete', old.id, old.notes); END",
+    "CREATE TRIGGER base_moodlog_fts_au AFTER UPDATE ON base_moodlog BEGIN INSERT INTO base_moodlog_fts(base_moodlog_fts, rowid, notes) VALUES ('delete', old.id, old.notes); INSERT INTO base_moodlog_fts(rowid, notes) VALUES (new.id, new.notes); END",
+    "INSERT INTO base_moodlog_fts(base_moodlog_fts) VALUES ('rebuild')",
+]
+
+
+def recreate_search_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        for sql in SQLITE_TRIGGERS:
+            schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0004_full_text_search'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    # The search triggers are recreated after the change (and after reversing it).
+    operations = [
+        migrations.RunPython(migrations.RunPython.noop, recreate_search_triggers),
+        migrations.CreateModel(
+            name='Tombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model_name', models.CharField(max_length=50)),
+                ('object_id', models.BigIntegerField()),
+                ('deleted_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='goal',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='journalentry',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='moodlog',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='suggestion',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddIndex(
+            model_name='goal',
+            index=models.Index(fields=['user', 'updated_at'], name='base_goal_user_id_9613fb_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='journalentry',
+            index=models.Index(fields=['user', 'updated_at'], name='base_journa_user_id_bb1dc7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='moodlog',
+            index=models.Index(fields=['user', 'updated_at'], name='base_moodlo_user_id_e61a1b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='suggestion',
+            index=models.Index(fields=['user', 'updated_at'], name='base_sugges_user_id_55d743_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['goal', 'updated_at'], name='base_task_goal_id_026824_idx'),
+        ),
+        migrations.AddField(
+            model_name='tombstone',
+            name='user',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name='tombstones', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='tombstone',
+            index=models.Index(fields=['user', 'deleted_at'], name='base_tombst_user_id_269560_idx'),
+        ),
+        migrations.RunPython(recreate_search_triggers, migrations.RunPython.noop),
+    ]
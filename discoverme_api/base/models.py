@@ -1,7 +1,5 @@
 from django.db import models
 from django.contrib.auth.models import User
-from django.db.models.signals import post_save
-from django.dispatch import receiver
 
 class Mood(models.Model):
     """
@@ -31,16 +29,55 @@ class MoodLog(models.Model):
     :type date_logged: datetime
     :param notes: Additional notes related to the logged mood.
     :type notes: str
+    :param updated_at: The timestamp of the last change, used by delta sync.
+    :type updated_at: datetime
     """
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     mood = models.ForeignKey(Mood, on_delete=models.CASCADE)
     date_logged = models.DateTimeField(auto_now_add=True)
     notes = models.TextField(blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'date_logged']),
+            models.Index(fields=['user', 'updated_at']),
+        ]
 
     def __str__(self):
         return f'{self.user.username} - {self.mood}'
 
 
+class MoodDailyCount(models.Model):
+    """
+    Number of times a user logged a given mood on a given day.
+
+    Kept up to date incrementally by the MoodLog signals in ``base/signals.py``
+    so mood trends can be answered without reading every MoodLog.
+
+    :param user: The user the counter belongs to.
+    :type user: User
+    :param mood: The mood being counted.
+    :type mood: Mood
+    :param day: The (local) day the moods were logged on.
+    :type day: date
+    :param count: Number of mood logs for this user, mood and day.
+    :type count: int
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='mood_counts')
+    mood = models.ForeignKey(Mood, on_delete=models.CASCADE)
+    day = models.DateField()
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'day', 'mood'], name='unique_user_day_mood_count'),
+        ]
+
+    def __str__(self):
+        return f'{self.user.username} - {self.mood} on {self.day}: {self.count}'
+
+
 class JournalEntry(models.Model):
     """
     Represents a user's journal entry with a title, content, and timestamp.
@@ -53,11 +90,20 @@ class JournalEntry(models.Model):
     :type content: str
     :param created_at: The timestamp of when the entry was created.
     :type created_at: datetime
+    :param updated_at: The timestamp of the last change, used by delta sync.
+    :type updated_at: datetime
     """
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     title = models.CharField(max_length=100)
     content = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'created_at']),
+            models.Index(fields=['user', 'updated_at']),
+        ]
 
     def __str__(self):
         return f'{self.title} by {self.user.username}'
@@ -70,11 +116,20 @@ class Suggestion(models.Model):
     :type mood_trigger: str
     :param suggestion_text: The suggestion provided for the trigger.
     :type suggestion_text: str
+    :param updated_at: The timestamp of the last change, used by delta sync.
+    :type updated_at: datetime
     """
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='suggestions')
     text = models.TextField()
     completed = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'created_at']),
+            models.Index(fields=['user', 'updated_at']),
+        ]
 
     def __str__(self):
         return f"Suggestion for {self.mood_trigger}"
@@ -104,6 +159,8 @@ class Goal(models.Model):
     :type duration: int
     :param duration_unit: The unit of time for the duration (e.g., "Weeks").
     :type duration_unit: str
+    :param updated_at: The timestamp of the last change, used by delta sync.
+    :type updated_at: datetime
     """
     CATEGORY_CHOICES = {
         'FIT': 'Get Fit',
@@ -133,10 +190,12 @@ class Goal(models.Model):
     days_per_week = models.PositiveIntegerField(default=1)
     duration = models.PositiveIntegerField(default=1)
     duration_unit = models.CharField(max_length=10, choices=DURATION_UNIT_CHOICES, default='WEEKS')
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         indexes = [
             models.Index(fields=['user', 'start_date']),
+            models.Index(fields=['user', 'updated_at']),
         ]
 
     def __str__(self):
@@ -155,11 +214,19 @@ class Task(models.Model):
     :type text: str
     :param completed: Indicates whether the task has been completed.
     :type completed: bool
+    :param updated_at: The timestamp of the last change, used by delta sync.
+    :type updated_at: datetime
     """
     goal = models.ForeignKey(Goal, related_name='tasks', on_delete=models.CASCADE)
     text = models.CharField(max_length=255)
     completed = models.BooleanField(default=False)
     completed_on = models.DateTimeField(blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['goal', 'updated_at']),
+        ]
 
     def __str__(self):
         """
@@ -198,10 +265,48 @@ class Insight(models.Model):
     mood_count = models.IntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'created_at']),
+        ]
+
     def __str__(self):
         return f"Mood Insight Trends for {self.user.username} on {self.trigger_word} over {self.time_frame}"
 
 
+class Tombstone(models.Model):
+    """
+    Records the deletion of a synced object so clients can drop their copy.
+
+    The user reference has no database constraint, so a tombstone written
+    while the user is being deleted cannot fail the deletion; the signals
+    in ``base/signals.py`` skip and clean those up. Tombstones older than
+    ``SYNC_TOMBSTONE_RETENTION_DAYS`` are pruned on sync and by the
+    ``prune_tombstones`` command.
+
+    :param user: The user who owned the deleted object.
+    :type user: User
+    :param model_name: Lowercase name of the deleted object's model (e.g., "moodlog").
+    :type model_name: str
+    :param object_id: Primary key of the deleted object.
+    :type object_id: int
+    :param deleted_at: The timestamp of the deletion.
+    :type deleted_at: datetime
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, db_constraint=False, related_name='tombstones')
+    model_name = models.CharField(max_length=50)
+    object_id = models.BigIntegerField()
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'deleted_at']),
+        ]
+
+    def __str__(self):
+        return f"Deleted {self.model_name} {self.object_id} of user {self.user_id}"
+
+
 class UserProfile(models.Model):
     """
     Extends the default User model with additional fields.
@@ -230,26 +335,32 @@ class UserProfile(models.Model):
     def __str__(self):
         return f"Profile for {self.user.username}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
 
-@receiver(post_save, sender=User)
-def create_user_profile(sender, instance, created, **kwargs):
-    """
-    Signal to create a UserProfile instance when a User is created.
-
-    :param sender: The model class that triggered the signal.
-    :param instance: The instance of the User model.
-    :param created: A boolean indicating whether a new User was created.
-    """
-    if created:
-        UserProfile.objects.create(user=instance)
-
-
-@receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
-    """
-    Signal to save the UserProfile whenever the associated User is saved.
+    def get_dirty_fields(self):
+        """
+        Returns the names of the fields changed since the profile was loaded or
+        saved, or ``None`` if that is unknown (a new or partially loaded profile).
+        """
+        loaded = getattr(self, '_loaded_values', None)
+        fields = self._meta.concrete_fields
+        if loaded is None or len(loaded) < len(fields):
+            return None
+        return [f.attname for f in fields if getattr(self, f.attname) != loaded[f.attname]]
 
-    :param sender: The model class that triggered the signal.
-    :param instance: The instance of the User model.
-    """
-    instance.profile.save()
+    def save(self, *args, **kwargs):
+        """
+        Saves only the changed fields, and skips the write when nothing changed.
+        """
+        if not args and kwargs.get('update_fields') is None and not self._state.adding:
+            dirty = self.get_dirty_fields()
+            if dirty == []:
+                return
+            if dirty:
+                kwargs['update_fields'] = dirty
+        super().save(*args, **kwargs)
+        self._loaded_values = {f.attname: getattr(self, f.attname) for f in self._meta.concrete_fields}
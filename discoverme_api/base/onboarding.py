@@ -0,0 +1,55 @@
+import logging
+from django.db import DatabaseError, transaction
+from emails.messages import send_welcome_email
+from .models import Suggestion, UserProfile
+
+logger = logging.getLogger(__name__)
+
+# Suggestions every new user starts with
+DEFAULT_SUGGESTIONS = [
+    "Create a goal: Go for a walk.",
+    "Journal how your day is going.",
+    "Watch a guided meditation video.",
+    "Take a 5-minute stretch break.",
+    "Write down 3 things you're grateful for.",
+]
+
+# Extra suggestions for the user's first login
+FIRST_LOGIN_SUGGESTIONS = [
+    "Plan your meals for the week.",
+    "Declutter your workspace.",
+    "Connect with a friend or loved one.",
+]
+
+def onboard_user(user):
+    """
+    Sets up a newly registered user in one transaction.
+
+    Creates the profile (with the first-login onboarding already applied),
+    all default suggestions in a single insert, and queues the welcome email,
+    so registration costs the same handful of queries however many
+    suggestions there are.
+
+    :param user: The newly created user.
+    :type user: User
+    :return: The user's profile, also cached on ``user.profile``.
+    :rtype: UserProfile
+    """
+    with transaction.atomic():
+        profile = UserProfile.objects.create(user=user, first_login=False)
+        Suggestion.objects.bulk_create([
+            Suggestion(user=user, text=text)
+            for text in DEFAULT_SUGGESTIONS + FIRST_LOGIN_SUGGESTIONS
+        ])
+
+        # A welcome email that can't be built (e.g. a missing template) is
+        # logged rather than failing the registration. A database error has
+        # broken the transaction, so it still propagates.
+        try:
+            send_welcome_email(user)
+        except DatabaseError:
+            raise
+        except Exception:
+            logger.exception('Failed to queue welcome email to %s', user.email)
+
+    return profile
@@ -0,0 +1,43 @@
+from django.conf import settings
+from rest_framework.pagination import CursorPagination
+
+
+class UserCursorPagination(CursorPagination):
+    """
+    Keyset (cursor) pagination for the per-user list endpoints.
+
+    Each viewset declares its own ``cursor_ordering``, a time field followed by
+    ``id`` as a tie-breaker, so every page is fetched with an indexed range scan
+    instead of an OFFSET. Existing clients that don't send ``cursor`` or
+    ``page_size`` keep receiving the full, unpaginated list unless
+    ``API_PAGINATE_BY_DEFAULT`` is enabled.
+    """
+    page_size_query_param = 'page_size'
+    default_ordering = ('-id',)
+
+    def get_page_size(self, request):
+        """
+        Resolve the page size from the request, falling back to ``API_PAGE_SIZE``
+        and capping it at ``API_MAX_PAGE_SIZE``.
+        """
+        self.page_size = getattr(settings, 'API_PAGE_SIZE', 50)
+        self.max_page_size = getattr(settings, 'API_MAX_PAGE_SIZE', 500)
+        return super().get_page_size(request)
+
+    def get_ordering(self, request, queryset, view):
+        """
+        Use the ordering declared on the view, e.g. ``('-date_logged', '-id')``.
+        """
+        return tuple(getattr(view, 'cursor_ordering', self.default_ordering))
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Paginate only when the client asked for it or pagination is forced on.
+        """
+        requested = (
+            self.cursor_query_param in request.query_params
+            or self.page_size_query_param in request.query_params
+        )
+        if not requested and not getattr(settings, 'API_PAGINATE_BY_DEFAULT', False):
+            return None
+        return super().paginate_queryset(queryset, request, view)
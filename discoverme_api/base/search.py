@@ -0,0 +1,99 @@
+import re
+from django.db import connection
+from django.db.models import Q
+from .models import JournalEntry, MoodLog
+
+# Full-text search over journal entries and mood log notes.
+#
+# PostgreSQL uses GIN indexes on to_tsvector expressions. SQLite (dev) uses
+# external-content FTS5 tables kept in sync by triggers. Both are created by
+# migration 0004_full_text_search, which keeps its own copy of the DDL; a
+# later migration that rebuilds base_journalentry or base_moodlog on SQLite
+# must recreate the triggers itself (see 0005_sync_tracking), since a table
+# rebuild drops them. Other databases fall back to unranked substring matches.
+
+JOURNAL_VECTOR = "to_tsvector('english', coalesce(title, '') || ' ' || content)"
+MOODLOG_VECTOR = "to_tsvector('english', coalesce(notes, ''))"
+
+POSTGRES_SEARCH = f"""
+    SELECT 'journalentry' AS kind, id, ts_rank({JOURNAL_VECTOR}, query) AS rank
+    FROM base_journalentry, plainto_tsquery('english', %s) query
+    WHERE user_id = %s AND {JOURNAL_VECTOR} @@ query
+    UNION ALL
+    SELECT 'moodlog' AS kind, id, ts_rank({MOODLOG_VECTOR}, query) AS rank
+    FROM base_moodlog, plainto_tsquery('english', %s) query
+    WHERE user_id = %s AND {MOODLOG_VECTOR} @@ query
+    ORDER BY rank DESC, id DESC
+    LIMIT %s OFFSET %s
+"""
+
+SQLITE_SEARCH = """
+    SELECT 'journalentry' AS kind, e.id AS id, -bm25(base_journalentry_fts) AS rank
+    FROM base_journalentry_fts JOIN base_journalentry e ON e.id = base_journalentry_fts.rowid
+    WHERE base_journalentry_fts MATCH %s AND e.user_id = %s
+    UNION ALL
+    SELECT 'moodlog' AS kind, m.id AS id, -bm25(base_moodlog_fts) AS rank
+    FROM base_moodlog_fts JOIN base_moodlog m ON m.id = base_moodlog_fts.rowid
+    WHERE base_moodlog_fts MATCH %s AND m.user_id = %s
+    ORDER BY rank DESC, id DESC
+    LIMIT %s OFFSET %s
+"""
+
+
+def fts5_query(text):
+    """
+    Turns free text into an FTS5 query matching every word, with the last
+    word used as a prefix so results update while the user types.
+    """
+    words = re.findall(r'\w+', text)
+    if not words:
+        return None
+    terms = [f'"{word}"' for word in words]
+    terms[-1] += '*'
+    return ' '.join(terms)
+
+
+def substring_search(user, text, limit, offset):
+    """
+    Unranked, unindexed fallback for databases without full-text search:
+    case-insensitive substring matches, newest first.
+    """
+    entries = (
+        JournalEntry.objects.filter(user=user).filter(Q(title__icontains=text) | Q(content__icontains=text))
+        .order_by('-created_at').values_list('created_at', 'id')[:offset + limit]
+    )
+    logs = (
+        MoodLog.objects.filter(user=user, notes__icontains=text)
+        .order_by('-date_logged').values_list('date_logged', 'id')[:offset + limit]
+    )
+    hits = [(when, 'journalentry', pk) for when, pk in entries] + [(when, 'moodlog', pk) for when, pk in logs]
+    hits.sort(reverse=True)
+    return [(kind, pk, 0.0) for when, kind, pk in hits[offset:offset + limit]]
+
+
+def search_history(user, text, limit=20, offset=0):
+    """
+    Searches a user's journal entries and mood log notes.
+
+    :param user: The user whose history is searched.
+    :param text: The free-text search query.
+    :param limit: Maximum number of hits to return.
+    :param offset: Number of hits to skip.
+    :return: A list of ``(kind, id, rank)`` tuples, best match first, where
+        kind is ``'journalentry'`` or ``'moodlog'``.
+    :rtype: list
+    """
+    if connection.vendor == 'postgresql':
+        sql = POSTGRES_SEARCH
+        query = text
+    elif connection.vendor == 'sqlite':
+        sql = SQLITE_SEARCH
+        query = fts5_query(text)
+        if query is None:
+            return []
+    else:
+        return substring_search(user, text, limit, offset)
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [query, user.id, query, user.id, limit, offset])
+        return [(kind, pk, rank) for kind, pk, rank in cursor.fetchall()]
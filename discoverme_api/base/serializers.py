@@ -1,5 +1,69 @@
 from rest_framework import serializers
 from .models import Mood, MoodLog, JournalEntry, Suggestion, Goal, Insight, UserProfile, Task
+from .aggregates import trigger_word_count
+from .completion import apply_task_completion
+from .catalog import get_mood_catalog, invalidate_stale_catalog
+
+
+def is_object_id(value):
+    """
+    Returns whether ``value`` is usable as an integer primary key (booleans excluded).
+    """
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+class BulkListSerializer(serializers.ListSerializer):
+    """
+    List serializer that writes many objects with ``bulk_create``/``bulk_update``.
+
+    For updates, ``instance`` is a dict of objects by id and every item is
+    validated against the object matching its ``id``. A child serializer may
+    define ``before_bulk_save(objs)`` to apply side effects that the model
+    signals would normally run; it returns any extra fields it changed.
+    """
+    def run_child_validation(self, data):
+        if self.instance is not None:
+            if not isinstance(data, dict) or 'id' not in data:
+                raise serializers.ValidationError({'id': ['This field is required.']})
+            if not is_object_id(data['id']):
+                raise serializers.ValidationError({'id': ['A valid integer is required.']})
+            instance = self.instance.get(data['id'])
+            if instance is None:
+                raise serializers.ValidationError({'id': ['Object not found.']})
+            self.child.instance = instance
+            self.child.initial_data = data
+        return super().run_child_validation(data)
+
+    def before_bulk_save(self, objs):
+        hook = getattr(self.child, 'before_bulk_save', None)
+        return hook(objs) if hook else []
+
+    def create(self, validated_data):
+        ModelClass = self.child.Meta.model
+        objs = [ModelClass(**attrs) for attrs in validated_data]
+        self.before_bulk_save(objs)
+        return ModelClass.objects.bulk_create(objs)
+
+    def update(self, instance, validated_data):
+        ModelClass = self.child.Meta.model
+        objs = []
+        fields = set()
+        for item, attrs in zip(self.initial_data, validated_data):
+            obj = instance[item['id']]
+            for attr, value in attrs.items():
+                setattr(obj, attr, value)
+            fields.update(attrs)
+            objs.append(obj)
+        fields.update(self.before_bulk_save(objs))
+        if fields:
+            # bulk_update skips Model.save(), so refresh auto_now timestamps here
+            for field in ModelClass._meta.concrete_fields:
+                if getattr(field, 'auto_now', False):
+                    for obj in objs:
+                        field.pre_save(obj, add=False)
+                    fields.add(field.name)
+            ModelClass.objects.bulk_update(objs, fields)
+        return objs
 
 class MoodSerializer(serializers.ModelSerializer):
     """
@@ -10,15 +74,59 @@ class MoodSerializer(serializers.ModelSerializer):
         fields = ['id', 'mood_type', 'mood_description']
 
 
+class MoodField(serializers.PrimaryKeyRelatedField):
+    """
+    Mood reference validated against the in-memory mood catalog instead of
+    a query per request.
+    """
+    def to_internal_value(self, data):
+        if isinstance(data, bool):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+
+        catalog = get_mood_catalog()
+        mood = catalog.get(pk)
+        if mood is None:
+            # The mood may have been added without signals (e.g. bulk_create)
+            # after the catalog was loaded, so check the database once.
+            mood = Mood.objects.filter(pk=pk).first()
+            if mood is None:
+                self.fail('does_not_exist', pk_value=data)
+            invalidate_stale_catalog(catalog)
+        return mood
+
+
 class MoodLogSerializer(serializers.ModelSerializer):
     """
     Serializer for the MoodLog model.
     """
-    mood = serializers.PrimaryKeyRelatedField(queryset=Mood.objects.all())  # Allows referencing an existing Mood by ID
+    mood = MoodField(queryset=Mood.objects.all())  # Allows referencing an existing Mood by ID
 
     class Meta:
         model = MoodLog
         fields = ['id', 'mood', 'date_logged', 'notes']
+        list_serializer_class = BulkListSerializer
+
+
+class ExpandedMoodLogSerializer(MoodLogSerializer):
+    """
+    Read-only MoodLog representation that embeds the mood instead of its ID.
+
+    Pair it with a queryset using ``select_related('mood')`` so the moods
+    come from the same query as the logs.
+    """
+    mood = MoodSerializer(read_only=True)
+
+
+def get_expand(query_params):
+    """
+    Returns the set of relations named in the ``expand`` query parameter,
+    e.g. ``?expand=mood``.
+    """
+    return {name.strip() for name in query_params.get('expand', '').split(',') if name.strip()}
 
 
 class JournalEntrySerializer(serializers.ModelSerializer):
@@ -38,6 +146,7 @@ class SuggestionSerializer(serializers.ModelSerializer):
         model = Suggestion
         fields = ['id', 'user', 'text', 'completed', 'created_at']
         read_only_fields = ['id', 'created_at']
+        list_serializer_class = BulkListSerializer
 
 
 class TaskSerializer(serializers.ModelSerializer):
@@ -48,6 +157,31 @@ class TaskSerializer(serializers.ModelSerializer):
         model = Task
         fields = ['id', 'goal', 'text', 'completed', 'completed_on']
         read_only_fields = ['goal', 'completed_on']  # Prevent modifications to `completed_on`
+        list_serializer_class = BulkListSerializer
+
+    def before_bulk_save(self, tasks):
+        """
+        Applies the completion side effects of the Task pre_save signal,
+        which bulk writes bypass.
+        """
+        for task in tasks:
+            apply_task_completion(task)
+        return ['completed_on']
+
+
+class TaskCreateSerializer(TaskSerializer):
+    """
+    Serializer for creating tasks in bulk, where each task names its goal.
+    """
+    goal = serializers.PrimaryKeyRelatedField(queryset=Goal.objects.all())
+
+    class Meta(TaskSerializer.Meta):
+        read_only_fields = ['completed_on']
+
+    def validate_goal(self, goal):
+        if goal.user_id != self.context['request'].user.id:
+            raise serializers.ValidationError('Goal not found or does not belong to the user.')
+        return goal
 
 class GoalSerializer(serializers.ModelSerializer):
     """
@@ -68,14 +202,29 @@ class GoalSerializer(serializers.ModelSerializer):
 class InsightSerializer(serializers.ModelSerializer):
     """
     Serializer for the Insight model.
+
+    ``current_mood_count`` is read from the daily mood counters each time the
+    insight is rendered: how often the user logged the mood named by the
+    trigger word over the insight's window, or ``null`` if the trigger word
+    names no mood.
     """
+    current_mood_count = serializers.SerializerMethodField()
+
     class Meta:
         model = Insight
         fields = [
             'id', 'trigger_word', 'time_quantity', 
-            'time_frame', 'mood_count', 'created_at'
+            'time_frame', 'mood_count', 'current_mood_count', 'created_at'
         ]
 
+    def get_current_mood_count(self, insight):
+        # The context is shared by every insight of a list, so each window
+        # is counted once per response.
+        return trigger_word_count(
+            insight.user_id, insight.trigger_word, insight.time_quantity, insight.time_frame,
+            window_counts=self.context.setdefault('window_counts', {}),
+        )
+
 
 class UserProfileSerializer(serializers.ModelSerializer):
     """
@@ -84,3 +233,20 @@ class UserProfileSerializer(serializers.ModelSerializer):
     class Meta:
         model = UserProfile
         fields = ['location', 'occupation', 'city', 'state', 'pronouns']
+
+
+class MoodCountSerializer(serializers.Serializer):
+    """
+    Serializer for the query parameters of the mood counts endpoint.
+    """
+    time_quantity = serializers.IntegerField(min_value=1, max_value=3650, default=1)
+    time_frame = serializers.ChoiceField(choices=['days', 'weeks', 'months', 'years'], default='weeks')
+
+
+class SearchQuerySerializer(serializers.Serializer):
+    """
+    Serializer for the query parameters of the search endpoint.
+    """
+    q = serializers.CharField(max_length=200)
+    limit = serializers.IntegerField(min_value=1, max_value=100, default=20)
+    offset = serializers.IntegerField(min_value=0, default=0)
@@ -1,90 +1,192 @@
-from django.db.models.signals import post_save, pre_save
+from django.db import transaction
+from django.db.models.signals import post_save, pre_save, pre_delete, post_delete
 from django.dispatch import receiver
 from django.contrib.auth.models import User
 from django.contrib.auth.signals import user_logged_in
-from .models import Suggestion, Task, Goal
-from django.utils.timezone import now
-from emails.messages import send_welcome_email, send_congrats_email
+from .models import Mood, Suggestion, Task, Goal, MoodLog, JournalEntry, Insight, Tombstone, UserProfile
+from .aggregates import adjust_mood_count, mood_log_day
+from .cache import AUTH_CACHE_SCOPE, CACHE_SCOPES, MODEL_CACHE_SCOPES, bump_versions, incr_versions
+from .completion import apply_goal_completion, apply_task_completion
+from .onboarding import onboard_user
+from .catalog import incr_catalog_version, invalidate_mood_catalog
 
-@receiver(post_save, sender=User)
-def generate_suggestions_for_new_user(sender, instance, created, **kwargs):
+def deleted_through(origin, *models):
     """
-    Generate default suggestions for a newly created user.
+    Returns whether a deletion was started on an instance or queryset of one
+    of ``models``, i.e. the object is going as part of that cascade.
     """
-    if created:
-        # List of default suggestions
-        default_suggestions = [
-            "Create a goal: Go for a walk.",
-            "Journal how your day is going.",
-            "Watch a guided meditation video.",
-            "Take a 5-minute stretch break.",
-            "Write down 3 things you're grateful for."
-        ]
+    return isinstance(origin, models) or getattr(origin, 'model', None) in models
 
-        # Create suggestions for the new user
-        Suggestion.objects.bulk_create([
-            Suggestion(user=instance, text=text)
-            for text in default_suggestions
-        ])
-        print(f"Suggestions created for user: {instance.username}")
 
 @receiver(post_save, sender=User)
 def handle_user_created(sender, instance, created, **kwargs):
     """
-    Handle actions when a user is created.
+    Runs the onboarding pipeline for a new user.
+
+    For an existing user, the profile is only saved when it was loaded
+    through ``user.profile``, so routine saves such as the ``last_login``
+    update on each login neither query nor write it.
     """
     if created:
-        print(f"New user created: {instance.username}")
-
-        if hasattr(instance, 'profile') and instance.profile.first_login:
-                additional_suggestions = [
-                    "Plan your meals for the week.",
-                    "Declutter your workspace.",
-                    "Connect with a friend or loved one."
-                ]
-                # Create suggestions
-                Suggestion.objects.bulk_create([
-                    Suggestion(user=instance, text=text)
-                    for text in additional_suggestions
-                ])
-
-                # Update first_login field
-                instance.profile.first_login = False
-                instance.profile.save()
-                # Send a welcome email
-                try:
-                    send_welcome_email(instance)
-                    print(f"Welcome email sent to {instance.email}")
-                except Exception as e:
-                    print(f"Failed to send email to {instance.email}: {str(e)}")
+        onboard_user(instance)
+    elif User.profile.is_cached(instance):
+        instance.profile.save()
 
 @receiver(pre_save, sender=Task)
 def update_task_completed_on(sender, instance, **kwargs):
     """
     Updates the completed_on field when the completed status of a Task changes to True
-    and sends a congratulatory email.
+    and queues a congratulatory email.
     """
-    if instance.completed and not instance.completed_on:
-        instance.completed_on = now()
-        # Send congratulatory email
-        try:
-            send_congrats_email(instance.goal.user, f"{instance.text}")
-            print(f"Congrats email sent for task: {instance.text}")
-        except Exception as e:
-            print(f"Failed to send congrats email for task: {instance.text}. Error: {str(e)}")
+    apply_task_completion(instance)
 
 
 @receiver(pre_save, sender=Goal)
 def update_goal_completed_on(sender, instance, **kwargs):
     """
     Updates the completed_on field when the completed status of a Goal changes to True
-    and sends a congratulatory email.
-    """
-    if instance.completed and not instance.completed_on:
-        instance.completed_on = now()
-        # Send congratulatory email
-        try:
-            send_congrats_email(instance.user, f"{instance.title}")
-            print(f"Congrats email sent for goal: {instance.title}")
-        except Exception as e:
-            print(f"Failed to send congrats email for goal: {instance.title}. Error: {str(e)}")
+    and queues a congratulatory email.
+    """
+    apply_goal_completion(instance)
+
+
+@receiver(pre_save, sender=MoodLog)
+def remember_previous_mood_log(sender, instance, **kwargs):
+    """
+    Remembers which daily mood counter an edited MoodLog counted towards
+    before the edit, so it can be moved to the new one after saving.
+    """
+    instance._previous_count_key = None
+    if instance.pk:
+        previous = MoodLog.objects.filter(pk=instance.pk).values('user_id', 'mood_id', 'date_logged').first()
+        if previous:
+            instance._previous_count_key = (
+                previous['user_id'], previous['mood_id'], mood_log_day(previous['date_logged'])
+            )
+
+
+@receiver(post_save, sender=MoodLog)
+def update_mood_counts_on_save(sender, instance, **kwargs):
+    """
+    Increments the daily mood counter for a new MoodLog, or moves the count
+    when an edit changes its mood or day.
+    """
+    key = (instance.user_id, instance.mood_id, mood_log_day(instance.date_logged))
+    previous = getattr(instance, '_previous_count_key', None)
+    if previous == key:
+        return
+    with transaction.atomic():
+        if previous:
+            adjust_mood_count(*previous, -1)
+        adjust_mood_count(*key, 1)
+
+
+@receiver(post_delete, sender=MoodLog)
+def update_mood_counts_on_delete(sender, instance, origin=None, **kwargs):
+    """
+    Decrements the daily mood counter when a MoodLog is deleted.
+
+    Deleting a user or a mood cascades to its counters as well as its mood
+    logs, so those cascades skip the per-log updates.
+    """
+    if deleted_through(origin, User, Mood):
+        return
+    adjust_mood_count(instance.user_id, instance.mood_id, mood_log_day(instance.date_logged), -1)
+
+
+@receiver(post_save, sender=User)
+def reset_cached_responses(sender, instance, created, **kwargs):
+    """
+    Starts a new user with fresh cache versions, so responses cached for a
+    deleted user with the same id are never served. A new user has no rows
+    a concurrent request could cache, so this doesn't wait for the commit.
+    """
+    if created:
+        incr_versions(instance.pk, CACHE_SCOPES + (AUTH_CACHE_SCOPE,))
+
+
+@receiver([post_save, post_delete], sender=User)
+@receiver([post_save, post_delete], sender=UserProfile)
+def invalidate_cached_user(sender, instance, **kwargs):
+    """
+    Drops the user and profile cached for JWT authentication.
+    """
+    user_id = instance.pk if sender is User else instance.user_id
+    bump_versions(user_id, AUTH_CACHE_SCOPE)
+
+
+@receiver([post_save, post_delete], sender=MoodLog)
+@receiver([post_save, post_delete], sender=JournalEntry)
+@receiver([post_save, post_delete], sender=Suggestion)
+@receiver([post_save, post_delete], sender=Insight)
+@receiver([post_save, post_delete], sender=Goal)
+@receiver([post_save, post_delete], sender=Task)
+def invalidate_cached_responses(sender, instance, origin=None, **kwargs):
+    """
+    Invalidates the owner's cached responses for the changed model. Tasks
+    deleted with their goal are covered by the goal's invalidation, which
+    also drops the task scope, so they don't each load their goal.
+    """
+    if sender is Task and deleted_through(origin, Goal):
+        return
+    user_id = instance.goal.user_id if sender is Task else instance.user_id
+    bump_versions(user_id, *MODEL_CACHE_SCOPES[sender._meta.model_name])
+
+
+@receiver(pre_delete, sender=Goal)
+def remember_deleted_tasks(sender, instance, origin=None, **kwargs):
+    """
+    Remembers the ids of a goal's tasks before the cascade deletes them, so
+    their tombstones are written together with the goal's.
+    """
+    if not deleted_through(origin, User):
+        instance._deleted_task_ids = list(instance.tasks.values_list('id', flat=True))
+
+
+@receiver(post_delete, sender=MoodLog)
+@receiver(post_delete, sender=JournalEntry)
+@receiver(post_delete, sender=Suggestion)
+@receiver(post_delete, sender=Goal)
+@receiver(post_delete, sender=Task)
+def record_tombstone(sender, instance, origin=None, **kwargs):
+    """
+    Records deletions of synced objects for the delta-sync endpoint, except
+    while the owner's whole account is being deleted. The tombstones of a
+    goal's tasks are written in one query with the goal's.
+    """
+    if deleted_through(origin, User):
+        return
+    if sender is Task:
+        if deleted_through(origin, Goal):
+            return
+        user_id = instance.goal.user_id
+    else:
+        user_id = instance.user_id
+    tombstones = [Tombstone(user_id=user_id, model_name=sender._meta.model_name, object_id=instance.pk)]
+    if sender is Goal:
+        tombstones += [
+            Tombstone(user_id=user_id, model_name='task', object_id=task_id)
+            for task_id in getattr(instance, '_deleted_task_ids', ())
+        ]
+    Tombstone.objects.bulk_create(tombstones)
+
+
+@receiver(post_delete, sender=User)
+def delete_user_tombstones(sender, instance, **kwargs):
+    """
+    Removes any tombstones left for a deleted user. The user reference has
+    no database constraint, so nothing else cleans them up.
+    """
+    Tombstone.objects.filter(user_id=instance.pk).delete()
+
+
+@receiver([post_save, post_delete], sender=Mood)
+def reload_mood_catalog(sender, instance, created=False, **kwargs):
+    """
+    Makes every process reload the in-memory mood catalog once the change
+    commits. A new mood also bumps the version straight away, so a catalog
+    still holding a rolled-back mood with the same id is never used.
+    """
+    if created:
+        incr_catalog_version()
+    invalidate_mood_catalog()
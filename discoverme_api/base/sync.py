@@ -0,0 +1,156 @@
+import base64
+import json
+from datetime import datetime, timedelta
+from django.conf import settings
+from django.utils import timezone
+from .models import MoodLog, JournalEntry, Goal, Task, Suggestion, Tombstone
+from .serializers import (
+    MoodLogSerializer, JournalEntrySerializer, GoalSerializer, TaskSerializer, SuggestionSerializer
+)
+
+# Collections returned by the sync endpoint: model, serializer and the lookup
+# from the model to its owner.
+SYNC_COLLECTIONS = {
+    'moodlogs': (MoodLog, MoodLogSerializer, 'user'),
+    'journalentries': (JournalEntry, JournalEntrySerializer, 'user'),
+    'goals': (Goal, GoalSerializer, 'user'),
+    'tasks': (Task, TaskSerializer, 'goal__user'),
+    'suggestions': (Suggestion, SuggestionSerializer, 'user'),
+}
+
+SYNCED_MODELS = {model._meta.model_name for model, _, _ in SYNC_COLLECTIONS.values()}
+
+
+def encode_cursor(moment, collection=None, after=None):
+    """
+    Returns the opaque cursor a client sends back on its next sync. A cursor
+    part-way through a full reset also records the collection and the last
+    id sent.
+    """
+    if collection is None:
+        payload = moment.isoformat()
+    else:
+        payload = json.dumps({'since': moment.isoformat(), 'collection': collection, 'after': after})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor):
+    """
+    Returns the moment encoded in a cursor and, for a cursor part-way
+    through a full reset, the ``(collection, after)`` position to resume
+    from (otherwise ``None``).
+
+    :raises ValueError: If the cursor is malformed.
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor.encode()).decode()
+        position = None
+        if payload.startswith('{'):
+            data = json.loads(payload)
+            payload = data['since']
+            position = (data['collection'], int(data['after']))
+            if position[0] not in SYNC_COLLECTIONS:
+                raise ValueError(position[0])
+        moment = datetime.fromisoformat(payload)
+    except (UnicodeError, ValueError, TypeError, KeyError) as e:
+        raise ValueError('Invalid sync cursor.') from e
+    if timezone.is_naive(moment):
+        raise ValueError('Invalid sync cursor.')
+    return moment, position
+
+
+def reset_page(user, since, position=None):
+    """
+    Returns one page of a full reset: every object of the user by collection
+    and id, at most ``SYNC_PAGE_SIZE`` objects per page.
+
+    The final page's cursor is the moment the reset started, so the next
+    sync picks up whatever changed while the client was paging.
+
+    :param since: The moment the reset started.
+    :param position: ``(collection, after)`` to resume from, or ``None`` for the first page.
+    """
+    names = list(SYNC_COLLECTIONS)
+    start, after = (names.index(position[0]), position[1]) if position else (0, 0)
+    changes = {name: {'updated': [], 'deleted': []} for name in names}
+    remaining = settings.SYNC_PAGE_SIZE
+    next_position = None
+
+    for name in names[start:]:
+        if not remaining:
+            next_position = (name, after)
+            break
+        model, serializer_class, owner = SYNC_COLLECTIONS[name]
+        queryset = model.objects.filter(**{owner: user}, id__gt=after).order_by('id')
+        if model is Goal:
+            queryset = queryset.prefetch_related('tasks')
+        rows = list(queryset[:remaining + 1])
+        if len(rows) > remaining:
+            rows = rows[:remaining]
+            next_position = (name, rows[-1].id)
+        changes[name]['updated'] = serializer_class(rows, many=True).data
+        if next_position:
+            break
+        remaining -= len(rows)
+        after = 0
+
+    return {
+        'cursor': encode_cursor(since, *next_position) if next_position else encode_cursor(since),
+        'reset': position is None,
+        'has_more': next_position is not None,
+        'changes': changes,
+    }
+
+
+def changes_since(user, cursor=None):
+    """
+    Collects the user's objects changed and deleted since ``cursor``.
+
+    Changes are read from a few seconds before the cursor
+    (``SYNC_CURSOR_OVERLAP``) so rows committed by transactions still open
+    at the previous sync are not missed; clients apply them idempotently by id.
+    Without a cursor, or with one older than the tombstone retention, the
+    client starts over: the first page of a full reset is returned with
+    ``reset`` set, and the client keeps syncing while ``has_more`` is set.
+    The user's expired tombstones are pruned along the way.
+
+    :param user: The user to sync.
+    :param cursor: The cursor returned by the previous sync, if any.
+    :return: A dict with the new ``cursor``, the ``reset`` and ``has_more``
+        flags and, per collection, the ``updated`` objects and ``deleted`` ids.
+    :rtype: dict
+    :raises ValueError: If the cursor is malformed.
+    """
+    started = timezone.now()
+    since, position = decode_cursor(cursor) if cursor else (None, None)
+    cutoff = started - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+    Tombstone.objects.filter(user=user, deleted_at__lt=cutoff).delete()
+
+    if since is None or since < cutoff:
+        return reset_page(user, started)
+    if position is not None:
+        return reset_page(user, since, position)
+
+    since -= timedelta(seconds=settings.SYNC_CURSOR_OVERLAP)
+    deleted = {name: [] for name in SYNCED_MODELS}
+    tombstones = Tombstone.objects.filter(user=user, deleted_at__gt=since).values_list('model_name', 'object_id')
+    for model_name, object_id in tombstones:
+        if model_name in deleted:
+            deleted[model_name].append(object_id)
+
+    changes = {}
+    for name, (model, serializer_class, owner) in SYNC_COLLECTIONS.items():
+        queryset = model.objects.filter(**{owner: user}, updated_at__gt=since)
+        if model is Goal:
+            queryset = queryset.prefetch_related('tasks')
+        changes[name] = {
+            'updated': serializer_class(queryset.order_by('updated_at', 'id'), many=True).data,
+            'deleted': deleted[model._meta.model_name],
+        }
+
+    return {
+        'cursor': encode_cursor(started),
+        'reset': False,
+        'has_more': False,
+        'changes': changes,
+    }
@@ -0,0 +1,74 @@
+from datetime import timedelta
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient, APITestCase
+from ..models import Mood, MoodLog, JournalEntry, Goal, Task
+
+@override_settings(API_CACHE_ENABLED=False)
+class AsyncListViewTests(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='asyncuser', password='testpassword')
+        other = User.objects.create_user(username='otheruser', password='testpassword')
+        mood = Mood.objects.create(mood_type='Happy', mood_description='Feeling good')
+        now = timezone.now()
+        # Several rows per model, created out of timestamp order, so a list
+        # ordered differently from its viewset does not match by accident
+        for owner in (self.user, other):
+            for days_ago in (2, 0, 1):
+                moment = now - timedelta(days=days_ago)
+                log = MoodLog.objects.create(user=owner, mood=mood, notes=f'{owner.username} log {days_ago}')
+                MoodLog.objects.filter(pk=log.pk).update(date_logged=moment)
+                entry = JournalEntry.objects.create(user=owner, title=f'Entry {days_ago}', content='Content')
+                JournalEntry.objects.filter(pk=entry.pk).update(created_at=moment)
+                goal = Goal.objects.create(user=owner, category='Health', title=f'Walk {days_ago}', description='Daily walk')
+                Goal.objects.filter(pk=goal.pk).update(start_date=moment)
+                for minutes in (10, 20):
+                    Task.objects.create(goal=goal, text=f'Walk {minutes} minutes')
+
+        client = APIClient()
+        token = client.post('/api/token/', {'username': 'asyncuser', 'password': 'testpassword'}).data['access']
+        client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.sync_client = client
+        self.headers = {'Authorization': f'Bearer {token}'}
+
+    async def test_async_lists_match_sync_viewsets(self):
+        """
+        Test that each async list returns the same JSON as the sync viewset.
+        """
+        for sync_path, async_path in [
+            ('/api/moodlogs/', '/api/async/moodlogs/'),
+            ('/api/journalentries/', '/api/async/journalentries/'),
+            ('/api/goals/', '/api/async/goals/'),
+        ]:
+            response = await self.async_client.get(async_path, headers=self.headers)
+            self.assertEqual(response.status_code, 200)
+            expected = await sync_to_async(self.sync_client.get)(sync_path)
+            self.assertEqual(response.json(), expected.json())
+            self.assertEqual(len(response.json()), 3)
+
+        # Mood logs are listed newest first
+        response = await self.async_client.get('/api/async/moodlogs/', headers=self.headers)
+        self.assertEqual(
+            [log['notes'] for log in response.json()],
+            ['asyncuser log 0', 'asyncuser log 1', 'asyncuser log 2'],
+        )
+
+    async def test_async_list_requires_authentication(self):
+        """
+        Test that the async lists reject missing and invalid tokens.
+        """
+        response = await self.async_client.get('/api/async/moodlogs/')
+        self.assertEqual(response.status_code, 401)
+
+        response = await self.async_client.get('/api/async/moodlogs/', headers={'Authorization': 'Bearer invalid'})
+        self.assertEqual(response.status_code, 401)
+
+    async def test_async_list_is_read_only(self):
+        """
+        Test that the async lists only accept GET.
+        """
+        response = await self.async_client.post('/api/async/moodlogs/', headers=self.headers)
+        self.assertEqual(response.status_code, 405)
@@ -0,0 +1,89 @@
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient, APITestCase
+
+class CachedJWTAuthenticationTests(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='authuser', email='auth@example.com', password='testpassword')
+        self.client = APIClient()
+        response = self.client.post('/api/token/', {'username': 'authuser', 'password': 'testpassword'})
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+
+    def test_repeat_request_needs_no_auth_queries(self):
+        """
+        Test that a repeat JWT request loads neither the user nor the profile from the database.
+        """
+        self.client.get('/api/user-info/')
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/user-info/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['username'], 'authuser')
+        self.assertEqual(len(ctx.captured_queries), 0)
+
+    def test_first_request_loads_user_and_profile_together(self):
+        """
+        Test that an uncached lookup fetches the user and profile in one query.
+        """
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/user-info/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertIn('base_userprofile', ctx.captured_queries[0]['sql'])
+
+    def test_profile_change_invalidates_cached_user(self):
+        """
+        Test that updating the profile is visible on the next request.
+        """
+        self.client.get('/api/user-info/')
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.put('/profile/', {'city': 'Chicago'}, format='json')
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(self.client.get('/api/user-info/').data['city'], 'Chicago')
+
+    def test_deactivated_user_is_rejected(self):
+        """
+        Test that deactivating a user takes effect on the next request despite the cache.
+        """
+        self.client.get('/api/user-info/')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+
+        self.assertIn(self.client.get('/api/user-info/').status_code, (401, 403))
+
+    def test_writes_do_not_save_a_stale_cached_user(self):
+        """
+        Test that an unsafe request loads a fresh user, so saving it keeps changes made behind the cache.
+        """
+        self.client.get('/api/user-info/')
+        User.objects.filter(pk=self.user.pk).update(first_name='Updated')
+
+        response = self.client.post(
+            '/api/auth/change-password/',
+            {'current_password': 'testpassword', 'new_password': 'An0ther-Secret!'},
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.first_name, 'Updated')
+        self.assertTrue(self.user.check_password('An0ther-Secret!'))
+
+    @override_settings(API_CACHE_ENABLED=False)
+    def test_user_is_not_cached_without_shared_cache(self):
+        """
+        Test that the user lookup is not cached while the API cache is disabled.
+        """
+        self.client.get('/api/user-info/')
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get('/api/user-info/')
+
+        self.assertEqual(len(ctx.captured_queries), 1)
@@ -0,0 +1,35 @@
+from rest_framework.test import APITestCase
+from django.contrib.auth.models import User
+from ..benchmark import measure, percentile
+
+class BenchmarkHarnessTests(APITestCase):
+
+    def test_percentile(self):
+        """
+        Test nearest-rank percentiles.
+        """
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile([7], 99), 7)
+
+    def test_measure_reports_latency_queries_and_allocations(self):
+        """
+        Test that measuring an endpoint reports every statistic.
+        """
+        User.objects.create_user(username='benchuser', password='testpassword')
+        self.client.login(username='benchuser', password='testpassword')
+
+        stats = measure(lambda i: self.client.get('/api/moodlogs/'), iterations=5, warmup=1, expected_status=200)
+
+        self.assertEqual(stats['requests'], 5)
+        self.assertLessEqual(stats['p50_ms'], stats['p99_ms'])
+        self.assertGreater(stats['queries_per_request'], 0)
+        self.assertGreater(stats['peak_kib_per_request'], 0)
+
+    def test_measure_checks_status(self):
+        """
+        Test that an unexpected status code fails the measurement.
+        """
+        with self.assertRaises(AssertionError):
+            measure(lambda i: self.client.get('/api/moodlogs/'), iterations=1, warmup=0, expected_status=200)
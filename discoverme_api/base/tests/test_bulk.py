@@ -0,0 +1,121 @@
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth.models import User
+from emails.models import OutboundEmail
+from ..models import Goal, Mood, MoodLog, MoodDailyCount, Suggestion, Task
+
+class BulkWriteTests(APITestCase):
+
+    def setUp(self):
+        """
+        Set up two users, two moods and a goal, and log in.
+        """
+        self.user = User.objects.create_user(username='bulkuser', password='testpassword', email='bulk@example.com')
+        self.other_user = User.objects.create_user(username='otheruser', password='password123')
+        self.client.login(username='bulkuser', password='testpassword')
+        self.happy = Mood.objects.create(mood_type='happy', mood_description='Feeling great')
+        self.sad = Mood.objects.create(mood_type='sad', mood_description='Feeling down')
+        self.goal = Goal.objects.create(user=self.user, title='Get fit')
+        self.other_goal = Goal.objects.create(user=self.other_user, title='Not yours')
+
+    def test_bulk_create_moodlogs(self):
+        """
+        Test creating mood logs in bulk, including the daily mood counters.
+        """
+        data = [{'mood': self.happy.id, 'notes': f'Entry {i}'} for i in range(3)]
+        response = self.client.post('/api/moodlogs/bulk/', data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data), 3)
+        self.assertEqual(MoodLog.objects.filter(user=self.user).count(), 3)
+        self.assertEqual(MoodDailyCount.objects.get(user=self.user, mood=self.happy).count, 3)
+
+    def test_bulk_create_reports_errors_per_item(self):
+        """
+        Test that one invalid item rejects the whole batch and is reported at its position.
+        """
+        data = [{'mood': self.happy.id}, {'mood': 999999}]
+        response = self.client.post('/api/moodlogs/bulk/', data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['errors'][0], {})
+        self.assertIn('mood', response.data['errors'][1])
+        self.assertEqual(MoodLog.objects.count(), 0)
+
+    def test_bulk_update_moodlogs_moves_counters(self):
+        """
+        Test that changing the mood of logs in bulk updates the daily counters.
+        """
+        logs = [MoodLog.objects.create(user=self.user, mood=self.happy) for _ in range(2)]
+        data = [{'id': log.id, 'mood': self.sad.id} for log in logs]
+        response = self.client.patch('/api/moodlogs/bulk/', data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(MoodLog.objects.filter(mood=self.sad).count(), 2)
+
+        today = timezone.localdate()
+        self.assertEqual(MoodDailyCount.objects.get(user=self.user, mood=self.happy, day=today).count, 0)
+        self.assertEqual(MoodDailyCount.objects.get(user=self.user, mood=self.sad, day=today).count, 2)
+
+    def test_bulk_update_cannot_touch_other_users_objects(self):
+        """
+        Test that ids of other users' objects are reported as not found.
+        """
+        suggestion = Suggestion.objects.filter(user=self.other_user).first()
+        response = self.client.patch('/api/suggestions/bulk/', [{'id': suggestion.id, 'completed': True}], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('id', response.data['errors'][0])
+        suggestion.refresh_from_db()
+        self.assertFalse(suggestion.completed)
+
+    def test_bulk_update_rejects_missing_or_invalid_ids(self):
+        """
+        Test that missing, non-integer and boolean ids are reported per item instead of failing the request.
+        """
+        suggestion = Suggestion.objects.filter(user=self.user).first()
+        items = [{'completed': True}, {'id': str(suggestion.id)}, {'id': [suggestion.id]}, {'id': True}]
+        response = self.client.patch('/api/suggestions/bulk/', items, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual([list(errors) for errors in response.data['errors']], [['id']] * 4)
+
+    def test_bulk_complete_suggestions(self):
+        """
+        Test completing several suggestions at once.
+        """
+        ids = list(Suggestion.objects.filter(user=self.user).values_list('id', flat=True)[:3])
+        response = self.client.patch('/api/suggestions/bulk/', [{'id': pk, 'completed': True} for pk in ids], format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Suggestion.objects.filter(id__in=ids, completed=True).count(), 3)
+
+    def test_bulk_tasks_apply_completion_side_effects(self):
+        """
+        Test that tasks completed in bulk get completed_on and a congrats email.
+        """
+        data = [
+            {'goal': self.goal.id, 'text': 'Stretch', 'completed': True},
+            {'goal': self.goal.id, 'text': 'Run'},
+        ]
+        response = self.client.post('/api/tasks/bulk/', data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertIsNotNone(Task.objects.get(text='Stretch').completed_on)
+
+        run = Task.objects.get(text='Run')
+        self.assertIsNone(run.completed_on)
+        response = self.client.patch('/api/tasks/bulk/', [{'id': run.id, 'completed': True}], format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        run.refresh_from_db()
+        self.assertIsNotNone(run.completed_on)
+        self.assertEqual(OutboundEmail.objects.filter(subject__contains='Congratulations').count(), 2)
+
+    def test_bulk_tasks_reject_other_users_goal(self):
+        """
+        Test that tasks cannot be created on another user's goal.
+        """
+        response = self.client.post('/api/tasks/bulk/', [{'goal': self.other_goal.id, 'text': 'Sneaky'}], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('goal', response.data['errors'][0])
+
+    def test_bulk_requires_list(self):
+        """
+        Test that a single object is rejected.
+        """
+        response = self.client.post('/api/moodlogs/bulk/', {'mood': self.happy.id}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
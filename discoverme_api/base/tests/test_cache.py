@@ -0,0 +1,91 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth.models import User
+from ..models import Goal, Mood, MoodLog, Task
+
+class ResponseCacheTests(APITestCase):
+
+    def setUp(self):
+        """
+        Set up two users, a mood and log in.
+        """
+        self.user = User.objects.create_user(username='cacheuser', password='testpassword')
+        self.other_user = User.objects.create_user(username='otheruser', password='password123')
+        self.client.login(username='cacheuser', password='testpassword')
+        self.mood = Mood.objects.create(mood_type='Happy', mood_description='Feeling great')
+        self.moodlog_url = '/api/moodlogs/'
+
+    def get_with_queries(self, url):
+        """
+        Return the response and the queries run while serving it.
+        """
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, [q['sql'] for q in ctx.captured_queries]
+
+    def test_repeated_list_is_served_from_cache(self):
+        """
+        Test that an unchanged list is not read from the database again.
+        """
+        MoodLog.objects.create(user=self.user, mood=self.mood, notes='Day 1')
+        first, _ = self.get_with_queries(self.moodlog_url)
+        second, queries = self.get_with_queries(self.moodlog_url)
+        self.assertEqual(first.data, second.data)
+        self.assertFalse(any('base_moodlog' in sql for sql in queries))
+
+    def test_save_and_delete_invalidate(self):
+        """
+        Test that creating, editing and deleting a mood log invalidates the cached list.
+        """
+        self.client.get(self.moodlog_url)
+        with self.captureOnCommitCallbacks(execute=True):
+            log = MoodLog.objects.create(user=self.user, mood=self.mood, notes='Day 1')
+        self.assertEqual(len(self.client.get(self.moodlog_url).data), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            log.notes = 'Edited'
+            log.save()
+        self.assertEqual(self.client.get(f'{self.moodlog_url}{log.id}/').data['notes'], 'Edited')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            log.delete()
+        self.assertEqual(len(self.client.get(self.moodlog_url).data), 0)
+
+    def test_other_users_changes_do_not_invalidate(self):
+        """
+        Test that another user's writes leave this user's cached list in place.
+        """
+        self.client.get(self.moodlog_url)
+        MoodLog.objects.create(user=self.other_user, mood=self.mood, notes='Not yours')
+        _, queries = self.get_with_queries(self.moodlog_url)
+        self.assertFalse(any('base_moodlog' in sql for sql in queries))
+
+    def test_task_change_invalidates_goal_list(self):
+        """
+        Test that goals embedding tasks are refreshed when a task changes.
+        """
+        goal = Goal.objects.create(user=self.user, title='Read more')
+        task = Task.objects.create(goal=goal, text='Read 10 pages')
+        self.client.get('/api/goals/')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            task.text = 'Read 20 pages'
+            task.save()
+        response = self.client.get('/api/goals/')
+        self.assertEqual(response.data[0]['tasks'][0]['text'], 'Read 20 pages')
+
+    def test_invalidation_waits_for_commit(self):
+        """
+        Test that a write only invalidates the cached list once its transaction commits.
+        """
+        self.client.get(self.moodlog_url)
+        with self.captureOnCommitCallbacks() as callbacks:
+            MoodLog.objects.create(user=self.user, mood=self.mood, notes='Day 1')
+            self.assertEqual(len(self.client.get(self.moodlog_url).data), 0)
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(len(self.client.get(self.moodlog_url).data), 1)
@@ -0,0 +1,33 @@
+import json
+import os
+import tempfile
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import TransactionTestCase
+
+class DatabaseConnectionBenchmarkTests(TransactionTestCase):
+
+    def test_benchmark_reports_each_mode(self):
+        """
+        Test that the benchmark measures every connection mode and restores the settings.
+        """
+        original = (connection.settings_dict['CONN_MAX_AGE'], connection.settings_dict['CONN_HEALTH_CHECKS'])
+        with tempfile.TemporaryDirectory() as tmp:
+            output = os.path.join(tmp, 'results.json')
+            call_command('benchmark_db_connections', iterations=5, output=output, stdout=open(os.devnull, 'w'))
+            with open(output, encoding='utf-8') as f:
+                results = json.load(f)['results']
+
+        self.assertEqual(set(results), {'new_connection', 'persistent', 'persistent_health_checks'})
+        self.assertEqual(results['persistent']['requests'], 5)
+        self.assertEqual(
+            (connection.settings_dict['CONN_MAX_AGE'], connection.settings_dict['CONN_HEALTH_CHECKS']), original
+        )
+
+    def test_pool_requires_postgresql(self):
+        """
+        Test that the pool mode is rejected on SQLite.
+        """
+        with self.assertRaises(CommandError):
+            call_command('benchmark_db_connections', iterations=1, pool=True)
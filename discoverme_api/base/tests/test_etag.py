@@ -0,0 +1,68 @@
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth.models import User
+from ..models import Goal, Task
+
+class ConditionalGetTests(APITestCase):
+
+    def setUp(self):
+        """
+        Set up a test user with a goal and log in.
+        """
+        self.user = User.objects.create_user(username='etaguser', password='testpassword')
+        self.client.login(username='etaguser', password='testpassword')
+        self.goal = Goal.objects.create(user=self.user, title='Sleep better')
+        self.goal_url = '/api/goals/'
+
+    def test_unchanged_list_returns_304(self):
+        """
+        Test that a matching If-None-Match returns 304 without touching goal tables.
+        """
+        response = self.client.get(self.goal_url)
+        etag = response['ETag']
+        self.assertTrue(etag.startswith('"'))
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.goal_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        self.assertFalse(any('base_goal' in q['sql'] for q in ctx.captured_queries))
+
+    def test_change_produces_new_etag(self):
+        """
+        Test that adding a task to a goal invalidates the goal list and detail ETags.
+        """
+        list_etag = self.client.get(self.goal_url)['ETag']
+        detail_etag = self.client.get(f'{self.goal_url}{self.goal.id}/')['ETag']
+        self.assertNotEqual(list_etag, detail_etag)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Task.objects.create(goal=self.goal, text='No screens after 10pm')
+
+        response = self.client.get(self.goal_url, HTTP_IF_NONE_MATCH=list_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], list_etag)
+        response = self.client.get(f'{self.goal_url}{self.goal.id}/', HTTP_IF_NONE_MATCH=detail_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_missing_object_has_no_etag(self):
+        """
+        Test that error responses carry no validator.
+        """
+        response = self.client.get(f'{self.goal_url}999999/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(response.has_header('ETag'))
+
+    def test_no_etag_without_shared_versions(self):
+        """
+        Test that with the cache disabled responses carry no ETag and are never answered with 304.
+        """
+        etag = self.client.get(self.goal_url)['ETag']
+
+        with override_settings(API_CACHE_ENABLED=False):
+            response = self.client.get(self.goal_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('ETag', response)
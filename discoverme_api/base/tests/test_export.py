@@ -0,0 +1,87 @@
+import csv
+import io
+import json
+from unittest import mock
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db.models.query import QuerySet
+from django.http import StreamingHttpResponse
+from rest_framework.test import APITestCase
+from ..models import Mood, MoodLog, JournalEntry, Goal, Task
+
+class ExportTests(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='exportuser', password='testpassword')
+        other = User.objects.create_user(username='otheruser', password='testpassword')
+        self.mood = Mood.objects.create(mood_type='Happy', mood_description='Feeling good')
+        for i in range(5):
+            MoodLog.objects.create(user=self.user, mood=self.mood, notes=f'Note {i}, with "quotes"')
+        MoodLog.objects.create(user=other, mood=self.mood, notes='Not mine')
+        JournalEntry.objects.create(user=self.user, title='Entry', content='Content')
+        goal = Goal.objects.create(user=self.user, title='Walk')
+        Task.objects.create(goal=goal, text='Walk 10 minutes')
+        self.client.force_authenticate(user=self.user)
+
+    def read(self, response):
+        self.assertIsInstance(response, StreamingHttpResponse)
+        return b''.join(response.streaming_content).decode()
+
+    def test_ndjson_export_streams_all_collections(self):
+        """
+        Test that the NDJSON export streams every collection of the user only.
+        """
+        response = self.client.get('/api/export/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+
+        rows = [json.loads(line) for line in self.read(response).splitlines()]
+        types = [row['type'] for row in rows]
+        self.assertEqual(types.count('moodlogs'), 5)
+        self.assertEqual(types.count('journalentries'), 1)
+        self.assertEqual(types.count('goals'), 1)
+        self.assertEqual(types.count('tasks'), 1)
+        self.assertEqual(rows[0]['mood'], 'Happy')
+        self.assertNotIn('Not mine', [row.get('notes') for row in rows])
+
+    def test_csv_export_of_one_collection(self):
+        """
+        Test that the CSV export writes a header and one escaped row per mood log.
+        """
+        response = self.client.get('/api/export/', {'export_format': 'csv', 'collection': 'moodlogs'})
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        self.assertIn('discoverme-moodlogs.csv', response['Content-Disposition'])
+
+        rows = list(csv.DictReader(io.StringIO(self.read(response))))
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[0]['notes'], 'Note 0, with "quotes"')
+        self.assertEqual(rows[0]['mood'], 'Happy')
+
+    def test_invalid_parameters(self):
+        """
+        Test that unknown formats and collections, and CSV without a collection, are rejected.
+        """
+        for params in [{'export_format': 'xml'}, {'collection': 'users'}, {'export_format': 'csv'}]:
+            self.assertEqual(self.client.get('/api/export/', params).status_code, 400)
+
+    def test_export_is_chunked(self):
+        """
+        Test that rows are streamed with a chunked iterator rather than loaded as one result set.
+        """
+        original = QuerySet.iterator
+        with self.settings(EXPORT_CHUNK_SIZE=2), \
+                mock.patch.object(QuerySet, 'iterator', autospec=True, side_effect=original) as iterator:
+            lines = self.read(self.client.get('/api/export/', {'collection': 'moodlogs'})).splitlines()
+
+        self.assertEqual(len(lines), 5)
+        self.assertEqual(iterator.call_args.kwargs, {'chunk_size': 2})
+
+    def test_export_command(self):
+        """
+        Test that the management command writes the same NDJSON export.
+        """
+        out = io.StringIO()
+        call_command('export_user_data', 'exportuser', collection='moodlogs', stdout=out)
+        rows = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(len(rows), 5)
+        self.assertEqual({row['type'] for row in rows}, {'moodlogs'})
@@ -0,0 +1,102 @@
+from unittest import mock
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth.models import User
+from ..models import Goal, Task, Tombstone
+
+class GoalQueryCountTests(APITestCase):
+
+    def setUp(self):
+        """
+        Set up a test user and log in.
+        """
+        self.user = User.objects.create_user(username='goaluser', password='testpassword')
+        self.client.login(username='goaluser', password='testpassword')
+        self.goal_url = '/api/goals/'
+
+    def create_goals(self, num_goals, num_tasks):
+        """
+        Create goals for the test user, each with the given number of tasks.
+        """
+        with self.captureOnCommitCallbacks(execute=True):
+            for i in range(num_goals):
+                goal = Goal.objects.create(user=self.user, title=f'Goal {i}')
+                Task.objects.bulk_create([
+                    Task(goal=goal, text=f'Task {j} for goal {i}')
+                    for j in range(num_tasks)
+                ])
+
+    def count_list_queries(self):
+        """
+        Return the number of queries issued by one goal list request.
+        """
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.goal_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(ctx.captured_queries), response
+
+    def test_list_query_count_is_constant(self):
+        """
+        Test that listing goals does not issue one tasks query per goal.
+        """
+        self.create_goals(2, 2)
+        small, _ = self.count_list_queries()
+
+        self.create_goals(10, 5)
+        large, response = self.count_list_queries()
+
+        self.assertEqual(small, large)
+        self.assertEqual(len(response.data), 12)
+        self.assertEqual(sum(len(goal['tasks']) for goal in response.data), 54)
+
+    def test_retrieve_includes_tasks(self):
+        """
+        Test that a single goal is returned with its nested tasks.
+        """
+        self.create_goals(1, 3)
+        goal = Goal.objects.get(user=self.user)
+        response = self.client.get(f'{self.goal_url}{goal.id}/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['tasks']), 3)
+
+    def count_delete_queries(self, num_tasks):
+        """
+        Return the queries issued by deleting a goal with the given number of tasks.
+        """
+        self.create_goals(1, num_tasks)
+        goal = Goal.objects.get(user=self.user)
+        with CaptureQueriesContext(connection) as ctx, self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(f'{self.goal_url}{goal.id}/')
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        return [q['sql'] for q in ctx.captured_queries]
+
+    def test_delete_query_count_is_constant(self):
+        """
+        Test that deleting a goal does not query its goal or write a tombstone per task.
+        """
+        few = self.count_delete_queries(2)
+        many = self.count_delete_queries(20)
+
+        self.assertEqual(len(many), len(few))
+        # Only the view's own lookup of the goal
+        self.assertEqual(len([sql for sql in many if sql.startswith('SELECT') and 'FROM "base_goal"' in sql]), 1)
+        self.assertEqual(Tombstone.objects.filter(user=self.user, model_name='task').count(), 22)
+        self.assertEqual(Tombstone.objects.filter(user=self.user, model_name='goal').count(), 2)
+
+    def test_congrats_email_failure_is_logged(self):
+        """
+        Test that a congrats email that cannot be queued is logged and the task is still completed.
+        """
+        self.create_goals(1, 1)
+        task = Task.objects.get(goal__user=self.user)
+
+        with mock.patch('base.completion.send_congrats_email', side_effect=RuntimeError('Outbox unavailable')), \
+                self.assertLogs('base.completion', level='ERROR') as logs:
+            task.completed = True
+            task.save()
+
+        self.assertIn(f'Failed to queue congrats email for task: {task.text}', logs.output[0])
+        task.refresh_from_db()
+        self.assertIsNotNone(task.completed_on)
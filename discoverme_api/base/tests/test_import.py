@@ -0,0 +1,142 @@
+import io
+import json
+import os
+import tempfile
+from unittest import mock
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from ..models import Mood, MoodLog, JournalEntry, MoodDailyCount
+from ..cache import get_version
+from ..importer import import_file
+
+class ImportTests(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='importuser', password='testpassword')
+        self.happy = Mood.objects.create(mood_type='Happy', mood_description='Feeling good')
+        Mood.objects.create(mood_type='Sad', mood_description='Feeling down')
+        self.client.force_authenticate(user=self.user)
+
+    def ndjson(self, rows):
+        return '\n'.join(json.dumps(row) for row in rows).encode()
+
+    def test_ndjson_import_keeps_history(self):
+        """
+        Test that an NDJSON import creates the rows with their original timestamps and updates mood counts.
+        """
+        data = self.ndjson([
+            {'type': 'moodlogs', 'mood': 'happy', 'date_logged': '2020-01-02T08:00:00Z', 'notes': 'Sunny'},
+            {'type': 'moodlogs', 'mood': 'Sad', 'date_logged': '2020-01-03'},
+            {'type': 'journalentries', 'title': 'Day one', 'content': 'Started', 'created_at': '2020-01-02T09:00:00Z'},
+            {'type': 'goals', 'title': 'Not imported'},
+        ])
+        upload = SimpleUploadedFile('history.ndjson', data)
+
+        response = self.client.post('/api/import/', {'file': upload}, format='multipart')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['imported'], {'moodlogs': 2, 'journalentries': 1})
+        self.assertEqual(response.data['skipped'], 1)
+        log = MoodLog.objects.get(user=self.user, notes='Sunny')
+        self.assertEqual(log.date_logged.year, 2020)
+        self.assertEqual(log.mood, self.happy)
+        self.assertEqual(JournalEntry.objects.get(user=self.user).created_at.year, 2020)
+        self.assertEqual(sum(MoodDailyCount.objects.filter(user=self.user).values_list('count', flat=True)), 2)
+
+    def test_csv_import_reports_row_errors(self):
+        """
+        Test that invalid CSV rows are skipped and reported with their line numbers.
+        """
+        data = b'mood,date_logged,notes\nHappy,2021-05-01T10:00:00Z,ok\nAngry,,unknown mood\nSad,not a date,bad date\n'
+        upload = SimpleUploadedFile('logs.csv', data)
+
+        response = self.client.post(
+            '/api/import/', {'file': upload, 'import_format': 'csv', 'collection': 'moodlogs'}, format='multipart'
+        )
+
+        self.assertEqual(response.data['imported']['moodlogs'], 1)
+        self.assertEqual(response.data['error_count'], 2)
+        self.assertEqual([e['line'] for e in response.data['errors']], [3, 4])
+        self.assertIn("Unknown mood 'Angry'", response.data['errors'][0]['error'])
+
+    def test_import_is_chunked_and_resolves_moods_once(self):
+        """
+        Test that rows are written in fixed-size chunks with a constant number of mood lookups.
+        """
+        data = self.ndjson([{'type': 'moodlogs', 'mood': 'Happy', 'notes': f'{i}'} for i in range(25)])
+        progress = []
+
+        with CaptureQueriesContext(connection) as ctx:
+            summary = import_file(self.user, io.BytesIO(data), 'ndjson', batch_size=10, progress=lambda s: progress.append(s['imported']['moodlogs']))
+
+        self.assertEqual(summary['imported']['moodlogs'], 25)
+        self.assertEqual(progress, [10, 20, 25])
+        mood_queries = [q for q in ctx.captured_queries if q['sql'].startswith('SELECT') and 'base_mood"' in q['sql'] and 'base_moodlog' not in q['sql']]
+        self.assertEqual(len(mood_queries), 1)
+        inserts = [q for q in ctx.captured_queries if q['sql'].startswith('INSERT INTO "base_moodlog"')]
+        self.assertEqual(len(inserts), 3)
+
+    def test_invalid_request(self):
+        """
+        Test that a missing file, unknown format or CSV without collection is rejected.
+        """
+        self.assertEqual(self.client.post('/api/import/', {}, format='multipart').status_code, 400)
+        for params in [{'import_format': 'xml'}, {'import_format': 'csv'}]:
+            upload = SimpleUploadedFile('data.txt', b'')
+            self.assertEqual(self.client.post('/api/import/', {'file': upload, **params}, format='multipart').status_code, 400)
+
+    def test_import_command(self):
+        """
+        Test that the management command imports a file and prints progress.
+        """
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = os.path.join(tmp.name, 'history.ndjson')
+        with open(path, 'wb') as f:
+            f.write(self.ndjson([{'type': 'journalentries', 'title': 'Entry', 'content': 'Text'}]))
+
+        out = io.StringIO()
+        call_command('import_user_data', 'importuser', path, stdout=out)
+
+        self.assertEqual(JournalEntry.objects.filter(user=self.user).count(), 1)
+        self.assertIn('Imported 0 moodlogs, 1 journalentries', out.getvalue())
+
+    def test_non_object_json_lines_are_reported(self):
+        """
+        Test that a JSON value that is not an object is reported as such, not as invalid JSON.
+        """
+        data = b'null\n[1, 2]\n{not json\n'
+
+        summary = import_file(self.user, io.BytesIO(data), 'ndjson', collection='moodlogs')
+
+        self.assertEqual(
+            [(e['line'], e['error']) for e in summary['errors']],
+            [(1, 'Expected an object.'), (2, 'Expected an object.'), (3, 'Invalid JSON.')],
+        )
+
+    def test_failed_import_still_invalidates_cache(self):
+        """
+        Test that committed chunks are not hidden behind cached responses when a later chunk fails.
+        """
+        data = self.ndjson([{'type': 'moodlogs', 'mood': 'Happy', 'notes': f'{i}'} for i in range(5)])
+        version = get_version(self.user.pk, 'moodlog')
+        original_bulk_create = MoodLog.objects.bulk_create
+        calls = []
+
+        def bulk_create(objs, *args, **kwargs):
+            calls.append(len(objs))
+            if len(calls) > 1:
+                raise RuntimeError('Database went away')
+            return original_bulk_create(objs, *args, **kwargs)
+
+        with mock.patch.object(MoodLog.objects, 'bulk_create', side_effect=bulk_create), \
+                self.captureOnCommitCallbacks(execute=True):
+            with self.assertRaises(RuntimeError):
+                import_file(self.user, io.BytesIO(data), 'ndjson', batch_size=2)
+
+        self.assertEqual(MoodLog.objects.filter(user=self.user).count(), 2)
+        self.assertNotEqual(get_version(self.user.pk, 'moodlog'), version)
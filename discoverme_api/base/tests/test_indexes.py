@@ -0,0 +1,76 @@
+from unittest import skipUnless
+from django.db import connection
+from django.test import TestCase
+from django.contrib.auth.models import User
+from ..models import MoodLog, JournalEntry, Suggestion, Goal, Insight
+
+@skipUnless(connection.vendor == 'sqlite', 'Query plans are checked on SQLite only.')
+class QueryPlanTests(TestCase):
+
+    def setUp(self):
+        """
+        Create a user to scope the queries to.
+        """
+        self.user = User.objects.create_user(username='planuser', password='testpassword')
+
+    def assertUsesIndex(self, queryset, fields):
+        """
+        Assert that SQLite answers the queryset with the model index on ``fields``
+        and without sorting in a temporary B-tree.
+        """
+        index_name = next(
+            index.name for index in queryset.model._meta.indexes
+            if index.fields == fields
+        )
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+            plan = ' '.join(row[-1] for row in cursor.fetchall())
+
+        self.assertIn(index_name, plan)
+        self.assertNotIn('TEMP B-TREE', plan)
+
+    def test_moodlog_list_uses_index(self):
+        """
+        Test the MoodLogViewSet list query.
+        """
+        self.assertUsesIndex(
+            MoodLog.objects.filter(user=self.user).order_by('-date_logged'),
+            ['user', 'date_logged'],
+        )
+
+    def test_journal_entry_list_uses_index(self):
+        """
+        Test the JournalEntryViewSet list query.
+        """
+        self.assertUsesIndex(
+            JournalEntry.objects.filter(user=self.user).order_by('-created_at'),
+            ['user', 'created_at'],
+        )
+
+    def test_suggestion_list_uses_index(self):
+        """
+        Test the SuggestionViewSet list query.
+        """
+        self.assertUsesIndex(
+            Suggestion.objects.filter(user=self.user).order_by('-created_at'),
+            ['user', 'created_at'],
+        )
+
+    def test_insight_list_uses_index(self):
+        """
+        Test the InsightViewSet list query.
+        """
+        self.assertUsesIndex(
+            Insight.objects.filter(user=self.user).order_by('-created_at'),
+            ['user', 'created_at'],
+        )
+
+    def test_goal_list_uses_index(self):
+        """
+        Test the GoalViewSet list query.
+        """
+        self.assertUsesIndex(
+            Goal.objects.filter(user=self.user).order_by('-start_date'),
+            ['user', 'start_date'],
+        )
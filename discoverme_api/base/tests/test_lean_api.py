@@ -0,0 +1,49 @@
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient, APITestCase
+
+@override_settings(MIDDLEWARE=settings.LEAN_MIDDLEWARE)
+class LeanAPIModeTests(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='leanuser', password='testpassword', is_staff=True, is_superuser=True)
+
+    def jwt_client(self):
+        client = APIClient()
+        response = client.post('/api/token/', {'username': 'leanuser', 'password': 'testpassword'})
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+        return client
+
+    def test_api_request_skips_session(self):
+        """
+        Test that an API request carrying a session cookie never loads the session.
+        """
+        client = self.jwt_client()
+        client.login(username='leanuser', password='testpassword')
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get('/api/moodlogs/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse([q for q in ctx.captured_queries if 'django_session' in q['sql']])
+
+    def test_api_requires_jwt(self):
+        """
+        Test that a session alone does not authenticate API requests.
+        """
+        self.client.login(username='leanuser', password='testpassword')
+        self.assertIn(self.client.get('/api/user-info/').status_code, (401, 403))
+
+    def test_admin_keeps_full_middleware(self):
+        """
+        Test that the admin still uses sessions and enforces CSRF.
+        """
+        client = APIClient(enforce_csrf_checks=True)
+        self.assertEqual(client.post('/admin/login/', {'username': 'leanuser', 'password': 'testpassword'}).status_code, 403)
+
+        client = APIClient()
+        client.login(username='leanuser', password='testpassword')
+        self.assertEqual(client.get('/admin/').status_code, 200)
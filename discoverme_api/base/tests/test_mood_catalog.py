@@ -0,0 +1,118 @@
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient, APITestCase
+from base.catalog import get_catalog_version, get_mood_catalog, invalidate_mood_catalog
+from base.models import Mood
+from base.serializers import MoodField
+
+class MoodCatalogTests(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='cataloguser', email='catalog@example.com', password='testpassword')
+        self.happy = Mood.objects.create(mood_type='Happy', mood_description='Feeling good')
+        self.sad = Mood.objects.create(mood_type='Sad', mood_description='Feeling down')
+        self.client = APIClient()
+        response = self.client.post('/api/token/', {'username': 'cataloguser', 'password': 'testpassword'})
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+        # Warm the catalog and the cached user lookup.
+        self.client.get('/api/mood/')
+
+    def test_mood_list_and_detail_need_no_queries(self):
+        """
+        Test that listing and retrieving moods is served from the catalog without queries.
+        """
+        with CaptureQueriesContext(connection) as ctx:
+            list_response = self.client.get('/api/mood/')
+            detail_response = self.client.get(f'/api/mood/{self.sad.id}/')
+
+        self.assertEqual(list_response.status_code, 200)
+        self.assertEqual([mood['mood_type'] for mood in list_response.data], ['Happy', 'Sad'])
+        self.assertEqual(detail_response.data['mood_description'], 'Feeling down')
+        self.assertEqual(len(ctx.captured_queries), 0)
+
+    def test_moodlog_create_does_not_query_moods(self):
+        """
+        Test that validating the mood of a new mood log does not select from the mood table.
+        """
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post('/api/moodlogs/', {'mood': self.happy.id, 'notes': 'Sunny'}, format='json')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertFalse([q for q in ctx.captured_queries if q['sql'].startswith('SELECT') and 'base_mood"' in q['sql']])
+
+    def test_unknown_mood_is_rejected(self):
+        """
+        Test that a mood log referencing a missing mood fails validation.
+        """
+        response = self.client.post('/api/moodlogs/', {'mood': self.sad.id + 100}, format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('mood', response.data)
+
+    def test_changes_reload_catalog(self):
+        """
+        Test that saving and deleting a mood is visible on the next read.
+        """
+        with self.captureOnCommitCallbacks(execute=True):
+            self.happy.mood_description = 'Cheerful'
+            self.happy.save()
+        self.assertEqual(get_mood_catalog().get(self.happy.id).mood_description, 'Cheerful')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.sad.delete()
+        self.assertEqual([mood.mood_type for mood in get_mood_catalog()], ['Happy'])
+
+    def test_mood_added_without_signals_is_accepted(self):
+        """
+        Test that a mood created with bulk_create falls back to the database and reloads the catalog.
+        """
+        calm, = Mood.objects.bulk_create([Mood(mood_type='Calm', mood_description='At ease')])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/api/moodlogs/', {'mood': calm.id}, format='json')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(get_mood_catalog().get(calm.id).mood_type, 'Calm')
+
+    def test_invalidate_bumps_version(self):
+        """
+        Test that invalidating the catalog makes the next read load a new snapshot.
+        """
+        catalog = get_mood_catalog()
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_mood_catalog()
+            # Other processes must not reload before the change is committed
+            self.assertIs(get_mood_catalog(), catalog)
+
+        self.assertIsNot(get_mood_catalog(), catalog)
+
+    def test_catalog_misses_invalidate_once(self):
+        """
+        Test that several validations missing the same mood bump the catalog version only once.
+        """
+        catalog = get_mood_catalog()
+        calm, = Mood.objects.bulk_create([Mood(mood_type='Calm', mood_description='At ease')])
+        version = get_catalog_version()
+        field = MoodField(queryset=Mood.objects.all())
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            for _ in range(3):
+                self.assertEqual(field.to_internal_value(calm.id), calm)
+
+        self.assertEqual(len(callbacks), 3)
+        self.assertEqual(get_catalog_version(), version + 1)
+        self.assertIsNot(get_mood_catalog(), catalog)
+
+    @override_settings(API_CACHE_ENABLED=False)
+    def test_catalog_is_not_cached_without_shared_cache(self):
+        """
+        Test that the catalog is read from the database while the API cache is disabled.
+        """
+        Mood.objects.filter(pk=self.happy.pk).update(mood_description='Cheerful')
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(get_mood_catalog().get(self.happy.id).mood_description, 'Cheerful')
+
+        self.assertEqual(len(ctx.captured_queries), 1)
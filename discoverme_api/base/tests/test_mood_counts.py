@@ -0,0 +1,158 @@
+from datetime import date, timedelta
+from unittest import mock
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth.models import User
+from ..models import Mood, MoodLog, MoodDailyCount
+from ..aggregates import rebuild_mood_counts, window_start
+
+class MoodCountTests(APITestCase):
+
+    def setUp(self):
+        """
+        Set up a test user, two moods and log in.
+        """
+        self.user = User.objects.create_user(username='countuser', password='testpassword')
+        self.client.login(username='countuser', password='testpassword')
+        self.happy = Mood.objects.create(mood_type='happy', mood_description='Feeling great')
+        self.sad = Mood.objects.create(mood_type='sad', mood_description='Feeling down')
+        self.counts_url = '/api/insights/mood-counts/'
+
+    def counters(self):
+        """
+        Return the user's counters as {(mood_id, day): count}, skipping empty ones.
+        """
+        return {
+            (row.mood_id, row.day): row.count
+            for row in MoodDailyCount.objects.filter(user=self.user, count__gt=0)
+        }
+
+    def test_counters_follow_create_update_delete(self):
+        """
+        Test that the daily counters track mood log creation, edits and deletion.
+        """
+        today = timezone.localdate()
+        first = MoodLog.objects.create(user=self.user, mood=self.happy)
+        MoodLog.objects.create(user=self.user, mood=self.happy)
+        self.assertEqual(self.counters(), {(self.happy.id, today): 2})
+
+        first.mood = self.sad
+        first.save()
+        self.assertEqual(self.counters(), {(self.happy.id, today): 1, (self.sad.id, today): 1})
+
+        first.notes = 'Only the notes changed'
+        first.save()
+        self.assertEqual(self.counters(), {(self.happy.id, today): 1, (self.sad.id, today): 1})
+
+        first.delete()
+        self.assertEqual(self.counters(), {(self.happy.id, today): 1})
+
+    def test_rebuild_matches_incremental_counters(self):
+        """
+        Test that rebuilding from the mood logs gives the same counters.
+        """
+        for mood in [self.happy, self.sad, self.sad]:
+            MoodLog.objects.create(user=self.user, mood=mood)
+        expected = self.counters()
+        MoodDailyCount.objects.all().delete()
+        rebuild_mood_counts(self.user)
+        self.assertEqual(self.counters(), expected)
+
+    def test_mood_counts_endpoint_respects_window(self):
+        """
+        Test that the endpoint only counts moods logged inside the window.
+        """
+        MoodLog.objects.create(user=self.user, mood=self.happy)
+        old = MoodLog.objects.create(user=self.user, mood=self.sad)
+        MoodLog.objects.filter(pk=old.pk).update(date_logged=timezone.now() - timedelta(days=10))
+        rebuild_mood_counts(self.user)
+
+        response = self.client.get(self.counts_url, {'time_quantity': 1, 'time_frame': 'weeks'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        counts = {row['mood_type']: row['count'] for row in response.data['counts']}
+        self.assertEqual(counts, {'happy': 1, 'sad': 0})
+
+        response = self.client.get(self.counts_url, {'time_quantity': 2, 'time_frame': 'weeks'})
+        counts = {row['mood_type']: row['count'] for row in response.data['counts']}
+        self.assertEqual(counts, {'happy': 1, 'sad': 1})
+
+    def test_mood_counts_endpoint_validates_params(self):
+        """
+        Test that an unknown time frame is rejected.
+        """
+        response = self.client.get(self.counts_url, {'time_frame': 'decades'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_insight_reports_current_mood_count(self):
+        """
+        Test that an insight keeps the client's mood count and reports the live count of its mood.
+        """
+        MoodLog.objects.create(user=self.user, mood=self.happy)
+        data = {'trigger_word': 'Happy', 'time_quantity': 1, 'time_frame': 'days', 'mood_count': 99}
+        response = self.client.post('/api/insights/', data)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['mood_count'], 99)
+        self.assertEqual(response.data['current_mood_count'], 1)
+
+        # The count follows mood logs added after the insight was saved
+        self.client.get('/api/insights/')
+        with self.captureOnCommitCallbacks(execute=True):
+            MoodLog.objects.create(user=self.user, mood=self.happy)
+        self.assertEqual(self.client.get('/api/insights/').data[0]['current_mood_count'], 2)
+
+    def test_insight_with_non_mood_trigger_word(self):
+        """
+        Test that an insight whose trigger word names no mood is accepted with its own count and no live count.
+        """
+        MoodLog.objects.create(user=self.user, mood=self.happy)
+        data = {'trigger_word': 'stress', 'time_quantity': 2, 'time_frame': 'weeks', 'mood_count': 7}
+        response = self.client.post('/api/insights/', data)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['mood_count'], 7)
+        self.assertIsNone(response.data['current_mood_count'])
+
+    def test_insight_list_reads_each_window_once(self):
+        """
+        Test that listing insights counts each distinct window once, not once per insight.
+        """
+        for word in ['happy', 'sad', 'Happy', 'stress']:
+            self.client.post('/api/insights/', {'trigger_word': word, 'time_quantity': 1, 'time_frame': 'weeks'})
+
+        with self.settings(API_CACHE_ENABLED=False), CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/insights/')
+
+        self.assertEqual(len(response.data), 4)
+        counter_queries = [q for q in ctx.captured_queries if 'base_mooddailycount' in q['sql']]
+        self.assertEqual(len(counter_queries), 1)
+
+    def test_month_and_year_windows_use_calendar_arithmetic(self):
+        """
+        Test that month and year windows follow the calendar instead of fixed day counts.
+        """
+        with mock.patch('base.aggregates.timezone.localdate', return_value=date(2024, 3, 31)):
+            self.assertEqual(window_start(1, 'months'), date(2024, 3, 1))
+            self.assertEqual(window_start(13, 'months'), date(2023, 3, 1))
+            self.assertEqual(window_start(1, 'years'), date(2023, 4, 1))
+            self.assertEqual(window_start(1, 'weeks'), date(2024, 3, 25))
+        with mock.patch('base.aggregates.timezone.localdate', return_value=date(2024, 10, 17)):
+            self.assertEqual(window_start(2, 'months'), date(2024, 8, 18))
+
+    def test_cascade_delete_skips_counter_updates(self):
+        """
+        Test that deleting a user or a mood does not update a counter per mood log.
+        """
+        for mood in [self.happy, self.sad, self.sad]:
+            MoodLog.objects.create(user=self.user, mood=mood)
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.sad.delete()
+        self.assertFalse([q for q in ctx.captured_queries if q['sql'].startswith('UPDATE "base_mooddailycount"')])
+        self.assertEqual(self.counters(), {(self.happy.id, timezone.localdate()): 1})
+
+        with CaptureQueriesContext(connection) as ctx:
+            self.user.delete()
+        self.assertFalse([q for q in ctx.captured_queries if q['sql'].startswith('UPDATE "base_mooddailycount"')])
+        self.assertFalse(MoodDailyCount.objects.exists())
@@ -0,0 +1,108 @@
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient, APITestCase
+from base.catalog import invalidate_mood_catalog
+from base.models import Mood, MoodLog
+
+class ExpandedMoodLogTests(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='expanduser', email='expand@example.com', password='testpassword')
+        self.happy = Mood.objects.create(mood_type='Happy', mood_description='Feeling good')
+        self.sad = Mood.objects.create(mood_type='Sad', mood_description='Feeling down')
+        for i in range(10):
+            MoodLog.objects.create(user=self.user, mood=self.happy if i % 2 else self.sad, notes=f'Log {i}')
+        self.client = APIClient()
+        response = self.client.post('/api/token/', {'username': 'expanduser', 'password': 'testpassword'})
+        self.headers = {'Authorization': f"Bearer {response.data['access']}"}
+        self.client.credentials(HTTP_AUTHORIZATION=self.headers['Authorization'])
+
+    @override_settings(API_CACHE_ENABLED=False)
+    def test_expanded_list_uses_one_joined_query(self):
+        """
+        Test that the expanded list embeds every mood using a single joined query.
+        """
+        self.client.get('/api/moodlogs/')
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/moodlogs/?expand=mood')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 10)
+        self.assertEqual(
+            {(log['mood']['mood_type'], log['mood']['mood_description']) for log in response.data},
+            {('Happy', 'Feeling good'), ('Sad', 'Feeling down')},
+        )
+        # The JWT user lookup is not cached with the API cache off
+        queries = [q['sql'] for q in ctx.captured_queries if 'base_moodlog' in q['sql']]
+        self.assertEqual(len(ctx.captured_queries), 2)
+        self.assertEqual(len(queries), 1)
+        self.assertIn('JOIN "base_mood"', queries[0])
+
+    def test_default_list_returns_mood_ids(self):
+        """
+        Test that the list without ``expand`` keeps returning the mood ID.
+        """
+        response = self.client.get('/api/moodlogs/')
+
+        self.assertIn(response.data[0]['mood'], (self.happy.id, self.sad.id))
+
+    def test_expanded_retrieve_and_pages(self):
+        """
+        Test that retrieve and paginated lists also honour ``expand``.
+        """
+        log = MoodLog.objects.filter(user=self.user, mood=self.sad).first()
+
+        detail = self.client.get(f'/api/moodlogs/{log.id}/?expand=mood')
+        page = self.client.get('/api/moodlogs/?expand=mood&page_size=3')
+
+        self.assertEqual(detail.data['mood'], {'id': self.sad.id, 'mood_type': 'Sad', 'mood_description': 'Feeling down'})
+        self.assertEqual(len(page.data['results']), 3)
+        self.assertIn('mood_type', page.data['results'][0]['mood'])
+
+    def test_mood_change_invalidates_cached_expanded_list(self):
+        """
+        Test that editing a mood is visible in an already cached expanded list.
+        """
+        self.client.get('/api/moodlogs/?expand=mood')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.sad.mood_description = 'Feeling blue'
+            self.sad.save()
+
+        response = self.client.get('/api/moodlogs/?expand=mood')
+
+        self.assertIn('Feeling blue', {log['mood']['mood_description'] for log in response.data})
+
+    def test_mood_change_without_signals_invalidates_cached_expanded_list(self):
+        """
+        Test that a mood changed with update() is visible in a cached expanded list once the catalog is invalidated.
+        """
+        self.client.get('/api/moodlogs/?expand=mood')
+        with self.captureOnCommitCallbacks(execute=True):
+            Mood.objects.filter(pk=self.sad.pk).update(mood_description='Feeling blue')
+            invalidate_mood_catalog()
+
+        response = self.client.get('/api/moodlogs/?expand=mood')
+
+        self.assertIn('Feeling blue', {log['mood']['mood_description'] for log in response.data})
+
+    def test_writes_still_take_a_mood_id(self):
+        """
+        Test that creating a mood log with ``expand`` in the URL still accepts a mood ID.
+        """
+        response = self.client.post('/api/moodlogs/?expand=mood', {'mood': self.happy.id}, format='json')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['mood'], self.happy.id)
+
+    async def test_async_list_expands_mood(self):
+        """
+        Test that the async mood log list supports ``expand=mood``.
+        """
+        response = await self.async_client.get('/api/async/moodlogs/?expand=mood', headers=self.headers)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 10)
+        self.assertIn(response.json()[0]['mood']['mood_type'], ('Happy', 'Sad'))
@@ -0,0 +1,70 @@
+from unittest import mock
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from emails.models import OutboundEmail
+from ..models import Suggestion, UserProfile
+from ..onboarding import DEFAULT_SUGGESTIONS, FIRST_LOGIN_SUGGESTIONS
+
+class OnboardingTests(APITestCase):
+
+    def test_registration_sets_up_user(self):
+        """
+        Test that creating a user creates the profile, the default suggestions and the welcome email.
+        """
+        user = User.objects.create_user(username='newuser', email='new@example.com', password='testpassword')
+
+        profile = UserProfile.objects.get(user=user)
+        self.assertFalse(profile.first_login)
+        self.assertCountEqual(
+            Suggestion.objects.filter(user=user).values_list('text', flat=True),
+            DEFAULT_SUGGESTIONS + FIRST_LOGIN_SUGGESTIONS,
+        )
+        self.assertEqual(OutboundEmail.objects.filter(recipient_list=['new@example.com']).count(), 1)
+
+    def test_registration_query_count_is_fixed(self):
+        """
+        Test that registration writes the user, profile, suggestions and email in a fixed number of queries.
+        """
+        with CaptureQueriesContext(connection) as ctx:
+            User.objects.create_user(username='newuser', email='new@example.com', password='testpassword')
+
+        writes = [q['sql'] for q in ctx.captured_queries if q['sql'].startswith('INSERT')]
+        self.assertEqual(len(writes), 4)
+        self.assertLessEqual(len(ctx.captured_queries), 6)  # Plus the savepoint and its release
+
+    def test_login_does_not_touch_profile(self):
+        """
+        Test that a login's last_login update neither loads nor saves the profile.
+        """
+        User.objects.create_user(username='newuser', password='testpassword')
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post('/api/token/', {'username': 'newuser', 'password': 'testpassword'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse([q for q in ctx.captured_queries if 'base_userprofile' in q['sql']])
+
+    def test_profile_edited_through_user_is_saved(self):
+        """
+        Test that a profile edited through user.profile is still saved with the user.
+        """
+        user = User.objects.create_user(username='newuser', password='testpassword')
+        user = User.objects.get(pk=user.pk)
+        user.profile.city = 'Chicago'
+        user.save()
+
+        self.assertEqual(UserProfile.objects.get(user=user).city, 'Chicago')
+
+    def test_welcome_email_failure_is_logged(self):
+        """
+        Test that a failure to queue the welcome email is logged and does not undo the registration.
+        """
+        with mock.patch('base.onboarding.send_welcome_email', side_effect=RuntimeError('Outbox unavailable')), \
+                self.assertLogs('base.onboarding', level='ERROR') as logs:
+            user = User.objects.create_user(username='newuser', email='new@example.com', password='testpassword')
+
+        self.assertIn('Failed to queue welcome email to new@example.com', logs.output[0])
+        self.assertIn('Outbox unavailable', logs.output[0])
+        self.assertTrue(UserProfile.objects.filter(user=user).exists())
@@ -0,0 +1,59 @@
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth.models import User
+from ..models import MoodLog, Mood
+
+class CursorPaginationTests(APITestCase):
+
+    def setUp(self):
+        """
+        Set up a test user with a handful of mood logs.
+        """
+        self.user = User.objects.create_user(username='pageuser', password='testpassword')
+        self.client.login(username='pageuser', password='testpassword')
+        self.mood = Mood.objects.create(mood_type='Happy', mood_description='Feeling great')
+        self.moodlog_url = '/api/moodlogs/'
+        for i in range(5):
+            MoodLog.objects.create(user=self.user, mood=self.mood, notes=f'Day {i}')
+
+    def test_unpaginated_by_default(self):
+        """
+        Test that clients not asking for a page still receive the full list.
+        """
+        response = self.client.get(self.moodlog_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 5)
+
+    def test_walk_pages_with_cursor(self):
+        """
+        Test that following the next links returns every mood log exactly once, newest first.
+        """
+        response = self.client.get(self.moodlog_url, {'page_size': 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 2)
+
+        seen = [row['id'] for row in response.data['results']]
+        while response.data['next']:
+            response = self.client.get(response.data['next'])
+            seen.extend(row['id'] for row in response.data['results'])
+
+        expected = list(MoodLog.objects.order_by('-date_logged', '-id').values_list('id', flat=True))
+        self.assertEqual(seen, expected)
+
+    @override_settings(API_MAX_PAGE_SIZE=3)
+    def test_page_size_is_capped(self):
+        """
+        Test that the requested page size cannot exceed API_MAX_PAGE_SIZE.
+        """
+        response = self.client.get(self.moodlog_url, {'page_size': 100})
+        self.assertEqual(len(response.data['results']), 3)
+
+    @override_settings(API_PAGINATE_BY_DEFAULT=True, API_PAGE_SIZE=4)
+    def test_paginate_by_default_setting(self):
+        """
+        Test that API_PAGINATE_BY_DEFAULT pages every list response.
+        """
+        response = self.client.get(self.moodlog_url)
+        self.assertEqual(len(response.data['results']), 4)
+        self.assertIsNotNone(response.data['next'])
@@ -0,0 +1,68 @@
+import io
+from datetime import timedelta
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from django.contrib.auth.models import User
+from ..models import Goal, MoodDailyCount, MoodLog, Task
+
+class PopulateDataTests(TestCase):
+
+    def populate(self, **options):
+        """
+        Run populate_data with small volumes.
+        """
+        defaults = {
+            'num_users': 4, 'num_moodlogs': 20, 'num_journalentries': 3, 'num_goals': 2,
+            'num_tasks_per_goal': 2, 'num_insights': 1, 'num_suggestions': 2,
+            'days': 90, 'batch_size': 7, 'stdout': io.StringIO(),
+        }
+        call_command('populate_data', **{**defaults, **options})
+
+    def mood_history(self):
+        """
+        Return the generated mood logs in a comparable form.
+        """
+        return list(
+            MoodLog.objects.order_by('user_id', 'date_logged').values_list('user_id', 'mood__mood_type', 'notes')
+        )
+
+    def test_generated_volumes(self):
+        """
+        Test that every user gets the requested number of rows.
+        """
+        self.populate()
+        self.assertEqual(User.objects.filter(username__startswith='loaduser').count(), 4)
+        users = User.objects.count()
+        self.assertEqual(MoodLog.objects.count(), users * 20)
+        self.assertEqual(Task.objects.count(), users * 2 * 2)
+        self.assertEqual(
+            sum(MoodDailyCount.objects.values_list('count', flat=True)),
+            MoodLog.objects.count(),
+        )
+
+    def test_timestamps_are_spread_over_history(self):
+        """
+        Test that generated timestamps are kept and fall within the window.
+        """
+        self.populate()
+        now = timezone.now()
+        dates = MoodLog.objects.values_list('date_logged', flat=True)
+        self.assertTrue(all(now - timedelta(days=91) <= d <= now for d in dates))
+        self.assertGreater(len({d.date() for d in dates}), 10)
+        completed = Goal.objects.filter(completed=True)
+        self.assertFalse(completed.filter(completed_on__isnull=True).exists())
+
+    def test_same_seed_reproduces_data(self):
+        """
+        Test that the same seed generates the same history.
+        """
+        self.populate(seed=7)
+        first = self.mood_history()
+        MoodLog.objects.all().delete()
+        self.populate(seed=7, num_users=0)
+        self.assertEqual(self.mood_history(), first)
+
+        MoodLog.objects.all().delete()
+        self.populate(seed=8, num_users=0)
+        self.assertNotEqual(self.mood_history(), first)
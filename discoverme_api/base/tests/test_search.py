@@ -0,0 +1,86 @@
+from unittest import mock
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth.models import User
+from ..models import JournalEntry, Mood, MoodLog
+
+class SearchTests(APITestCase):
+
+    def setUp(self):
+        """
+        Set up two users with some journal entries and mood logs.
+        """
+        self.user = User.objects.create_user(username='searchuser', password='testpassword')
+        self.other_user = User.objects.create_user(username='otheruser', password='password123')
+        self.client.login(username='searchuser', password='testpassword')
+        self.mood = Mood.objects.create(mood_type='Calm', mood_description='Feeling at peace')
+        self.search_url = '/api/search/'
+
+        self.entry = JournalEntry.objects.create(user=self.user, title='Morning walk', content='Walked along the river before work.')
+        JournalEntry.objects.create(user=self.user, title='Deadlines', content='Too many meetings today.')
+        self.log = MoodLog.objects.create(user=self.user, mood=self.mood, notes='Long walk with the dog')
+        JournalEntry.objects.create(user=self.other_user, title='Walking', content='Not yours to find.')
+
+    def search(self, **params):
+        """
+        Run a search and assert it succeeded.
+        """
+        response = self.client.get(self.search_url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response
+
+    def test_search_matches_entries_and_notes(self):
+        """
+        Test that stemmed matches are found in both journal entries and mood logs of the user only.
+        """
+        response = self.search(q='walking')
+        found = {(hit['type'], hit['object']['id']) for hit in response.data['results']}
+        self.assertEqual(found, {('journalentry', self.entry.id), ('moodlog', self.log.id)})
+
+    def test_search_reflects_updates_and_deletes(self):
+        """
+        Test that the index follows edits and deletions.
+        """
+        self.entry.content = 'Swam in the lake.'
+        self.entry.title = 'Swim'
+        self.entry.save()
+        self.log.delete()
+        self.assertEqual(self.search(q='walk').data['results'], [])
+        self.assertEqual(len(self.search(q='lake').data['results']), 1)
+
+    def test_search_pagination(self):
+        """
+        Test that results are paged with limit and offset.
+        """
+        first = self.search(q='walk', limit=1)
+        self.assertEqual(len(first.data['results']), 1)
+        self.assertEqual(first.data['next_offset'], 1)
+
+        second = self.search(q='walk', limit=1, offset=1)
+        self.assertEqual(len(second.data['results']), 1)
+        self.assertIsNone(second.data['next_offset'])
+        self.assertNotEqual(first.data['results'][0], second.data['results'][0])
+
+    def test_search_requires_query(self):
+        """
+        Test that a missing query is rejected.
+        """
+        response = self.client.get(self.search_url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_search_ignores_query_syntax(self):
+        """
+        Test that FTS operators in user input don't cause errors.
+        """
+        self.assertEqual(self.search(q='"NEAR(* OR').data['results'], [])
+
+    def test_unsupported_database_falls_back_to_substring_search(self):
+        """
+        Test that databases without full-text search fall back to substring matches.
+        """
+        with mock.patch('base.search.connection') as connection:
+            connection.vendor = 'mysql'
+            response = self.search(q='walk')
+
+        hits = [(hit['type'], hit['object']['id']) for hit in response.data['results']]
+        self.assertEqual(hits, [('moodlog', self.log.id), ('journalentry', self.entry.id)])
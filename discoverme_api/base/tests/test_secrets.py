@@ -0,0 +1,138 @@
+import json
+import os
+import sys
+import tempfile
+from unittest import mock
+from django.test import SimpleTestCase
+from discoverme_api.secret_store import CachedSecretProvider, FileSecretProvider, get_provider, get_secret
+
+class CountingProvider:
+    """
+    Stand-in provider that counts fetches and can be made to fail.
+    """
+
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+        self.fail = False
+
+    def fetch(self, name):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError('secrets service unavailable')
+        return self.value
+
+class SecretStoreTests(SimpleTestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_dir = tmp.name
+        self.secret = {'dbname': 'discoverme', 'username': 'app', 'password': 'pw', 'host': 'db', 'port': '5432'}
+
+    def test_cached_secret_is_reused_within_ttl(self):
+        """
+        Test that a fresh cached secret is returned without calling the provider, even across instances.
+        """
+        provider = CountingProvider(self.secret)
+        self.assertEqual(CachedSecretProvider(provider, self.cache_dir, ttl=60).fetch('prod'), self.secret)
+        self.assertEqual(CachedSecretProvider(provider, self.cache_dir, ttl=60).fetch('prod'), self.secret)
+        self.assertEqual(provider.calls, 1)
+
+    def test_stale_secret_is_refreshed(self):
+        """
+        Test that a secret older than the TTL is fetched again.
+        """
+        provider = CountingProvider(self.secret)
+        cached = CachedSecretProvider(provider, self.cache_dir, ttl=60)
+        cached.fetch('prod')
+
+        with mock.patch('discoverme_api.secret_store.time.time', return_value=10 ** 10):
+            cached.fetch('prod')
+        self.assertEqual(provider.calls, 2)
+
+    def test_stale_secret_is_used_when_refresh_fails(self):
+        """
+        Test that a failed refresh falls back to the stale cached value, and fails without one.
+        """
+        provider = CountingProvider(self.secret)
+        cached = CachedSecretProvider(provider, self.cache_dir, ttl=60)
+        cached.fetch('prod')
+        provider.fail = True
+
+        with mock.patch('discoverme_api.secret_store.time.time', return_value=10 ** 10):
+            self.assertEqual(cached.fetch('prod'), self.secret)
+        with self.assertRaises(ConnectionError):
+            cached.fetch('other')
+
+    def test_cache_file_is_private(self):
+        """
+        Test that the cache file is only readable by its owner.
+        """
+        cached = CachedSecretProvider(CountingProvider(self.secret), self.cache_dir, ttl=60)
+        cached.fetch('prod')
+        self.assertEqual(os.stat(cached.cache_path('prod')).st_mode & 0o777, 0o600)
+
+    def test_foreign_or_shared_cache_file_is_ignored(self):
+        """
+        Test that a planted cache file readable by others is not trusted.
+        """
+        provider = CountingProvider(self.secret)
+        cached = CachedSecretProvider(provider, self.cache_dir, ttl=60)
+        with open(cached.cache_path('prod'), 'w', encoding='utf-8') as f:
+            json.dump({'fetched_at': 10 ** 10, 'value': {'password': 'injected'}}, f)
+        os.chmod(cached.cache_path('prod'), 0o644)
+
+        self.assertEqual(cached.fetch('prod'), self.secret)
+        self.assertEqual(provider.calls, 1)
+        self.assertEqual(os.stat(cached.cache_path('prod')).st_mode & 0o777, 0o600)
+
+    def test_shared_cache_directory_disables_cache(self):
+        """
+        Test that nothing is cached in a directory other users can access.
+        """
+        os.chmod(self.cache_dir, 0o755)
+        provider = CountingProvider(self.secret)
+        cached = CachedSecretProvider(provider, self.cache_dir, ttl=60)
+        cached.fetch('prod')
+        cached.fetch('prod')
+
+        self.assertEqual(provider.calls, 2)
+        self.assertFalse(os.path.exists(cached.cache_path('prod')))
+
+    def test_default_cache_directory_is_private(self):
+        """
+        Test that the default cache directory is created under XDG_CACHE_HOME with mode 0700.
+        """
+        with mock.patch.dict(os.environ, {'XDG_CACHE_HOME': self.cache_dir}):
+            cached = CachedSecretProvider(CountingProvider(self.secret), ttl=60)
+            cached.fetch('prod')
+
+        self.assertEqual(cached.cache_dir, os.path.join(self.cache_dir, 'discoverme'))
+        self.assertEqual(os.stat(cached.cache_dir).st_mode & 0o777, 0o700)
+
+    def test_file_provider_from_environment(self):
+        """
+        Test that the file provider is selected by the environment and does not import boto3.
+        """
+        path = os.path.join(self.cache_dir, 'secrets.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'prod': self.secret}, f)
+        env = {
+            'DISCOVERME_SECRET_PROVIDER': 'file',
+            'DISCOVERME_SECRET_FILE': path,
+            'DISCOVERME_SECRET_NAME': 'prod',
+            'DISCOVERME_SECRET_CACHE_DIR': self.cache_dir,
+        }
+
+        with mock.patch.dict(os.environ, env), mock.patch.dict(sys.modules, {'boto3': None}):
+            self.assertIsInstance(get_provider().provider, FileSecretProvider)
+            self.assertEqual(get_secret(), self.secret)
+
+    def test_missing_secret_name(self):
+        """
+        Test that a missing secret name is reported.
+        """
+        with mock.patch.dict(os.environ, {'DISCOVERME_SECRET_NAME': ''}):
+            with self.assertRaises(EnvironmentError):
+                get_secret(provider=CountingProvider(self.secret))
@@ -0,0 +1,141 @@
+from datetime import timedelta
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth.models import User
+from ..models import Goal, JournalEntry, Mood, MoodLog, Task, Tombstone
+from ..sync import encode_cursor
+
+@override_settings(SYNC_CURSOR_OVERLAP=0)
+class SyncTests(APITestCase):
+
+    def setUp(self):
+        """
+        Set up a test user with some history and log in.
+        """
+        self.user = User.objects.create_user(username='syncuser', password='testpassword')
+        self.other_user = User.objects.create_user(username='otheruser', password='password123')
+        self.client.login(username='syncuser', password='testpassword')
+        self.mood = Mood.objects.create(mood_type='Happy', mood_description='Feeling great')
+        self.log = MoodLog.objects.create(user=self.user, mood=self.mood, notes='Day 1')
+        self.entry = JournalEntry.objects.create(user=self.user, title='Entry', content='Content')
+        self.goal = Goal.objects.create(user=self.user, title='Get fit')
+        self.task = Task.objects.create(goal=self.goal, text='Run')
+        self.sync_url = '/api/sync/'
+
+    def sync(self, cursor=None):
+        """
+        Run a sync and assert it succeeded.
+        """
+        params = {'cursor': cursor} if cursor else {}
+        response = self.client.get(self.sync_url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_initial_sync_returns_everything(self):
+        """
+        Test that a sync without a cursor is a full reset.
+        """
+        data = self.sync()
+        self.assertTrue(data['reset'])
+        self.assertEqual([row['id'] for row in data['changes']['moodlogs']['updated']], [self.log.id])
+        self.assertEqual([row['id'] for row in data['changes']['tasks']['updated']], [self.task.id])
+        self.assertEqual(len(data['changes']['suggestions']['updated']), 8)
+
+    def test_sync_returns_only_changes(self):
+        """
+        Test that a follow-up sync returns only created, updated and deleted rows.
+        """
+        cursor = self.sync()['cursor']
+        self.assertEqual(
+            {name: changes['updated'] for name, changes in self.sync(cursor)['changes'].items()},
+            {name: [] for name in ['moodlogs', 'journalentries', 'goals', 'tasks', 'suggestions']},
+        )
+
+        new_log = MoodLog.objects.create(user=self.user, mood=self.mood, notes='Day 2')
+        MoodLog.objects.create(user=self.other_user, mood=self.mood, notes='Not yours')
+        self.entry.title = 'Edited'
+        self.entry.save()
+        goal_id, task_id = self.goal.id, self.task.id
+        self.goal.delete()
+
+        data = self.sync(cursor)
+        self.assertFalse(data['reset'])
+        changes = data['changes']
+        self.assertEqual([row['id'] for row in changes['moodlogs']['updated']], [new_log.id])
+        self.assertEqual([row['title'] for row in changes['journalentries']['updated']], ['Edited'])
+        self.assertEqual(changes['goals']['deleted'], [goal_id])
+        self.assertEqual(changes['tasks']['deleted'], [task_id])
+
+        # Nothing is returned twice once the client moves to the new cursor
+        self.assertEqual(self.sync(data['cursor'])['changes']['goals']['deleted'], [])
+
+    @override_settings(SYNC_TOMBSTONE_RETENTION_DAYS=1)
+    def test_expired_cursor_resets(self):
+        """
+        Test that a cursor older than the tombstone retention gets a full reset.
+        """
+        data = self.sync(encode_cursor(timezone.now() - timedelta(days=2)))
+        self.assertTrue(data['reset'])
+        self.assertEqual(len(data['changes']['moodlogs']['updated']), 1)
+
+    def test_invalid_cursor(self):
+        """
+        Test that a malformed cursor is rejected.
+        """
+        response = self.client.get(self.sync_url, {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_update_is_synced(self):
+        """
+        Test that objects changed through the bulk endpoint are picked up.
+        """
+        cursor = self.sync()['cursor']
+        response = self.client.patch('/api/moodlogs/bulk/', [{'id': self.log.id, 'notes': 'Bulk edit'}], format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        updated = self.sync(cursor)['changes']['moodlogs']['updated']
+        self.assertEqual([row['notes'] for row in updated], ['Bulk edit'])
+
+    @override_settings(SYNC_PAGE_SIZE=5)
+    def test_full_reset_is_paged(self):
+        """
+        Test that a full reset is split into pages that together return every object once.
+        """
+        for i in range(6):
+            MoodLog.objects.create(user=self.user, mood=self.mood, notes=f'Extra {i}')
+
+        pages = [self.sync()]
+        while pages[-1]['has_more']:
+            pages.append(self.sync(pages[-1]['cursor']))
+
+        self.assertEqual([page['reset'] for page in pages], [True, False, False, False])
+        self.assertTrue(all(sum(len(c['updated']) for c in page['changes'].values()) <= 5 for page in pages))
+        ids = [row['id'] for page in pages for row in page['changes']['moodlogs']['updated']]
+        self.assertEqual(ids, sorted(MoodLog.objects.filter(user=self.user).values_list('id', flat=True)))
+        self.assertEqual(sum(len(page['changes']['suggestions']['updated']) for page in pages), 8)
+
+        # The last cursor continues with a delta sync from when the reset started
+        new_log = MoodLog.objects.create(user=self.user, mood=self.mood, notes='After reset')
+        data = self.sync(pages[-1]['cursor'])
+        self.assertFalse(data['reset'])
+        self.assertEqual([row['id'] for row in data['changes']['moodlogs']['updated']], [new_log.id])
+
+    @override_settings(SYNC_TOMBSTONE_RETENTION_DAYS=1)
+    def test_expired_tombstones_are_pruned(self):
+        """
+        Test that syncing removes the user's tombstones older than the retention.
+        """
+        self.log.delete()
+        Tombstone.objects.update(deleted_at=timezone.now() - timedelta(days=2))
+        self.sync()
+        self.assertFalse(Tombstone.objects.filter(user=self.user).exists())
+
+    def test_user_deletion_leaves_no_tombstones(self):
+        """
+        Test that deleting an account neither writes nor keeps tombstones for it.
+        """
+        self.log.delete()
+        user_id = self.user.id
+        self.user.delete()
+        self.assertFalse(Tombstone.objects.filter(user_id=user_id).exists())
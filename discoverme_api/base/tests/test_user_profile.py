@@ -0,0 +1,54 @@
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from ..models import UserProfile
+
+class UserProfileWriteTests(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='profileuser', email='profile@example.com', password='testpassword')
+
+    def test_unchanged_profile_is_not_written(self):
+        """
+        Test that saving an unchanged profile runs no queries.
+        """
+        profile = UserProfile.objects.get(user=self.user)
+        with self.assertNumQueries(0):
+            profile.save()
+
+    def test_only_changed_fields_are_written(self):
+        """
+        Test that saving a profile only updates the changed columns.
+        """
+        profile = UserProfile.objects.get(user=self.user)
+        profile.city = 'Chicago'
+
+        with CaptureQueriesContext(connection) as ctx:
+            profile.save()
+            profile.save()
+
+        self.assertEqual(len(ctx.captured_queries), 1)
+        sql = ctx.captured_queries[0]['sql']
+        self.assertIn('"city"', sql)
+        self.assertNotIn('"occupation"', sql)
+        self.assertEqual(UserProfile.objects.get(user=self.user).city, 'Chicago')
+
+    def test_update_user_details_writes_changed_fields(self):
+        """
+        Test that updating details issues one targeted UPDATE per changed table.
+        """
+        self.client.force_authenticate(user=User.objects.get(pk=self.user.pk))
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.put('/api/auth/update-user/', {'first_name': 'Ann', 'city': 'Chicago'}, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        updates = [q['sql'] for q in ctx.captured_queries if q['sql'].startswith('UPDATE')]
+        self.assertEqual(len(updates), 2)
+        self.assertTrue(any('"auth_user" SET "first_name"' in sql and '"password"' not in sql for sql in updates))
+        self.assertTrue(any('"base_userprofile" SET "city"' in sql and '"pronouns"' not in sql for sql in updates))
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.first_name, 'Ann')
+        self.assertEqual(self.user.profile.city, 'Chicago')
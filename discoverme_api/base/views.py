@@ -1,7 +1,7 @@
 import re
 from rest_framework import viewsets, status
 from rest_framework.generics import RetrieveUpdateAPIView
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.response import Response
 from django.contrib.auth.models import User
 from django.contrib.auth.password_validation import validate_password
@@ -13,8 +13,17 @@ from .models import Mood, MoodLog, JournalEntry, Suggestion, Goal, Insight, Task
 from .serializers import (
     MoodSerializer, MoodLogSerializer, JournalEntrySerializer, 
     SuggestionSerializer, GoalSerializer, InsightSerializer, UserProfileSerializer,
-    TaskSerializer
+    TaskSerializer, TaskCreateSerializer, MoodCountSerializer, SearchQuerySerializer,
+    ExpandedMoodLogSerializer, get_expand
 )
+from .aggregates import mood_counts, apply_count_changes, count_keys
+from .search import search_history
+from .cache import UserCacheMixin
+from .bulk import BulkWriteMixin
+from .sync import changes_since
+from .export import export_lines
+from .importer import import_file
+from .catalog import get_catalog_version, get_mood_catalog
 from emails.messages import send_password_change_email
 
 
@@ -25,34 +34,99 @@ class MoodViewSet(viewsets.ModelViewSet):
     """
     serializer_class = MoodSerializer
     permission_classes = [IsAuthenticated]
+    cursor_ordering = ('id',)
 
     def get_queryset(self):
         return Mood.objects.all()
 
+    def list(self, request, *args, **kwargs):
+        """
+        Serves the moods from the in-memory catalog unless a page is requested.
+        """
+        page = self.paginate_queryset(self.get_queryset())
+        if page is not None:
+            return self.get_paginated_response(self.get_serializer(page, many=True).data)
+        return Response(self.get_serializer(list(get_mood_catalog()), many=True).data)
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Serves a mood from the in-memory catalog.
+        """
+        try:
+            mood = get_mood_catalog().get(int(kwargs['pk']))
+        except ValueError:
+            mood = None
+        if mood is None:
+            return super().retrieve(request, *args, **kwargs)
+        return Response(self.get_serializer(mood).data)
+
     def perform_create(self, serializer):
         serializer.save()
 
 
-class MoodLogViewSet(viewsets.ModelViewSet):
+class MoodLogViewSet(BulkWriteMixin, UserCacheMixin, viewsets.ModelViewSet):
     """
     API endpoint for managing MoodLog objects.
+
+    Query Parameters:
+    - expand (str): ``mood`` embeds each log's mood (id, type and description) instead of its ID, on list and retrieve.
     """
     serializer_class = MoodLogSerializer
     permission_classes = [IsAuthenticated]
+    cache_scope = 'moodlog'
+    cursor_ordering = ('-date_logged', '-id')
+
+    @property
+    def expand_mood(self):
+        return self.action in ('list', 'retrieve') and 'mood' in get_expand(self.request.query_params)
 
     def get_queryset(self):
-        return MoodLog.objects.filter(user=self.request.user).order_by('-date_logged')
+        queryset = MoodLog.objects.filter(user=self.request.user).order_by('-date_logged')
+        if self.expand_mood:
+            queryset = queryset.select_related('mood')
+        return queryset
+
+    def get_serializer_class(self):
+        if self.expand_mood:
+            return ExpandedMoodLogSerializer
+        return super().get_serializer_class()
+
+    def get_cache_key(self, request, version):
+        """
+        Expanded responses embed moods, so they are also keyed on the mood
+        catalog version. It lives in the same shared cache as the response
+        versions, so a mood change committed through any worker is seen by
+        all of them. Changes made without signals must call
+        invalidate_mood_catalog().
+        """
+        key = super().get_cache_key(request, version)
+        if self.expand_mood:
+            key = f'{key}:{get_catalog_version()}'
+        return key
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
+    def perform_bulk_create(self, serializer):
+        logs = super().perform_bulk_create(serializer)
+        apply_count_changes(after=count_keys(logs))
+        return logs
 
-class JournalEntryViewSet(viewsets.ModelViewSet):
+    def perform_bulk_update(self, serializer):
+        before = count_keys(serializer.instance.values())
+        logs = super().perform_bulk_update(serializer)
+        apply_count_changes(before=before, after=count_keys(logs))
+        return logs
+
+
+class JournalEntryViewSet(UserCacheMixin, viewsets.ModelViewSet):
     """
     API endpoint for managing JournalEntry objects.
     """
     serializer_class = JournalEntrySerializer
     permission_classes = [IsAuthenticated]
+    cache_scope = 'journalentry'
+    cursor_ordering = ('-created_at', '-id')
 
     def get_queryset(self):
         return JournalEntry.objects.filter(user=self.request.user)
@@ -61,12 +135,14 @@ class JournalEntryViewSet(viewsets.ModelViewSet):
         serializer.save(user=self.request.user)
 
 
-class SuggestionViewSet(viewsets.ModelViewSet):
+class SuggestionViewSet(BulkWriteMixin, UserCacheMixin, viewsets.ModelViewSet):
     """
     API endpoint for managing user suggestions.
     """
     serializer_class = SuggestionSerializer
     permission_classes = [IsAuthenticated]
+    cache_scope = 'suggestion'
+    cursor_ordering = ('-created_at', '-id')
 
     def get_queryset(self):
         return Suggestion.objects.filter(user=self.request.user)
@@ -74,16 +150,18 @@ class SuggestionViewSet(viewsets.ModelViewSet):
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
-class GoalViewSet(viewsets.ModelViewSet):
+class GoalViewSet(UserCacheMixin, viewsets.ModelViewSet):
     """
     API endpoint for managing Goal objects.
 
     """
     serializer_class = GoalSerializer
     permission_classes = [IsAuthenticated]
+    cache_scope = 'goal'
+    cursor_ordering = ('-start_date', '-id')
 
     def get_queryset(self):
-        return Goal.objects.filter(user=self.request.user)
+        return Goal.objects.filter(user=self.request.user).prefetch_related('tasks')
 
     def perform_create(self, serializer):
         try:
@@ -93,12 +171,14 @@ class GoalViewSet(viewsets.ModelViewSet):
             raise e
 
 
-class InsightViewSet(viewsets.ModelViewSet):
+class InsightViewSet(UserCacheMixin, viewsets.ModelViewSet):
     """
     API endpoint for managing Insight objects.
     """
     serializer_class = InsightSerializer
     permission_classes = [IsAuthenticated]
+    cache_scope = 'insight'
+    cursor_ordering = ('-created_at', '-id')
 
     def get_queryset(self):
         return Insight.objects.filter(user=self.request.user)
@@ -106,6 +186,27 @@ class InsightViewSet(viewsets.ModelViewSet):
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
+    @action(detail=False, methods=['get'], url_path='mood-counts', url_name='mood-counts')
+    def mood_counts_view(self, request):
+        """
+        Counts of each mood the user logged over the last N days/weeks/months/years.
+
+        Query Parameters:
+        - time_quantity: int (default 1)
+        - time_frame: days | weeks | months | years (default weeks)
+        """
+        params = MoodCountSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        counts = mood_counts(request.user, **params.validated_data)
+
+        return Response({
+            **params.validated_data,
+            'counts': [
+                {'mood': mood.id, 'mood_type': mood.mood_type, 'count': counts.get(mood.id, 0)}
+                for mood in get_mood_catalog()
+            ],
+        })
+
 
 class UserProfileView(RetrieveUpdateAPIView):
     """
@@ -118,12 +219,15 @@ class UserProfileView(RetrieveUpdateAPIView):
     def get_object(self):
         return self.request.user.profile
 
-class TaskViewSet(viewsets.ModelViewSet):
+class TaskViewSet(BulkWriteMixin, UserCacheMixin, viewsets.ModelViewSet):
     """
     API endpoint for managing Task objects.
     """
     serializer_class = TaskSerializer
     permission_classes = [IsAuthenticated]
+    cache_scope = 'task'
+    cursor_ordering = ('-id',)
+    bulk_create_serializer_class = TaskCreateSerializer
 
     def get_queryset(self):
         """
@@ -142,8 +246,14 @@ class TaskViewSet(viewsets.ModelViewSet):
         except Goal.DoesNotExist:
             raise ValidationError({'error': 'Goal not found or does not belong to the user.'})
 
+    def get_bulk_save_kwargs(self):
+        """
+        Tasks are owned through their goal, which each item names itself.
+        """
+        return {}
 
-from django.http import JsonResponse
+
+from django.http import JsonResponse, StreamingHttpResponse
 
 @csrf_exempt
 @api_view(['POST'])
@@ -294,14 +404,18 @@ def update_user_details(request):
         return Response({'error': 'This email is already in use.'}, status=status.HTTP_400_BAD_REQUEST)
 
     # Update User fields
+    user_fields = []
     if first_name:
         user.first_name = first_name
+        user_fields.append('first_name')
     if last_name:
         user.last_name = last_name
+        user_fields.append('last_name')
     if email:
         user.email = email
+        user_fields.append('email')
 
-    # Update UserProfile fields
+    # Update UserProfile fields (only the changed ones are written)
     if occupation:
         profile.occupation = occupation
     if city:
@@ -310,8 +424,9 @@ def update_user_details(request):
         profile.state = state
     if pronouns:
         profile.pronouns = pronouns
-    user.save()
     profile.save()
+    if user_fields:
+        user.save(update_fields=user_fields)
 
     return Response({'message': 'User details updated successfully.'}, status=status.HTTP_200_OK)
 
@@ -320,3 +435,118 @@ def check_email(request):
     email = request.data.get('email')
     is_available = not User.objects.filter(email=email).exists()
     return Response({'isAvailable': is_available})
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def search(request):
+    """
+    API endpoint for full-text search over the user's journal entries and mood log notes.
+
+    Method: GET
+    Query Parameters:
+    - q: str (required)
+    - limit: int (default 20, max 100)
+    - offset: int (default 0)
+    """
+    params = SearchQuerySerializer(data=request.query_params)
+    params.is_valid(raise_exception=True)
+    limit = params.validated_data['limit']
+    offset = params.validated_data['offset']
+
+    # Fetch one extra hit to know whether there is a next page
+    hits = search_history(request.user, params.validated_data['q'], limit=limit + 1, offset=offset)
+    has_next = len(hits) > limit
+    hits = hits[:limit]
+
+    entries = JournalEntry.objects.in_bulk([pk for kind, pk, rank in hits if kind == 'journalentry'])
+    logs = MoodLog.objects.in_bulk([pk for kind, pk, rank in hits if kind == 'moodlog'])
+
+    results = []
+    for kind, pk, rank in hits:
+        if kind == 'journalentry':
+            data = JournalEntrySerializer(entries[pk]).data
+        else:
+            data = MoodLogSerializer(logs[pk]).data
+        results.append({'type': kind, 'rank': rank, 'object': data})
+
+    return Response({
+        'results': results,
+        'next_offset': offset + limit if has_next else None,
+    })
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def sync(request):
+    """
+    API endpoint returning the user's mood logs, journal entries, goals, tasks
+    and suggestions created, updated or deleted since the last sync.
+
+    A full reset is returned in pages; keep syncing with the returned cursor
+    while ``has_more`` is true.
+
+    Method: GET
+    Query Parameters:
+    - cursor: str (optional, the cursor returned by the previous sync)
+    """
+    try:
+        return Response(changes_since(request.user, request.query_params.get('cursor')))
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+EXPORT_CONTENT_TYPES = {'ndjson': 'application/x-ndjson', 'csv': 'text/csv'}
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def export(request):
+    """
+    API endpoint streaming a download of the user's mood logs, journal
+    entries, goals and tasks.
+
+    Method: GET
+    Query Parameters:
+    - export_format: str (optional, 'ndjson' (default) or 'csv')
+    - collection: str (optional for NDJSON, required for CSV: 'moodlogs',
+      'journalentries', 'goals' or 'tasks')
+    """
+    export_format = request.query_params.get('export_format', 'ndjson')
+    collection = request.query_params.get('collection')
+    try:
+        lines = export_lines(request.user, export_format, collection)
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    response = StreamingHttpResponse(lines, content_type=EXPORT_CONTENT_TYPES[export_format])
+    filename = f"discoverme-{collection or 'export'}.{export_format}"
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def import_data(request):
+    """
+    API endpoint importing mood logs and journal entries from an uploaded
+    NDJSON or CSV file (e.g. an export from this or another app).
+
+    Method: POST (multipart)
+    Body Parameters:
+    - file: file (required)
+    - import_format: str (optional, 'ndjson' (default) or 'csv')
+    - collection: str (required for CSV: 'moodlogs' or 'journalentries')
+    """
+    upload = request.FILES.get('file')
+    if upload is None:
+        return Response({'error': 'A file is required.'}, status=status.HTTP_400_BAD_REQUEST)
+
+    upload.seek(0)
+    try:
+        summary = import_file(
+            request.user,
+            upload.file,
+            request.data.get('import_format', 'ndjson'),
+            request.data.get('collection') or None,
+        )
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    return Response(summary, status=status.HTTP_200_OK)
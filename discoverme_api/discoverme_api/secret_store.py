@@ -0,0 +1,219 @@
+"""
+Secrets loading for the settings modules.
+
+Production settings need the database credentials at import time, so every
+worker boot used to import boto3 and make a Secrets Manager round trip. The
+fetched secret is now cached on local disk for ``DISCOVERME_SECRET_TTL``
+seconds, and boto3 is only imported when the cache is missing or stale.
+
+The cache holds plaintext credentials, so it lives in a per-user directory
+(``$XDG_CACHE_HOME/discoverme`` unless ``DISCOVERME_SECRET_CACHE_DIR`` is
+set) created with mode 0700. The directory and each cache file are only
+used while they belong to the current user and have no group or other
+permissions; otherwise the cache is bypassed.
+
+Providers are pluggable through ``DISCOVERME_SECRET_PROVIDER``: ``aws`` (the
+default), ``file`` (reads ``DISCOVERME_SECRET_FILE``, useful for tests and
+local stand-ins) or the dotted path of a class with a ``fetch(name)`` method.
+
+This module is imported by the settings, so it must not touch
+``django.conf.settings``.
+"""
+import hashlib
+import json
+import logging
+import os
+import stat
+import tempfile
+import time
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 300
+
+
+class SecretsManagerProvider:
+    """
+    Fetches a JSON secret from AWS Secrets Manager.
+    """
+
+    def fetch(self, name):
+        # boto3 is slow to import, so it is only loaded when a refresh is needed.
+        import boto3
+
+        client = boto3.client('secretsmanager')
+        response = client.get_secret_value(SecretId=name)
+        return json.loads(response['SecretString'])
+
+
+class FileSecretProvider:
+    """
+    Reads secrets from a local JSON file.
+
+    The file holds either a single secret or an object keyed by secret name.
+
+    :param path: Path of the JSON file.
+    :type path: str
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.getenv('DISCOVERME_SECRET_FILE')
+        if not self.path:
+            raise EnvironmentError('DISCOVERME_SECRET_FILE environment variable not set')
+
+    def fetch(self, name):
+        with open(self.path, encoding='utf-8') as f:
+            data = json.load(f)
+        return data.get(name, data)
+
+
+PROVIDERS = {
+    'aws': SecretsManagerProvider,
+    'file': FileSecretProvider,
+}
+
+
+def default_cache_dir():
+    """
+    Returns the per-user cache directory, ``$XDG_CACHE_HOME/discoverme``
+    (``~/.cache/discoverme`` by default).
+    """
+    base = os.getenv('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'discoverme')
+
+
+def is_private(st):
+    """
+    Returns whether a stat result belongs to the current user and grants no
+    group or other permissions.
+    """
+    if hasattr(os, 'getuid') and st.st_uid != os.getuid():
+        return False
+    return not st.st_mode & 0o077
+
+
+class CachedSecretProvider:
+    """
+    Caches another provider's secrets in a private file on local disk.
+
+    A cached value younger than ``ttl`` seconds is returned without calling
+    the wrapped provider. If a refresh fails, the stale value is used rather
+    than refusing to boot.
+
+    :param provider: Provider that fetches the secret.
+    :type provider: object
+    :param cache_dir: Directory for the cache files, defaults to ``default_cache_dir()``.
+    :type cache_dir: str
+    :param ttl: Seconds before a cached secret is refreshed; 0 disables the cache.
+    :type ttl: int
+    """
+
+    def __init__(self, provider, cache_dir=None, ttl=DEFAULT_TTL):
+        self.provider = provider
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.ttl = ttl
+
+    def cache_path(self, name):
+        digest = hashlib.sha256(name.encode()).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f'discoverme-secret-{digest}.json')
+
+    def private_dir(self, create=False):
+        """
+        Return whether the cache directory exists (creating it with mode 0700
+        if asked) and is private to the current user.
+        """
+        try:
+            if create:
+                os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            st = os.lstat(self.cache_dir)
+        except OSError:
+            return False
+        if stat.S_ISDIR(st.st_mode) and is_private(st):
+            return True
+        logger.warning('Secret cache directory %s is not private to this user; not caching', self.cache_dir)
+        return False
+
+    def read_cache(self, name):
+        """
+        Return ``(value, age_in_seconds)`` from the cache file, or ``(None, None)``.
+
+        Symlinks and files not private to the current user are ignored.
+        """
+        path = self.cache_path(name)
+        try:
+            if not os.path.isdir(self.cache_dir) or not self.private_dir():
+                return None, None
+            fd = os.open(path, os.O_RDONLY | getattr(os, 'O_NOFOLLOW', 0))
+            with os.fdopen(fd, encoding='utf-8') as f:
+                if not is_private(os.fstat(f.fileno())):
+                    logger.warning('Ignoring secret cache file %s: not private to this user', path)
+                    return None, None
+                cached = json.load(f)
+            return cached['value'], time.time() - cached['fetched_at']
+        except (OSError, ValueError, KeyError, TypeError):
+            return None, None
+
+    def write_cache(self, name, value):
+        """
+        Atomically write the cache file, readable by the current user only.
+        """
+        if not self.private_dir(create=True):
+            return
+        path = self.cache_path(name)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix='.discoverme-secret-')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'fetched_at': time.time(), 'value': value}, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            logger.warning('Could not write the secret cache at %s', path)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def fetch(self, name):
+        if self.ttl <= 0:
+            return self.provider.fetch(name)
+
+        value, age = self.read_cache(name)
+        if value is not None and age < self.ttl:
+            return value
+
+        try:
+            value = self.provider.fetch(name)
+        except Exception:
+            if value is None:
+                raise
+            logger.warning('Refreshing secret %s failed; using the cached value', name, exc_info=True)
+            return value
+
+        self.write_cache(name, value)
+        return value
+
+
+def get_provider():
+    """
+    Build the provider selected by the environment, wrapped in the disk cache.
+    """
+    name = os.getenv('DISCOVERME_SECRET_PROVIDER', 'aws')
+    provider_class = PROVIDERS.get(name) or import_string(name)
+    return CachedSecretProvider(
+        provider_class(),
+        cache_dir=os.getenv('DISCOVERME_SECRET_CACHE_DIR'),
+        ttl=int(os.getenv('DISCOVERME_SECRET_TTL', DEFAULT_TTL)),
+    )
+
+
+def get_secret(name=None, provider=None):
+    """
+    Return the application secret as a dictionary.
+
+    :param name: Secret name; defaults to ``DISCOVERME_SECRET_NAME``.
+    :type name: str
+    :param provider: Provider to use instead of the one from the environment.
+    :type provider: object
+    """
+    name = name or os.getenv('DISCOVERME_SECRET_NAME')
+    if not name:
+        raise EnvironmentError('DISCOVERME_SECRET_NAME environment variable not set')
+    return (provider or get_provider()).fetch(name)
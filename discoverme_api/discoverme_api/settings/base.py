@@ -23,6 +23,7 @@ INSTALLED_APPS = [
     'rest_framework',
     'rest_framework_simplejwt',
     'base',
+    'emails',
     'corsheaders',
 ]
 
@@ -58,20 +59,85 @@ TEMPLATES = [
     },
 ]
 
+# Lean API mode: requests under API_PATH_PREFIX skip the session, CSRF,
+# authentication and messages middleware and authenticate with JWT only, so
+# no session is ever looked up for API traffic. The admin keeps the full chain.
+API_LEAN_MODE = os.getenv('API_LEAN_MODE', 'False') == 'True'
+API_PATH_PREFIX = '/api/'
+WEB_ONLY_MIDDLEWARE = [
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+]
+LEAN_MIDDLEWARE = [
+    'django.middleware.security.SecurityMiddleware',
+    'corsheaders.middleware.CorsMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'base.middleware.WebOnlyMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+]
+if API_LEAN_MODE:
+    MIDDLEWARE = LEAN_MIDDLEWARE
+    # The admin's middleware still runs, inside WebOnlyMiddleware.
+    SILENCED_SYSTEM_CHECKS = ['admin.E408', 'admin.E409', 'admin.E410']
+
 # WSGI Application
 WSGI_APPLICATION = 'discoverme_api.wsgi.application'
 
 # Authentication
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
+        'base.authentication.CachedJWTAuthentication',
+    ] if API_LEAN_MODE else [
         'rest_framework.authentication.SessionAuthentication',
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'base.authentication.CachedJWTAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.AllowAny',
     ],
+    'DEFAULT_PAGINATION_CLASS': 'base.pagination.UserCursorPagination',
 }
 
+# Caching
+# Cached responses are keyed on per-user version numbers that every worker
+# must see, so more than one process needs a shared backend, e.g.
+# API_CACHE_URL=redis://localhost:6379/0. The local-memory fallback is per
+# process and only suits a single-process server (dev, tests).
+API_CACHE_URL = os.getenv('API_CACHE_URL')
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': API_CACHE_URL,
+    } if API_CACHE_URL else {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+API_CACHE_ENABLED = os.getenv('API_CACHE_ENABLED', 'True') == 'True'
+API_CACHE_ALIAS = 'default'
+API_CACHE_TIMEOUT = 300  # Seconds a cached list/detail response is kept
+API_AUTH_CACHE_TIMEOUT = 60  # Seconds a JWT user/profile lookup is cached (and the longest a signal-less revocation can lag); 0 disables it
+
+# Pagination
+API_PAGE_SIZE = int(os.getenv('API_PAGE_SIZE', 50))
+API_MAX_PAGE_SIZE = int(os.getenv('API_MAX_PAGE_SIZE', 500))
+API_PAGINATE_BY_DEFAULT = os.getenv('API_PAGINATE_BY_DEFAULT', 'False') == 'True'
+
+# Bulk endpoints
+API_BULK_MAX_ITEMS = 500
+
+# Data export
+EXPORT_CHUNK_SIZE = 2000  # Rows fetched per database round trip while streaming an export
+
+# Data import
+IMPORT_BATCH_SIZE = 1000  # Rows written per bulk_create while importing a file
+IMPORT_MAX_ERRORS = 100  # Row errors listed in an import summary (all are counted)
+
+# Delta sync
+SYNC_CURSOR_OVERLAP = 5  # Seconds re-read before the cursor to catch late commits
+SYNC_TOMBSTONE_RETENTION_DAYS = 90  # Older cursors get a full reset
+SYNC_PAGE_SIZE = 1000  # Objects per page of a full reset
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=60),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
@@ -80,6 +146,24 @@ SIMPLE_JWT = {
     'AUTH_HEADER_TYPES': ('Bearer',),
 }
 
+# Database connections (applied to the PostgreSQL configurations)
+# Connections are kept open between requests for DB_CONN_MAX_AGE seconds and
+# checked before reuse, instead of a new TCP+TLS+auth handshake per request.
+# DB_POOL=True uses psycopg's connection pool instead; Django requires
+# CONN_MAX_AGE=0 in that case.
+DB_POOL = os.getenv('DB_POOL', 'False') == 'True'
+DB_CONNECTION_SETTINGS = {
+    'CONN_MAX_AGE': 0 if DB_POOL else int(os.getenv('DB_CONN_MAX_AGE', 60)),
+    'CONN_HEALTH_CHECKS': os.getenv('DB_CONN_HEALTH_CHECKS', 'True') == 'True',
+    'OPTIONS': {
+        'pool': {
+            'min_size': int(os.getenv('DB_POOL_MIN_SIZE', 2)),
+            'max_size': int(os.getenv('DB_POOL_MAX_SIZE', 10)),
+            'timeout': int(os.getenv('DB_POOL_TIMEOUT', 10)),
+        },
+    } if DB_POOL else {},
+}
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator',
@@ -107,4 +191,13 @@ EMAIL_PORT = 587
 AWS_SES_REGION_NAME = 'us-east-1'  # Replace with your region
 AWS_SES_REGION_ENDPOINT = 'email.us-east-1.amazonaws.com'
 DEFAULT_FROM_EMAIL = 'no-reply@discovermeapp.com'
-EMAIL_USE_TLS = True
\ No newline at end of file
+EMAIL_USE_TLS = True
+
+# Email outbox (drained by `python manage.py send_queued_emails`)
+EMAIL_OUTBOX_BATCH_SIZE = 50
+EMAIL_OUTBOX_MAX_ATTEMPTS = 5
+EMAIL_OUTBOX_RETRY_DELAY = 60  # Seconds before the first retry, doubled on each attempt
+EMAIL_OUTBOX_LEASE = 600  # Seconds a claimed batch is reserved for its worker before another may retry it
+EMAIL_SEND_RATE = float(os.getenv('EMAIL_SEND_RATE', 14))  # SES maximum send rate (messages per second)
+EMAIL_THROTTLE_RETRIES = 3  # Retries of a message SES rejected for exceeding the send rate
+EMAIL_THROTTLE_BACKOFF = 1  # Seconds before the first throttling retry, doubled on each retry
@@ -1,6 +1,5 @@
 from .base import *
-import boto3
-import json
+from discoverme_api.secret_store import get_secret
 
 DEBUG = False
 
@@ -8,14 +7,7 @@ ALLOWED_HOSTS = ['discovermeapp.com','https://discovermeapp.com',
     'https://www.discovermeapp.com', 'www.discovermeapp.com']
 
 # Secrets Manager
-def get_secret():
-    secret_name = os.getenv('DISCOVERME_SECRET_NAME')
-    if not secret_name:
-        raise EnvironmentError('DISCOVERME_SECRET_NAME environment variable not set')
-    client = boto3.client('secretsmanager')
-    response = client.get_secret_value(SecretId=secret_name)
-    return json.loads(response['SecretString'])
-
+# Cached on local disk between worker boots; see discoverme_api/secret_store.py
 secret = get_secret()
 
 # Database: PostgreSQL for production
@@ -27,5 +19,12 @@ DATABASES = {
         'PASSWORD': secret['password'],
         'HOST': secret['host'],
         'PORT': secret['port'],
+        **DB_CONNECTION_SETTINGS,
     }
 }
+
+# Caching
+# Several workers serve production, so the version-keyed response cache is
+# only safe with a shared backend; see API_CACHE_URL in base.py
+if not API_CACHE_URL:
+    API_CACHE_ENABLED = False
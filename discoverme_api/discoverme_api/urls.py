@@ -2,7 +2,7 @@ from django.contrib import admin
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from django.shortcuts import redirect
-from base import views
+from base import views, async_views
 from rest_framework_simplejwt.views import (
     TokenObtainPairView,
     TokenRefreshView,
@@ -31,4 +31,11 @@ urlpatterns = [
     path('api/auth/change-password/', views.change_password, name='change_password'),
     path('api/auth/update-user/', views.update_user_details, name='update_user_details'),
     path('api/auth/check-email/', views.check_email, name='check_email'),
+    path('api/search/', views.search, name='search'),
+    path('api/sync/', views.sync, name='sync'),
+    path('api/export/', views.export, name='export'),
+    path('api/import/', views.import_data, name='import_data'),
+    path('api/async/moodlogs/', async_views.moodlogs, name='async_moodlogs'),
+    path('api/async/journalentries/', async_views.journal_entries, name='async_journalentries'),
+    path('api/async/goals/', async_views.goals, name='async_goals'),
 ]
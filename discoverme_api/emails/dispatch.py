@@ -0,0 +1,143 @@
+from time import monotonic, sleep
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+
+
+class RateLimiter:
+    """
+    Spaces out sends so they stay under a messages-per-second quota.
+
+    :param rate: Maximum messages per second; 0 disables throttling.
+    :type rate: float
+    """
+
+    # Never slow down below one message a minute after repeated throttling.
+    MIN_RATE = 1 / 60
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.next_at = None
+
+    def wait(self):
+        """
+        Blocks until the next message may be sent.
+        """
+        if self.rate <= 0:
+            return
+        now = monotonic()
+        if self.next_at is not None and self.next_at > now:
+            sleep(self.next_at - now)
+            now = self.next_at
+        self.next_at = now + 1 / self.rate
+
+    def slow_down(self):
+        """
+        Halves the rate after the provider reported throttling.
+        """
+        if self.rate > 0:
+            self.rate = max(self.rate / 2, self.MIN_RATE)
+
+
+def is_throttling_error(error):
+    """
+    Returns whether an exception is SES rejecting a send for exceeding the quota.
+
+    SES reports this as a ``Throttling`` client error with the message
+    "Maximum sending rate exceeded".
+    """
+    response = getattr(error, 'response', None)
+    code = response.get('Error', {}).get('Code') if isinstance(response, dict) else None
+    return code == 'Throttling' or 'Maximum sending rate exceeded' in str(error)
+
+
+def build_message(subject, message, recipient_list, html_message=None, from_email=None):
+    """
+    Builds an email from the same arguments ``queue_email`` takes.
+
+    :return: The message, with an HTML alternative when ``html_message`` is given.
+    :rtype: EmailMultiAlternatives
+    """
+    msg = EmailMultiAlternatives(
+        subject=subject,
+        body=message,
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        to=list(recipient_list),
+    )
+    if html_message:
+        msg.attach_alternative(html_message, 'text/html')
+    return msg
+
+
+def send_messages(messages, connection=None, rate=None, max_retries=None):
+    """
+    Sends many messages over one backend connection, throttled to the SES quota.
+
+    Messages are sent no faster than ``rate`` per second. A message rejected
+    for throttling is retried with an exponential backoff, and the rate is
+    halved for the rest of the batch. Other errors are returned, not raised,
+    so one bad address does not stop the batch; if the connection cannot be
+    opened, its error is returned for every message.
+
+    :param messages: Iterable of ``EmailMessage`` objects; consumed lazily.
+    :param connection: Open backend connection to reuse, defaults to a new one.
+    :param rate: Messages per second, defaults to ``EMAIL_SEND_RATE``.
+    :param max_retries: Retries after throttling, defaults to ``EMAIL_THROTTLE_RETRIES``.
+    :return: One entry per message: ``None`` when sent, otherwise the exception.
+    :rtype: list
+    """
+    limiter = RateLimiter(settings.EMAIL_SEND_RATE if rate is None else rate)
+    max_retries = settings.EMAIL_THROTTLE_RETRIES if max_retries is None else max_retries
+    owns_connection = connection is None
+    if owns_connection:
+        try:
+            connection = get_connection()
+            connection.open()
+        except Exception as e:
+            return [e for msg in messages]
+
+    results = []
+    try:
+        for msg in messages:
+            msg.connection = connection
+            results.append(_send(msg, limiter, max_retries))
+    finally:
+        if owns_connection:
+            try:
+                connection.close()
+            except Exception:
+                # The messages were already handed over; a failed close must
+                # not turn them into errors and get them sent twice.
+                pass
+    return results
+
+
+def _send(msg, limiter, max_retries):
+    """
+    Sends one message, retrying while the provider reports throttling.
+    """
+    for attempt in range(max_retries + 1):
+        limiter.wait()
+        try:
+            msg.send()
+            return None
+        except Exception as e:
+            if not is_throttling_error(e) or attempt == max_retries:
+                return e
+            limiter.slow_down()
+            sleep(settings.EMAIL_THROTTLE_BACKOFF * 2 ** attempt)
+
+
+def send_emails(emails, **kwargs):
+    """
+    Renders and sends many emails over one connection, bypassing the outbox.
+
+    Intended for bulk sends from a worker, e.g.
+    ``send_emails(congrats_email(user, title) for user, title in completions)``;
+    each email is only rendered right before it is sent.
+
+    :param emails: Iterable of ``queue_email`` keyword-argument dictionaries,
+        as returned by the builders in ``emails.messages``.
+    :return: One entry per email: ``None`` when sent, otherwise the exception.
+    :rtype: list
+    """
+    return send_messages((build_message(**email) for email in emails), **kwargs)
@@ -0,0 +1,36 @@
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from emails.outbox import send_pending
+
+class Command(BaseCommand):
+    """
+    Django management command that delivers the emails waiting in the outbox.
+    Runs a single pass by default, or keeps polling with ``--loop``.
+    """
+    help = 'Send queued outbound emails in batches, retrying failures.'
+
+    def add_arguments(self, parser):
+        """
+        Add command-line arguments for batching and polling.
+        """
+        parser.add_argument('--batch-size', type=int, default=settings.EMAIL_OUTBOX_BATCH_SIZE, help='Number of emails to send per batch')
+        parser.add_argument('--max-attempts', type=int, default=settings.EMAIL_OUTBOX_MAX_ATTEMPTS, help='Delivery attempts before an email is marked as failed')
+        parser.add_argument('--loop', action='store_true', help='Keep polling the outbox instead of exiting when it is empty')
+        parser.add_argument('--interval', type=float, default=5.0, help='Seconds to wait between polls when the outbox is empty')
+
+    def handle(self, *args, **kwargs):
+        """
+        Drain the outbox batch by batch.
+        """
+        batch_size = kwargs['batch_size']
+        max_attempts = kwargs['max_attempts']
+
+        while True:
+            sent, failed = send_pending(batch_size=batch_size, max_attempts=max_attempts)
+            if sent or failed:
+                self.stdout.write(f'Sent {sent} email(s), {failed} failed.')
+            if sent + failed < batch_size:
+                if not kwargs['loop']:
+                    break
+                time.sleep(kwargs['interval'])
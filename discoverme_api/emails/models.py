@@ -0,0 +1,64 @@
+from django.db import models
+from django.utils.timezone import now
+
+
+class OutboundEmail(models.Model):
+    """
+    An email waiting in the outbox to be delivered by the ``send_queued_emails`` worker.
+
+    :param subject: Subject line of the email.
+    :type subject: str
+    :param message: Plain-text body of the email.
+    :type message: str
+    :param html_message: Optional HTML body of the email.
+    :type html_message: str
+    :param from_email: Sender address.
+    :type from_email: str
+    :param recipient_list: List of recipient addresses.
+    :type recipient_list: list
+    :param status: Delivery status (pending, sending, sent or failed).
+        ``SENDING`` emails are claimed by a worker until ``send_after``.
+    :type status: str
+    :param attempts: Number of delivery attempts made so far.
+    :type attempts: int
+    :param last_error: Error raised by the last failed attempt.
+    :type last_error: str
+    :param send_after: Earliest time the next delivery attempt may run, or
+        the end of the lease of a ``SENDING`` email.
+    :type send_after: datetime
+    :param created_at: The timestamp when the email was queued.
+    :type created_at: datetime
+    :param sent_at: The timestamp when the email was delivered.
+    :type sent_at: datetime
+    """
+    PENDING = 'PENDING'
+    SENDING = 'SENDING'
+    SENT = 'SENT'
+    FAILED = 'FAILED'
+
+    STATUS_CHOICES = [
+        (PENDING, 'Pending'),
+        (SENDING, 'Sending'),
+        (SENT, 'Sent'),
+        (FAILED, 'Failed'),
+    ]
+
+    subject = models.CharField(max_length=255)
+    message = models.TextField()
+    html_message = models.TextField(blank=True, null=True)
+    from_email = models.CharField(max_length=255)
+    recipient_list = models.JSONField(default=list)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True, null=True)
+    send_after = models.DateTimeField(default=now)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'send_after']),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} to {', '.join(self.recipient_list)} ({self.status})"
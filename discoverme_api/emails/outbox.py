@@ -0,0 +1,128 @@
+from datetime import timedelta
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils.timezone import now
+from .dispatch import build_message, send_messages
+from .models import OutboundEmail
+
+
+def queue_email(subject, message, recipient_list, html_message=None, from_email=None):
+    """
+    Stores an email in the outbox instead of sending it during the request.
+
+    The row is written in the caller's transaction, so an email is only
+    delivered if the change that triggered it is committed.
+
+    :param subject: Subject line of the email.
+    :param message: Plain-text body of the email.
+    :param recipient_list: List of recipient addresses.
+    :param html_message: Optional HTML body of the email.
+    :param from_email: Sender address, defaults to ``DEFAULT_FROM_EMAIL``.
+    :return: The queued email.
+    :rtype: OutboundEmail
+    """
+    return OutboundEmail.objects.create(
+        subject=subject,
+        message=message,
+        html_message=html_message,
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        recipient_list=list(recipient_list),
+    )
+
+
+def claim_batch(batch_size):
+    """
+    Claims up to ``batch_size`` emails that are due for delivery.
+
+    Due emails are pending ones whose ``send_after`` has passed and ones
+    whose ``SENDING`` lease expired because a worker died mid-batch. They
+    are marked ``SENDING`` with a lease of ``EMAIL_OUTBOX_LEASE`` seconds
+    (kept in ``send_after``) and the attempt is counted before anything is
+    sent, in a transaction of its own, so no rows stay locked during
+    delivery. On databases that support it the rows are selected with
+    ``SKIP LOCKED`` so several workers can claim batches side by side.
+
+    :return: The claimed emails.
+    :rtype: list
+    """
+    claimed_at = now()
+    with transaction.atomic():
+        queryset = OutboundEmail.objects.filter(
+            status__in=[OutboundEmail.PENDING, OutboundEmail.SENDING],
+            send_after__lte=claimed_at,
+        ).order_by('send_after', 'id')
+        if connection.features.has_select_for_update_skip_locked:
+            queryset = queryset.select_for_update(skip_locked=True)
+
+        emails = list(queryset[:batch_size])
+        for email in emails:
+            email.status = OutboundEmail.SENDING
+            email.attempts += 1
+            email.send_after = claimed_at + timedelta(seconds=settings.EMAIL_OUTBOX_LEASE)
+        OutboundEmail.objects.bulk_update(emails, ['status', 'attempts', 'send_after'])
+    return emails
+
+
+def send_pending(batch_size=None, max_attempts=None):
+    """
+    Delivers one batch of due emails over a single, throttled backend connection.
+
+    The batch is claimed and committed first, sent outside any transaction
+    (SES round trips and throttling back-off can take seconds), and the
+    results are recorded in a second short transaction. Failed emails are
+    retried with an exponential backoff until they reach ``max_attempts``,
+    after which they are marked as failed. Emails reclaimed from a dead
+    worker after their last attempt are marked as failed without sending.
+
+    :param batch_size: Maximum number of emails to send, defaults to ``EMAIL_OUTBOX_BATCH_SIZE``.
+    :param max_attempts: Attempts before giving up, defaults to ``EMAIL_OUTBOX_MAX_ATTEMPTS``.
+    :return: A ``(sent, failed)`` tuple with the number of emails in each state.
+    :rtype: tuple
+    """
+    batch_size = batch_size or settings.EMAIL_OUTBOX_BATCH_SIZE
+    max_attempts = max_attempts or settings.EMAIL_OUTBOX_MAX_ATTEMPTS
+    sent = failed = 0
+
+    emails = claim_batch(batch_size)
+    if not emails:
+        return sent, failed
+
+    deliverable = [email for email in emails if email.attempts <= max_attempts]
+    messages = (
+        build_message(
+            subject=email.subject,
+            message=email.message,
+            recipient_list=email.recipient_list,
+            html_message=email.html_message,
+            from_email=email.from_email,
+        )
+        for email in deliverable
+    )
+    results = dict(zip((email.pk for email in deliverable), send_messages(messages)))
+
+    for email in emails:
+        if email.pk not in results:
+            email.status = OutboundEmail.FAILED
+            email.last_error = email.last_error or 'Delivery was interrupted on the last attempt.'
+            failed += 1
+        elif results[email.pk] is not None:
+            email.last_error = str(results[email.pk])
+            if email.attempts >= max_attempts:
+                email.status = OutboundEmail.FAILED
+            else:
+                email.status = OutboundEmail.PENDING
+                delay = settings.EMAIL_OUTBOX_RETRY_DELAY * 2 ** (email.attempts - 1)
+                email.send_after = now() + timedelta(seconds=delay)
+            failed += 1
+        else:
+            email.status = OutboundEmail.SENT
+            email.sent_at = now()
+            email.last_error = None
+            sent += 1
+
+    with transaction.atomic():
+        OutboundEmail.objects.bulk_update(
+            emails, ['status', 'last_error', 'send_after', 'sent_at']
+        )
+
+    return sent, failed
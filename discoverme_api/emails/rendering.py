@@ -0,0 +1,41 @@
+import os
+from functools import lru_cache
+from django.template import Context, Engine
+
+TEMPLATE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+@lru_cache(maxsize=None)
+def get_engine():
+    """
+    Returns the template engine for email bodies.
+
+    Templates are read from the emails app directory and compiled once per
+    process by the cached loader. Autoescaping is on, so user-supplied
+    values such as names and task titles cannot inject HTML.
+    """
+    return Engine(
+        dirs=[TEMPLATE_DIR],
+        loaders=[('django.template.loaders.cached.Loader', ['django.template.loaders.filesystem.Loader'])],
+        autoescape=True,
+    )
+
+def render_email(template_name, context):
+    """
+    Renders a single email template.
+
+    :param template_name: File name of the template, e.g. ``welcome.html``.
+    :param context: Dictionary of template variables.
+    """
+    return get_engine().get_template(template_name).render(Context(context))
+
+def render_emails(template_name, contexts):
+    """
+    Renders one template for many recipients, looking the template up once.
+
+    :param template_name: File name of the template.
+    :param contexts: Iterable of dictionaries of template variables.
+    :return: Generator of rendered strings, in the order of ``contexts``.
+    """
+    template = get_engine().get_template(template_name)
+    for context in contexts:
+        yield template.render(Context(context))
@@ -0,0 +1,45 @@
+from django.core.mail.backends.base import BaseEmailBackend
+
+
+class ThrottlingError(Exception):
+    """
+    Mimics the client error SES raises when the send rate is exceeded.
+    """
+
+    def __init__(self):
+        super().__init__('Maximum sending rate exceeded.')
+        self.response = {'Error': {'Code': 'Throttling', 'Message': 'Maximum sending rate exceeded.'}}
+
+
+class RecordingBackend(BaseEmailBackend):
+    """
+    Stand-in for the SES backend that records sends instead of delivering them.
+
+    Set ``throttled`` to the number of upcoming send calls that should be
+    rejected with a throttling error. Call ``reset()`` before each test.
+    """
+    sent = []
+    opened = 0
+    attempts = 0
+    throttled = 0
+
+    @classmethod
+    def reset(cls):
+        cls.sent = []
+        cls.opened = 0
+        cls.attempts = 0
+        cls.throttled = 0
+
+    def open(self):
+        type(self).opened += 1
+        return True
+
+    def send_messages(self, email_messages):
+        cls = type(self)
+        for message in email_messages:
+            cls.attempts += 1
+            if cls.throttled:
+                cls.throttled -= 1
+                raise ThrottlingError()
+            cls.sent.append(message)
+        return len(email_messages)
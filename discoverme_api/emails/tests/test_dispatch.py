@@ -0,0 +1,111 @@
+from unittest import mock
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from ..dispatch import RateLimiter, build_message, is_throttling_error, send_emails, send_messages
+from ..messages import congrats_email
+from ..models import OutboundEmail
+from ..outbox import queue_email, send_pending
+from .backends import RecordingBackend, ThrottlingError
+
+@override_settings(
+    EMAIL_BACKEND='emails.tests.backends.RecordingBackend',
+    EMAIL_SEND_RATE=0,
+    EMAIL_THROTTLE_BACKOFF=1,
+)
+class DispatchTests(TestCase):
+
+    def setUp(self):
+        RecordingBackend.reset()
+        sleep_patcher = mock.patch('emails.dispatch.sleep')
+        self.sleep = sleep_patcher.start()
+        self.addCleanup(sleep_patcher.stop)
+
+    def test_batch_uses_one_connection(self):
+        """
+        Test that a batch of rendered emails is sent over a single backend connection.
+        """
+        users = [User(username=f'user{i}', first_name=f'Name{i}', email=f'user{i}@example.com') for i in range(5)]
+
+        results = send_emails(congrats_email(user, 'Read a book') for user in users)
+
+        self.assertEqual(results, [None] * 5)
+        self.assertEqual(RecordingBackend.opened, 1)
+        self.assertEqual([m.to for m in RecordingBackend.sent], [[user.email] for user in users])
+        self.assertIn('Congratulations, Name0!', RecordingBackend.sent[0].alternatives[0][0])
+
+    def test_throttled_message_is_retried_with_backoff(self):
+        """
+        Test that a throttling rejection is retried with an exponential backoff.
+        """
+        RecordingBackend.throttled = 2
+
+        results = send_messages([build_message('Subject', 'Body', ['a@example.com'])], rate=10)
+
+        self.assertEqual(results, [None])
+        self.assertEqual(RecordingBackend.attempts, 3)
+        self.assertEqual(len(RecordingBackend.sent), 1)
+        backoffs = [c.args[0] for c in self.sleep.call_args_list if c.args[0] >= 1]
+        self.assertEqual(backoffs, [1, 2])
+
+    def test_throttling_gives_up_after_max_retries(self):
+        """
+        Test that a message still throttled after the retries is reported, and the batch continues.
+        """
+        RecordingBackend.throttled = 3
+        messages = [build_message('Subject', 'Body', [f'{i}@example.com']) for i in range(2)]
+
+        results = send_messages(messages, max_retries=2)
+
+        self.assertIsInstance(results[0], ThrottlingError)
+        self.assertIsNone(results[1])
+        self.assertEqual([m.to for m in RecordingBackend.sent], [['1@example.com']])
+
+    def test_outbox_retries_throttled_emails_later(self):
+        """
+        Test that the outbox worker reschedules an email SES kept throttling.
+        """
+        queue_email('Subject', 'Body', ['a@example.com'])
+        queue_email('Subject', 'Body', ['b@example.com'])
+        RecordingBackend.throttled = 10
+
+        with self.settings(EMAIL_THROTTLE_RETRIES=1):
+            self.assertEqual(send_pending(), (0, 2))
+
+        self.assertEqual(RecordingBackend.opened, 1)
+        self.assertFalse(OutboundEmail.objects.exclude(status=OutboundEmail.PENDING).exists())
+        self.assertEqual(OutboundEmail.objects.filter(last_error='Maximum sending rate exceeded.').count(), 2)
+
+    def test_rate_limiter_spaces_sends(self):
+        """
+        Test that the rate limiter waits between sends and halves its rate after throttling.
+        """
+        limiter = RateLimiter(rate=4)
+        with mock.patch('emails.dispatch.monotonic', return_value=100.0):
+            limiter.wait()
+            limiter.wait()
+        self.sleep.assert_called_once_with(0.25)
+
+        limiter.slow_down()
+        self.assertEqual(limiter.rate, 2)
+
+    def test_is_throttling_error(self):
+        """
+        Test that only throttling rejections are treated as retryable.
+        """
+        self.assertTrue(is_throttling_error(ThrottlingError()))
+        self.assertFalse(is_throttling_error(Exception('Email address is not verified.')))
+
+        error = Exception('Service unavailable')
+        error.response = mock.Mock(status_code=503)
+        self.assertFalse(is_throttling_error(error))
+
+    def test_connection_failure_is_reported_for_every_message(self):
+        """
+        Test that a connection that cannot be opened fails each message instead of raising.
+        """
+        messages = [build_message('Subject', 'Body', [f'{i}@example.com']) for i in range(2)]
+
+        with mock.patch.object(RecordingBackend, 'open', side_effect=ConnectionError('SES unreachable')):
+            results = send_messages(messages)
+
+        self.assertEqual([str(error) for error in results], ['SES unreachable'] * 2)
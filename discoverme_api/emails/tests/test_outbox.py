@@ -0,0 +1,105 @@
+from unittest import mock
+from django.core import mail
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.contrib.auth.models import User
+from ..models import OutboundEmail
+from ..outbox import queue_email, send_pending
+
+@override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend')
+class OutboxTests(TestCase):
+
+    def test_registration_queues_welcome_email(self):
+        """
+        Test that creating a user queues the welcome email instead of sending it.
+        """
+        User.objects.create_user(username='outboxuser', email='outbox@example.com', password='testpassword')
+        self.assertEqual(len(mail.outbox), 0)
+        queued = OutboundEmail.objects.get()
+        self.assertEqual(queued.status, OutboundEmail.PENDING)
+        self.assertEqual(queued.recipient_list, ['outbox@example.com'])
+
+    def test_worker_sends_pending_emails(self):
+        """
+        Test that the worker command delivers queued emails with their HTML part.
+        """
+        for i in range(3):
+            queue_email(f'Subject {i}', 'Plain body', [f'user{i}@example.com'], html_message='<p>Hi</p>')
+
+        call_command('send_queued_emails', batch_size=2, stdout=mock.MagicMock())
+
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(mail.outbox[0].alternatives[0][1], 'text/html')
+        self.assertFalse(OutboundEmail.objects.exclude(status=OutboundEmail.SENT).exists())
+
+    def test_failed_email_is_retried_then_marked_failed(self):
+        """
+        Test that a failing send is rescheduled and eventually marked as failed.
+        """
+        email = queue_email('Subject', 'Plain body', ['retry@example.com'])
+
+        with mock.patch('django.core.mail.EmailMultiAlternatives.send', side_effect=Exception('SES throttled')):
+            self.assertEqual(send_pending(max_attempts=2), (0, 1))
+            email.refresh_from_db()
+            self.assertEqual(email.status, OutboundEmail.PENDING)
+            self.assertEqual(email.last_error, 'SES throttled')
+
+            # Not due yet, so nothing is picked up.
+            self.assertEqual(send_pending(max_attempts=2), (0, 0))
+
+            OutboundEmail.objects.update(send_after=email.created_at)
+            self.assertEqual(send_pending(max_attempts=2), (0, 1))
+
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutboundEmail.FAILED)
+        self.assertEqual(email.attempts, 2)
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_emails_are_sent_outside_the_claim_transaction(self):
+        """
+        Test that the batch is claimed and committed before sending, so no transaction is open during delivery.
+        """
+        queue_email('Subject', 'Plain body', ['claim@example.com'])
+        depth = len(connection.atomic_blocks)
+        seen = []
+
+        def send(*args, **kwargs):
+            seen.append((len(connection.atomic_blocks), OutboundEmail.objects.get().status))
+            return 1
+
+        with mock.patch('django.core.mail.EmailMultiAlternatives.send', side_effect=send):
+            self.assertEqual(send_pending(), (1, 0))
+
+        self.assertEqual(seen, [(depth, OutboundEmail.SENDING)])
+        self.assertEqual(OutboundEmail.objects.get().status, OutboundEmail.SENT)
+
+    def test_expired_lease_is_reclaimed(self):
+        """
+        Test that emails left SENDING by a dead worker are retried once their lease expires,
+        and failed without sending when that was their last attempt.
+        """
+        retried = queue_email('Retried', 'Plain body', ['retried@example.com'])
+        exhausted = queue_email('Exhausted', 'Plain body', ['exhausted@example.com'])
+        OutboundEmail.objects.filter(pk=retried.pk).update(status=OutboundEmail.SENDING, attempts=1)
+        OutboundEmail.objects.filter(pk=exhausted.pk).update(status=OutboundEmail.SENDING, attempts=2)
+
+        self.assertEqual(send_pending(max_attempts=2), (1, 1))
+
+        self.assertEqual([m.subject for m in mail.outbox], ['Retried'])
+        exhausted.refresh_from_db()
+        self.assertEqual(exhausted.status, OutboundEmail.FAILED)
+        self.assertEqual(exhausted.attempts, 3)
+
+    def test_connection_failures_use_up_attempts(self):
+        """
+        Test that failing to open the backend connection counts as a failed attempt.
+        """
+        email = queue_email('Subject', 'Plain body', ['down@example.com'])
+
+        with mock.patch('django.core.mail.backends.locmem.EmailBackend.open', side_effect=ConnectionError('SES unreachable')):
+            self.assertEqual(send_pending(max_attempts=1), (0, 1))
+
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutboundEmail.FAILED)
+        self.assertEqual(email.last_error, 'SES unreachable')
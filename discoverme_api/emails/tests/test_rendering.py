@@ -0,0 +1,77 @@
+from unittest import mock
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.template import TemplateDoesNotExist
+from ..messages import congrats_email, password_change_email, send_congrats_email, welcome_email
+from ..models import OutboundEmail
+from ..rendering import get_engine, render_email, render_emails
+
+class EmailRenderingTests(TestCase):
+
+    def test_values_are_escaped(self):
+        """
+        Test that user-supplied values are HTML-escaped in the rendered email.
+        """
+        user = User(username='renderuser', first_name='<b>Ann</b>', email='render@example.com')
+        html = congrats_email(user, 'Run 5k & <script>alert(1)</script>')['html_message']
+
+        self.assertIn('Congratulations, &lt;b&gt;Ann&lt;/b&gt;!', html)
+        self.assertIn('Run 5k &amp; &lt;script&gt;', html)
+        self.assertNotIn('<script>', html)
+
+    def test_templates_are_loaded_once(self):
+        """
+        Test that repeated renders reuse the compiled template instead of reading the file.
+        """
+        render_email('congrats.html', {'first_name': 'Ann', 'subject': 'warm up'})
+        with mock.patch('django.template.loaders.filesystem.Loader.get_contents') as get_contents:
+            for _ in range(3):
+                render_email('congrats.html', {'first_name': 'Ann', 'subject': 'again'})
+        get_contents.assert_not_called()
+        self.assertIs(get_engine(), get_engine())
+
+    def test_batch_render(self):
+        """
+        Test that a batch render returns one body per context, in order.
+        """
+        contexts = [{'first_name': f'user{i}', 'subject': f'goal {i}'} for i in range(3)]
+        bodies = list(render_emails('congrats.html', contexts))
+
+        self.assertEqual(len(bodies), 3)
+        for i, body in enumerate(bodies):
+            self.assertIn(f'Congratulations, user{i}!', body)
+            self.assertIn(f'<strong>goal {i}</strong>', body)
+
+    def test_send_queues_rendered_email(self):
+        """
+        Test that sending a congrats email queues the rendered HTML.
+        """
+        user = User.objects.create_user(username='renderuser', first_name='Ann', email='render@example.com')
+        OutboundEmail.objects.all().delete()
+
+        send_congrats_email(user, 'Read a book')
+
+        queued = OutboundEmail.objects.get()
+        self.assertIn('Congratulations, Ann!', queued.html_message)
+        self.assertIn('<strong>Read a book</strong>', queued.html_message)
+
+    def test_every_email_template_renders(self):
+        """
+        Test that each email's template exists and renders.
+        """
+        user = User(username='renderuser', first_name='Ann', email='render@example.com')
+        for email in [welcome_email(user), congrats_email(user, 'Read a book'), password_change_email(user)]:
+            self.assertIn('<', email['html_message'])
+
+    def test_missing_template_is_not_swallowed(self):
+        """
+        Test that a missing template is raised to the caller instead of silently dropping the email.
+        """
+        user = User.objects.create_user(username='renderuser', first_name='Ann', email='render@example.com')
+        OutboundEmail.objects.all().delete()
+
+        with mock.patch('emails.messages.render_email', side_effect=TemplateDoesNotExist('congrats.html')):
+            with self.assertRaises(TemplateDoesNotExist):
+                send_congrats_email(user, 'Read a book')
+
+        self.assertFalse(OutboundEmail.objects.exists())